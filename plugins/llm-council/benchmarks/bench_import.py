@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Council Import-Time Benchmark
+
+Times the paths that should never pay for asyncio, the engine, httpx, dotenv,
+NumPy or CLI discovery: `--help` and argument errors of every council
+command. A bare `import council_engine` (which needs asyncio) and a cold
+httpx import are timed for reference. Each case runs in a fresh interpreter;
+the report shows the median wall time and the overhead over an empty
+interpreter.
+
+Exits non-zero if any command case imports one of those modules (checked
+with -X importtime) or its median overhead exceeds --budget-ms, or if
+importing council_engine pulls in httpx, dotenv or NumPy. asyncio alone adds
+roughly 45-65ms, so the default budget fails on an eager import of it.
+
+    uv run python benchmarks/bench_import.py [--runs 15] [--budget-ms 75]
+"""
+
+import argparse
+import compileall
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# Name -> argv after the interpreter
+CASES = {
+    "ask --help": [str(SCRIPTS_DIR / "council_ask.py"), "--help"],
+    "debate --help": [str(SCRIPTS_DIR / "council_debate.py"), "--help"],
+    "decide --help": [str(SCRIPTS_DIR / "council_decide.py"), "--help"],
+    "brainstorm --help": [str(SCRIPTS_DIR / "council_brainstorm.py"), "--help"],
+    "decide (missing --options)": [str(SCRIPTS_DIR / "council_decide.py"), "x"],
+    "ask (no question)": [str(SCRIPTS_DIR / "council_ask.py"), "--no-daemon"],
+    "brainstorm (bad --style)": [str(SCRIPTS_DIR / "council_brainstorm.py"), "x", "--style", "nope"],
+}
+
+# Reference only: what the engine (with asyncio) and a cold httpx import would add to every command
+REFERENCE = {
+    "import council_engine": ["-c", f"import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); import council_engine"],
+    "import httpx (reference)": ["-c", "import httpx"],
+}
+
+# Modules no CASES command may import before it has valid arguments
+DEFERRED = ("asyncio", "council_engine", "httpx", "dotenv", "h2", "numpy")
+
+LAZY_CHECK = (
+    f"import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); import council_engine; "
+    "eager = [m for m in ('httpx', 'dotenv', 'h2', 'numpy') if m in sys.modules]; "
+    "print(','.join(eager))"
+)
+
+
+def eager_imports(argv: list[str]) -> list[str]:
+    """DEFERRED modules a run of `argv` imports, from its -X importtime report."""
+    report = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    ).stderr
+    imported = {line.rsplit("|", 1)[-1].strip() for line in report.splitlines() if line.startswith("import time:")}
+    return [name for name in DEFERRED if name in imported]
+
+
+def time_run(argv: list[str], runs: int) -> list[float]:
+    """Wall-clock milliseconds for `runs` fresh interpreter launches."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *argv],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark council command startup time")
+    parser.add_argument("--runs", type=int, default=15, help="Launches per case (default: 15)")
+    parser.add_argument("--budget-ms", type=float, default=75,
+                        help="Max median overhead of a command case over an empty interpreter (default: 75)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Measure warm starts, not bytecode compilation
+    compileall.compile_dir(str(SCRIPTS_DIR), quiet=1)
+
+    eager = subprocess.run(
+        [sys.executable, "-c", LAZY_CHECK], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    baseline = statistics.median(time_run(["-c", "pass"], args.runs))
+    print(f"Empty interpreter: {baseline:.1f}ms (median of {args.runs})\n")
+    print(f"{'Case':<30} {'median':>9} {'min':>9} {'overhead':>9}")
+    print("-" * 60)
+
+    over_budget = []
+    deferred = {name: found for name, argv in CASES.items() if (found := eager_imports(argv))}
+    for name, argv in {**CASES, **REFERENCE}.items():
+        samples = time_run(argv, args.runs)
+        median = statistics.median(samples)
+        overhead = median - baseline
+        print(f"{name:<30} {median:>7.1f}ms {min(samples):>7.1f}ms {overhead:>7.1f}ms")
+        if name in CASES and overhead > args.budget_ms:
+            over_budget.append(name)
+
+    print()
+    failed = False
+    if eager:
+        print(f"FAIL: importing council_engine eagerly loads {eager}")
+        failed = True
+    for name, found in deferred.items():
+        print(f"FAIL: {name} imports {', '.join(found)}")
+        failed = True
+    if over_budget:
+        print(f"FAIL: over the {args.budget_ms:.0f}ms budget: {', '.join(over_budget)}")
+        failed = True
+    if not failed:
+        print(
+            f"OK: every command case within {args.budget_ms:.0f}ms of interpreter startup "
+            f"without {', '.join(DEFERRED)}; council_engine imports no httpx/dotenv/numpy"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
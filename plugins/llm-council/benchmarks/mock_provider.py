@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Council Mock Provider
+
+Deterministic local stand-in for the provider APIs the engine calls
+(CouncilEngine._call_* and _stream_api). One threaded HTTP server serves
+every provider under a path prefix, so a benchmark council points its
+models.json endpoints at:
+
+- {url}/openai/v1/chat/completions             OpenAI chat completions
+- {url}/deepseek/chat/completions              DeepSeek (OpenAI shape, json_object)
+- {url}/openai_compatible/v1/chat/completions  Self-hosted OpenAI-compatible
+- {url}/google/v1beta/models/<m>:generateContent   Gemini (and streamGenerateContent)
+- {url}/anthropic/v1/messages                  Anthropic messages
+
+Non-streaming and SSE responses are supported, and structured-output requests
+(json_schema, json_object with the schema in the prompt, Gemini
+responseSchema, Anthropic forced tool use) get schema-valid JSON.
+
+Each provider has a profile: a latency distribution (fixed, uniform or
+lognormal), a failure rate and status, and an answer length. Latency, failures
+and answer text are drawn from a RNG seeded by (seed, provider, request body,
+attempt), so identical runs see identical timings regardless of thread order,
+and a retried request gets a fresh draw. Per provider the server also counts the
+peak number of requests in flight and the requests that carried an
+Authorization header (keyless local servers should see none).
+
+    python benchmarks/mock_provider.py [--port 8765] [--profile profile.json]
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+PROVIDERS = ("openai", "deepseek", "openai_compatible", "google", "anthropic")
+
+DEFAULT_PROFILE = {
+    "latency": {"distribution": "lognormal", "median_ms": 400, "sigma": 0.4},
+    "ttfb_fraction": 0.3,  # Share of the latency before the first byte of a stream
+    "failure_rate": 0.0,
+    "failure_status": 503,
+    "answer_words": 150,
+}
+
+_SCHEMA_IN_PROMPT = re.compile(r"matches this JSON Schema:\n(\{.*\})\s*$", re.S)
+
+_WORDS = (
+    "council model answer latency cache review score consensus stage response "
+    "prompt token stream provider request budget synthesis option criterion "
+    "tradeoff evidence risk benefit cost design choice result analysis insight"
+).split()
+
+
+def endpoint(url: str, provider: str, model: str = "mock") -> str:
+    """models.json `endpoint` for `provider` on a mock server at `url`."""
+    if provider == "google":
+        return f"{url}/google/v1beta/models/{model}:generateContent"
+    if provider == "anthropic":
+        return f"{url}/anthropic/v1/messages"
+    if provider == "deepseek":
+        return f"{url}/deepseek/chat/completions"
+    return f"{url}/{provider}/v1/chat/completions"
+
+
+def sample_latency(spec: dict, rng: random.Random) -> float:
+    """Seconds drawn from a latency spec: fixed (ms), uniform (min_ms, max_ms) or lognormal (median_ms, sigma)."""
+    distribution = spec.get("distribution", "fixed")
+    if distribution == "fixed":
+        ms = spec.get("ms", 0)
+    elif distribution == "uniform":
+        ms = rng.uniform(spec.get("min_ms", 0), spec.get("max_ms", 0))
+    elif distribution == "lognormal":
+        ms = rng.lognormvariate(0, spec.get("sigma", 0.5)) * spec.get("median_ms", 0)
+    else:
+        raise ValueError(f"Unknown latency distribution: {distribution}")
+    return max(0.0, ms) / 1000
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(max(1, words))).capitalize() + "."
+
+
+def instance(schema: dict, rng: random.Random, index: Optional[int] = None) -> Any:
+    """
+    A value matching `schema` (JSON Schema or Gemini's upper-case types).
+
+    Arrays get minItems items; `index` spreads enum values across the items of
+    an array (each evaluation reviews a different response id), and arrays of
+    enum strings become a permutation of the enum (rankings).
+    """
+    kind = str(schema.get("type", "string")).lower()
+    if "enum" in schema:
+        values = schema["enum"]
+        return values[index % len(values)] if index is not None else rng.choice(values)
+    if kind == "object":
+        return {
+            name: instance(sub, rng, index)
+            for name, sub in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        items = schema.get("items", {})
+        if "enum" in items:
+            values = list(items["enum"])
+            rng.shuffle(values)
+            return values[:max(schema.get("minItems", len(values)), 1)]
+        count = schema.get("minItems", 2) or 2
+        return [instance(items, rng, i) for i in range(count)]
+    if kind == "integer":
+        return rng.randint(int(schema.get("minimum", 1)), int(schema.get("maximum", 10)))
+    if kind == "number":
+        return round(rng.uniform(schema.get("minimum", 0), schema.get("maximum", 1)), 3)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    return _text(rng, 8)
+
+
+def requested_schema(provider: str, body: dict) -> Optional[dict]:
+    """The structured-output schema a request asks for, or None for plain text."""
+    if provider == "anthropic":
+        tools = body.get("tools") or []
+        return tools[0].get("input_schema") if tools else None
+    if provider == "google":
+        return body.get("generationConfig", {}).get("responseSchema")
+
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        return response_format["json_schema"]["schema"]
+    if response_format.get("type") == "json_object":
+        match = _SCHEMA_IN_PROMPT.search(body["messages"][-1]["content"])
+        return json.loads(match.group(1)) if match else {"type": "object"}
+    return None
+
+
+class MockProviderServer:
+    """Threaded HTTP server answering in every provider's shape; see the module docstring."""
+
+    def __init__(
+        self,
+        profiles: Optional[dict] = None,
+        seed: int = 0,
+        time_scale: float = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        # profiles: {"default": {...}, "<provider>": {...}} merged over DEFAULT_PROFILE
+        profiles = profiles or {}
+        base = {**DEFAULT_PROFILE, **profiles.get("default", {})}
+        self.profiles = {p: {**base, **profiles.get(p, {})} for p in PROVIDERS}
+        self.seed = seed
+        self.time_scale = time_scale
+        self._lock = threading.Lock()
+        self._attempts: dict[str, int] = {}  # request body hash -> requests seen (retries)
+        self.reset_stats()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread (the standalone server)."""
+        self._server.serve_forever()
+
+    def start(self) -> "MockProviderServer":
+        """Serve in a background thread (benchmarks in the same process)."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        """Zero the counters and attempt numbers (start of a benchmark run)."""
+        with self._lock:
+            self._attempts = {}
+            self.stats = {
+                "requests": 0, "failures": 0, "bytes_received": 0, "bytes_sent": 0, "by_provider": {},
+                "max_in_flight": {}, "authorized": {},
+            }
+            self._in_flight: dict[str, int] = {}
+
+    def snapshot(self) -> dict:
+        """Copy of the request counters since the last reset_stats()."""
+        with self._lock:
+            return json.loads(json.dumps(self.stats))
+
+    def _record(self, provider: str, received: int, sent: int, failed: bool) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["failures"] += int(failed)
+            self.stats["bytes_received"] += received
+            self.stats["bytes_sent"] += sent
+            self.stats["by_provider"][provider] = self.stats["by_provider"].get(provider, 0) + 1
+
+    def _enter(self, provider: str, authorized: bool) -> None:
+        with self._lock:
+            in_flight = self._in_flight[provider] = self._in_flight.get(provider, 0) + 1
+            peaks = self.stats["max_in_flight"]
+            peaks[provider] = max(peaks.get(provider, 0), in_flight)
+            if authorized:
+                self.stats["authorized"][provider] = self.stats["authorized"].get(provider, 0) + 1
+
+    def _leave(self, provider: str) -> None:
+        with self._lock:
+            self._in_flight[provider] = max(0, self._in_flight.get(provider, 0) - 1)
+
+    def _rng(self, provider: str, raw: bytes) -> random.Random:
+        """RNG for one request: same body and attempt number -> same draws."""
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+        return random.Random(f"{self.seed}:{provider}:{digest}:{attempt}")
+
+    def _handler(self) -> type:
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                provider = self.path.split("/")[1]
+                if provider not in PROVIDERS:
+                    self._send_json(404, {"error": {"message": f"Unknown provider path {self.path}"}})
+                    return
+
+                authorized = bool(self.headers.get("Authorization") or self.headers.get("x-api-key"))
+                mock._enter(provider, authorized)
+                try:
+                    self._respond(provider, raw)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up (hedge loser, quorum cutoff): nothing left to answer
+                    self.close_connection = True
+                finally:
+                    mock._leave(provider)
+
+            def _respond(self, provider: str, raw: bytes) -> None:
+                profile = mock.profiles[provider]
+                rng = mock._rng(provider, raw)
+                body = json.loads(raw)
+                latency = sample_latency(profile["latency"], rng) * mock.time_scale
+
+                if rng.random() < profile["failure_rate"]:
+                    time.sleep(latency * profile["ttfb_fraction"])
+                    sent = self._send_json(profile["failure_status"], {"error": {"message": "mock failure"}})
+                    mock._record(provider, len(raw), sent, failed=True)
+                    return
+
+                schema = requested_schema(provider, body)
+                if schema is not None:
+                    text = json.dumps(instance(schema, rng))
+                else:
+                    text = _text(rng, profile["answer_words"])
+                usage = {"prompt": max(1, len(raw) // 4), "completion": max(1, len(text) // 4)}
+
+                streaming = body.get("stream") or "streamGenerateContent" in self.path
+                if streaming:
+                    sent = self._stream(provider, text, usage, latency, profile["ttfb_fraction"])
+                else:
+                    time.sleep(latency)
+                    sent = self._send_json(200, self._message(provider, text, usage, schema is not None))
+                mock._record(provider, len(raw), sent, failed=False)
+
+            def _message(self, provider: str, text: str, usage: dict, structured: bool) -> dict:
+                if provider == "google":
+                    return {
+                        "candidates": [{"content": {"parts": [{"text": text}]}}],
+                        "usageMetadata": {
+                            "promptTokenCount": usage["prompt"],
+                            "candidatesTokenCount": usage["completion"],
+                        },
+                    }
+                if provider == "anthropic":
+                    block = (
+                        {"type": "tool_use", "id": "toolu_mock", "name": "answer", "input": json.loads(text)}
+                        if structured else {"type": "text", "text": text}
+                    )
+                    return {
+                        "content": [block],
+                        "usage": {"input_tokens": usage["prompt"], "output_tokens": usage["completion"]},
+                    }
+                return {
+                    "choices": [{"message": {"role": "assistant", "content": text}}],
+                    "usage": {"prompt_tokens": usage["prompt"], "completion_tokens": usage["completion"]},
+                }
+
+            def _events(self, provider: str, pieces: list[str], usage: dict) -> list[dict]:
+                if provider == "google":
+                    events = [{"candidates": [{"content": {"parts": [{"text": p}]}}]} for p in pieces]
+                    events[-1]["usageMetadata"] = {
+                        "promptTokenCount": usage["prompt"], "candidatesTokenCount": usage["completion"],
+                    }
+                    return events
+                if provider == "anthropic":
+                    return (
+                        [{"type": "message_start", "message": {"usage": {"input_tokens": usage["prompt"]}}}]
+                        + [{"type": "content_block_delta", "delta": {"type": "text_delta", "text": p}} for p in pieces]
+                        + [
+                            {"type": "message_delta", "usage": {"output_tokens": usage["completion"]}},
+                            {"type": "message_stop"},
+                        ]
+                    )
+                return [{"choices": [{"delta": {"content": p}}]} for p in pieces] + [{
+                    "choices": [],
+                    "usage": {"prompt_tokens": usage["prompt"], "completion_tokens": usage["completion"]},
+                }]
+
+            def _stream(self, provider: str, text: str, usage: dict, latency: float, ttfb_fraction: float) -> int:
+                """Send an SSE response in chunked encoding, spreading `latency` over the events."""
+                words = text.split(" ")
+                pieces = [" ".join(words[i:i + 8]) + " " for i in range(0, len(words), 8)]
+                lines = [f"data: {json.dumps(e)}\n\n" for e in self._events(provider, pieces, usage)]
+                if provider not in ("google", "anthropic"):
+                    lines.append("data: [DONE]\n\n")
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                sent = 0
+                time.sleep(latency * ttfb_fraction)
+                gap = latency * (1 - ttfb_fraction) / max(1, len(lines))
+                for i, line in enumerate(lines):
+                    if i:
+                        time.sleep(gap)
+                    data = line.encode("utf-8")
+                    self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                    self.wfile.flush()
+                    sent += len(data)
+                self.wfile.write(b"0\r\n\r\n")
+                return sent
+
+            def _send_json(self, status: int, payload: dict) -> int:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(data)
+                return len(data)
+
+        return Handler
+
+
+def load_profiles(path: Optional[str]) -> dict:
+    """Read a profiles JSON file ({"default": {...}, "<provider>": {...}})."""
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve mock LLM provider APIs for benchmarks")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--profile", type=str, help="Latency/failure profiles JSON")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latencies, failures and answers")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiply every latency (0 = instant)")
+    args = parser.parse_args()
+
+    server = MockProviderServer(load_profiles(args.profile), args.seed, args.time_scale, port=args.port)
+    print(f"Mock providers on {server.url}")
+    for provider in PROVIDERS:
+        print(f"  {provider:<18} {endpoint(server.url, provider)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
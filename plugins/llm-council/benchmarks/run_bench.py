@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Council Orchestration Benchmark
+
+Runs the council commands end to end against the deterministic mock provider
+(mock_provider.py) instead of live APIs: CouncilEngine.execute (full, quick
+and speculative), DebateEngine, BrainstormEngine and DecisionEngine. Each
+scenario gets a fresh engine per run on a throwaway config whose models point
+at the mock server; the response cache, run store and provider CLIs are off,
+so every call goes over HTTP. The report shows, per scenario, the median
+wall time, calls per stage, retries and the bytes sent to the providers;
+streaming scenarios also show the median time until the first synthesis
+text reached the caller.
+
+With --save the medians are written as a baseline; --compare fails (exit 1)
+when a scenario's median wall time regresses beyond --tolerance, so
+orchestration slowdowns surface before they ship.
+
+    uv run python benchmarks/run_bench.py [--runs 3] [--models 4] [--time-scale 0.25]
+    uv run python benchmarks/run_bench.py --save bench_baseline.json
+    uv run python benchmarks/run_bench.py --compare bench_baseline.json [--tolerance 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import council_engine
+from council_brainstorm import BrainstormEngine
+from council_debate import DebateEngine
+from council_decide import DecisionEngine
+from council_engine import CallMetrics, CouncilEngine
+from mock_provider import MockProviderServer, endpoint, load_profiles
+
+PROVIDER_CYCLE = ("openai", "google", "anthropic", "deepseek")
+API_KEY_ENV = "COUNCIL_BENCH_API_KEY"
+
+QUESTION = "What is the best way to cache expensive API calls in a Python service?"
+DECISION = ("Which database should a small analytics team adopt?", ["PostgreSQL", "DuckDB", "SQLite"])
+
+# Scenario -> coroutine factory taking a fresh engine; returns the call metrics of the run
+Scenario = Callable[[CouncilEngine], Awaitable[list[CallMetrics]]]
+
+# perf_counter() of the first synthesis chunk in the current run (streaming scenarios)
+_first_output: list[float] = []
+
+
+def _on_chunk(chunk: str) -> None:
+    if not _first_output:
+        _first_output.append(time.perf_counter())
+
+
+async def _logged(run: Awaitable) -> list[CallMetrics]:
+    """Collect the calls of a command that does not go through execute()."""
+    call_log: list[CallMetrics] = []
+    token = council_engine._CALL_LOG.set(call_log)
+    try:
+        await run
+    finally:
+        council_engine._CALL_LOG.reset(token)
+    return call_log
+
+
+async def _ask(engine: CouncilEngine, **kwargs) -> list[CallMetrics]:
+    result = await engine.execute(QUESTION, system_prompt="Answer thoroughly.", **kwargs)
+    return result.call_metrics
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "ask": lambda engine: _ask(engine),
+    "ask --quick": lambda engine: _ask(engine, skip_peer_review=True),
+    "ask --speculative": lambda engine: _ask(engine, speculative=True),
+    "ask --stream": lambda engine: _ask(engine, on_synthesis_chunk=_on_chunk),
+    "ask --speculative --stream": lambda engine: _ask(engine, speculative=True, on_synthesis_chunk=_on_chunk),
+    "debate": lambda engine: _logged(DebateEngine(engine=engine).run_debate("Monolith vs microservices", rounds=2)),
+    "brainstorm": lambda engine: _logged(
+        BrainstormEngine(engine=engine).run_brainstorm("Features for a CLI tool", rounds=2)
+    ),
+    "decide": lambda engine: _logged(DecisionEngine(engine=engine).run_decision(*DECISION)),
+}
+
+
+def write_config(config_dir: Path, url: str, model_count: int, keep_rate_limits: bool) -> None:
+    """Benchmark copies of models.json/council.json: mock endpoints, no cache, store or saved health."""
+    source = SCRIPTS_DIR.parent / "config"
+    models_config = json.loads((source / "models.json").read_text(encoding="utf-8"))
+    council_config = json.loads((source / "council.json").read_text(encoding="utf-8"))
+
+    models = []
+    for i in range(model_count):
+        provider = PROVIDER_CYCLE[i % len(PROVIDER_CYCLE)]
+        models.append({
+            "name": f"{provider}-{i + 1}",
+            "provider": provider,
+            "model": f"mock-{provider}",
+            "endpoint": endpoint(url, provider, f"mock-{provider}"),
+            "api_key_env": API_KEY_ENV,
+            "cli_command": None,
+            "enabled": True,
+        })
+    settings = models_config.get("settings", {})
+    if not keep_rate_limits:
+        settings.pop("rate_limits", None)  # Measure orchestration, not the configured quotas
+    settings["http"] = {**settings.get("http", {}), "http2": False}  # Plain-HTTP mock
+
+    council_config.setdefault("cache", {})["enabled"] = False
+    council_config.setdefault("store", {})["enabled"] = False
+    council_config.setdefault("health", {})["persist"] = False
+
+    (config_dir / "models.json").write_text(json.dumps({"models": models, "settings": settings}), encoding="utf-8")
+    (config_dir / "council.json").write_text(json.dumps(council_config), encoding="utf-8")
+
+
+def stage_counts(calls: list[CallMetrics]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for m in calls:
+        counts[m.stage] = counts.get(m.stage, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+async def run_scenario(
+    name: str,
+    scenario: Scenario,
+    config_dir: Path,
+    server: MockProviderServer,
+    runs: int,
+    seed: int
+) -> dict:
+    """Run one scenario `runs` times; wall times per run, the rest from the last run."""
+    walls = []
+    firsts = []
+    for run in range(runs):
+        random.seed(seed + run)  # Anonymization order, hence prompt bodies, hence mock draws
+        server.reset_stats()
+        _first_output.clear()
+        engine = CouncilEngine(config_dir=config_dir, use_cache=False)
+        start = time.perf_counter()
+        try:
+            calls = await scenario(engine)
+        finally:
+            await engine.aclose()
+        walls.append((time.perf_counter() - start) * 1000)
+        if _first_output:
+            firsts.append((_first_output[0] - start) * 1000)
+
+    traffic = server.snapshot()
+    return {
+        "scenario": name,
+        "wall_ms_median": round(statistics.median(walls), 1),
+        "wall_ms_min": round(min(walls), 1),
+        "first_output_ms_median": round(statistics.median(firsts), 1) if firsts else None,
+        "calls": len(calls),
+        "calls_by_stage": stage_counts(calls),
+        "errors": sum(1 for m in calls if m.error),
+        "retries": sum(m.retries for m in calls),
+        "requests": traffic["requests"],
+        "bytes_sent": traffic["bytes_received"],  # What the engine sent, as counted by the server
+        "bytes_received": traffic["bytes_sent"],
+    }
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """Scenarios whose median wall time exceeds the baseline by more than `tolerance`."""
+    regressions = []
+    for result in results:
+        before = baseline.get(result["scenario"], {}).get("wall_ms_median")
+        if before and result["wall_ms_median"] > before * (1 + tolerance):
+            change = result["wall_ms_median"] / before - 1
+            regressions.append(
+                f"{result['scenario']}: {before:.0f}ms -> {result['wall_ms_median']:.0f}ms (+{change:.0%})"
+            )
+    return regressions
+
+
+def print_report(results: list[dict]) -> None:
+    print(
+        f"{'Scenario':<27} {'median':>9} {'min':>9} {'first':>9} {'calls':>6} {'retry':>6} {'sent':>9}  calls by stage"
+    )
+    print("-" * 117)
+    for r in results:
+        stages = ", ".join(f"{stage} {count}" for stage, count in r["calls_by_stage"].items())
+        first = r.get("first_output_ms_median")
+        first = f"{first:>7.0f}ms" if first is not None else f"{'-':>9}"
+        print(
+            f"{r['scenario']:<27} {r['wall_ms_median']:>7.0f}ms {r['wall_ms_min']:>7.0f}ms {first} "
+            f"{r['calls']:>6} {r['retries']:>6} {r['bytes_sent'] / 1024:>7.1f}KB  {stages}"
+        )
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark council orchestration against mock providers")
+    parser.add_argument("--scenarios", type=str, default=",".join(SCENARIOS),
+                        help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per scenario (default: 3)")
+    parser.add_argument("--models", type=int, default=4, help="Council size, cycling providers (default: 4)")
+    parser.add_argument("--profile", type=str, help="Mock latency/failure profiles JSON (see mock_provider.py)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for mock latencies, failures and shuffles")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="Multiply every mock latency; 0 measures pure orchestration overhead")
+    parser.add_argument("--failure-rate", type=float, help="Override every provider's failure rate")
+    parser.add_argument("--rate-limits", action="store_true",
+                        help="Keep models.json rate_limits (default: off)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--save", type=str, help="Write the results as a baseline file")
+    parser.add_argument("--compare", type=str, help="Baseline file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed median wall-time increase over the baseline (default: 0.2)")
+    return parser.parse_args()
+
+
+async def run(args) -> list[dict]:
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(unknown)}")
+
+    profiles = load_profiles(args.profile)
+    if args.failure_rate is not None:
+        profiles["default"] = {**profiles.get("default", {}), "failure_rate": args.failure_rate}
+        for provider_profile in profiles.values():
+            provider_profile["failure_rate"] = args.failure_rate
+
+    # API path only: the mock server stands in for every provider
+    council_engine.PROVIDER_CLIS.clear()
+    os.environ[API_KEY_ENV] = "mock-key"
+
+    results = []
+    with MockProviderServer(profiles, seed=args.seed, time_scale=args.time_scale) as server:
+        with tempfile.TemporaryDirectory(prefix="council-bench-") as tmp:
+            config_dir = Path(tmp)
+            write_config(config_dir, server.url, args.models, args.rate_limits)
+            # Untimed: the first run pays for lazy httpx/NumPy imports
+            await run_scenario("warm-up", SCENARIOS["ask"], config_dir, server, 1, args.seed)
+            for name in names:
+                results.append(await run_scenario(
+                    name, SCENARIOS[name], config_dir, server, args.runs, args.seed
+                ))
+    return results
+
+
+def main():
+    args = parse_args()
+    if args.models < 2:
+        print("Error: A council needs at least 2 models")
+        sys.exit(1)
+
+    try:
+        results = asyncio.run(run(args))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{args.models} models, {args.runs} runs per scenario, time scale {args.time_scale:g}\n")
+        print_report(results)
+
+    if args.save:
+        Path(args.save).write_text(
+            json.dumps({r["scenario"]: r for r in results}, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nFAIL: slower than {args.compare} by more than {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nOK: no scenario slower than {args.compare} by more than {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,22 @@ Council Ask Command Handler
 Executes the /council:ask command for general questions.
 """
 
-import asyncio
 import argparse
+import hashlib
+import json
+import os
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add scripts directory to path for council_engine import
 sys.path.insert(0, str(Path(__file__).parent))
 
-from council_engine import CouncilEngine
+from council_client import daemon_request
+
+if TYPE_CHECKING:
+    from council_engine import CouncilEngine  # Loaded per call, so --help and usage errors skip asyncio
 
 
 def parse_args():
@@ -22,25 +29,214 @@ def parse_args():
     parser.add_argument("question", nargs="?", help="The question to ask")
     parser.add_argument("--quick", action="store_true", help="Skip peer review")
     parser.add_argument("--chairman", type=str, help="Model to use as chairman")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print the chairman synthesis as it is generated")
+    parser.add_argument("--speculative", action="store_true", default=None,
+                        help="Draft the synthesis while peer review runs (default: synthesis.speculative)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the response cache")
+    parser.add_argument("--metrics", action="store_true",
+                        help="Append per-stage timing and token metrics as JSON")
+    parser.add_argument("--replay", type=str, metavar="RUN_ID",
+                        help="Re-run a stored run from its saved Stage 1 responses (see council_store.py)")
+    parser.add_argument("--replay-stage", choices=["stage_2", "stage_3", "format"], default="stage_3",
+                        help="With --replay: redo peer review and synthesis, only synthesis (default), or only formatting")
+    parser.add_argument("--batch", type=str, metavar="QUESTIONS_JSONL",
+                        help="Run every question in a JSONL file through one engine")
+    parser.add_argument("--output", type=str,
+                        help="Batch results file (default: <batch>.results.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Questions in flight at once in batch mode (default: 4)")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run in-process even if the council daemon is running")
     return parser.parse_args()
 
 
-async def run_council_ask(question: str, quick: bool = False, chairman: str = None):
-    """Execute council ask workflow."""
-    engine = CouncilEngine()
+async def run_council_ask(
+    question: Optional[str],
+    quick: bool = False,
+    chairman: str = None,
+    stream: bool = False,
+    use_cache: bool = True,
+    metrics: bool = False,
+    engine: Optional["CouncilEngine"] = None,
+    write: Optional[Callable[[str], None]] = None,
+    speculative: Optional[bool] = None,
+    replay: Optional[str] = None,
+    replay_stage: str = "stage_3"
+):
+    """
+    Execute council ask workflow.
+
+    With `stream`, the Stage 3 synthesis is written token by token as it
+    arrives (to stdout, or through `write`) and the returned text holds only
+    the Stage 1/2 details. `speculative` overlaps peer review with a draft
+    synthesis (see CouncilEngine.execute). `replay` names a stored run to
+    re-run from `replay_stage` instead of asking `question` (see
+    CouncilEngine.replay). A caller-supplied `engine` (the daemon's) is
+    shared and left open.
+    """
+    from council_engine import CouncilEngine
+
+    owns_engine = engine is None
+    if owns_engine:
+        engine = CouncilEngine(use_cache=use_cache)
+    streamed = []
+
+    def write_stdout(text: str):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    emit = write or write_stdout
+
+    def print_chunk(chunk: str):
+        if not streamed:
+            emit("## Chairman Synthesis\n\n")
+        streamed.append(chunk)
+        emit(chunk)
+
+    try:
+        if replay:
+            result = await engine.replay(
+                engine.load_run(replay),
+                from_stage=replay_stage,
+                on_synthesis_chunk=print_chunk if stream else None,
+                chairman=chairman,
+                speculative=speculative
+            )
+        else:
+            result = await engine.execute(
+                prompt=question,
+                system_prompt="Answer the following question thoroughly and accurately.",
+                skip_peer_review=quick,
+                on_synthesis_chunk=print_chunk if stream else None,
+                chairman=chairman,
+                speculative=speculative
+            )
+    finally:
+        if owns_engine:
+            await engine.aclose()
+
+    if streamed:
+        emit("\n\n")
+    output = engine.format_result(result, include_synthesis=not streamed)
+    if metrics:
+        output += "\n\n## Metrics\n\n```json\n" + engine.format_metrics(result) + "\n```"
+    return output
+
+
+def load_batch(batch_path: Path) -> list[dict]:
+    """
+    Read batch questions from JSONL.
+
+    Each line is either a JSON string or an object with a "question" and an
+    optional "id"; questions without an id are keyed by a hash of their text
+    so a resumed run recognises them.
+    """
+    items = []
+    with open(batch_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, str):
+                entry = {"question": entry}
+            if not entry.get("question"):
+                raise ValueError(f"{batch_path}:{line_no}: missing \"question\"")
+            if entry.get("id") is None:
+                entry["id"] = hashlib.sha256(entry["question"].encode("utf-8")).hexdigest()[:12]
+            entry["id"] = str(entry["id"])
+            items.append(entry)
+    return items
+
 
-    # Override chairman if specified
-    if chairman:
-        engine.council_config["chairman_strategy"] = "fixed"
-        engine.council_config["chairman_fixed_model"] = chairman
+def load_completed_ids(output_path: Path) -> set[str]:
+    """IDs already answered successfully in a previous (possibly interrupted) batch run."""
+    completed = set()
+    if not output_path.exists():
+        return completed
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from a crash mid-write
+            if isinstance(record, dict) and "result" in record:
+                completed.add(str(record.get("id")))
+    return completed
 
-    result = await engine.execute(
-        prompt=question,
-        system_prompt="Answer the following question thoroughly and accurately.",
-        skip_peer_review=quick
-    )
 
-    return engine.format_result(result)
+async def run_council_batch(
+    batch_path: Path,
+    output_path: Path,
+    concurrency: int = 4,
+    quick: bool = False,
+    chairman: str = None,
+    use_cache: bool = True
+) -> dict:
+    """
+    Execute council ask for every question in a JSONL file.
+
+    Questions share one engine (config, connection pools, cache, rate limits)
+    and at most `concurrency` run at once. Each result is appended to the
+    output JSONL as soon as it finishes; questions whose id already has a
+    result there are skipped, so rerunning after a crash resumes the batch.
+    Failed questions are recorded with an "error" and retried on the next run.
+    """
+    import asyncio
+
+    from council_engine import CouncilEngine
+
+    items = load_batch(batch_path)
+    completed = load_completed_ids(output_path)
+    pending = [item for item in items if item["id"] not in completed]
+    counts = {"total": len(items), "skipped": len(items) - len(pending), "succeeded": 0, "failed": 0}
+
+    engine = CouncilEngine(use_cache=use_cache)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "a", encoding="utf-8") as out:
+        def write_record(record: dict) -> None:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+
+        async def ask(item: dict) -> None:
+            async with semaphore:
+                start_time = time.time()
+                record = {"id": item["id"], "question": item["question"]}
+                try:
+                    result = await engine.execute(
+                        prompt=item["question"],
+                        system_prompt=item.get(
+                            "system_prompt",
+                            "Answer the following question thoroughly and accurately."
+                        ),
+                        skip_peer_review=item.get("quick", quick),
+                        chairman=chairman
+                    )
+                    record["result"] = engine.result_to_dict(result)
+                    counts["succeeded"] += 1
+                except Exception as e:
+                    record["error"] = str(e)
+                    counts["failed"] += 1
+                write_record(record)
+
+                done = counts["succeeded"] + counts["failed"]
+                status = "error" if "error" in record else "ok"
+                print(
+                    f"[{done}/{len(pending)}] {item['id']} {status} ({time.time() - start_time:.1f}s)",
+                    file=sys.stderr, flush=True
+                )
+
+        try:
+            await asyncio.gather(*(ask(item) for item in pending))
+        finally:
+            await engine.aclose()
+
+    return counts
 
 
 def format_header(question: str, chairman: str, models: list) -> str:
@@ -56,22 +252,73 @@ Council: {model_names} | Chairman: {chairman}
 def main():
     args = parse_args()
 
-    # Get question from args or stdin
+    if args.batch:
+        import asyncio
+
+        batch_path = Path(args.batch)
+        output_path = Path(args.output) if args.output else batch_path.with_suffix(".results.jsonl")
+        try:
+            counts = asyncio.run(run_council_batch(
+                batch_path=batch_path,
+                output_path=output_path,
+                concurrency=args.concurrency,
+                quick=args.quick,
+                chairman=args.chairman,
+                use_cache=not args.no_cache
+            ))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(
+            f"Batch complete: {counts['succeeded']} succeeded, {counts['failed']} failed, "
+            f"{counts['skipped']} already done (of {counts['total']}) -> {output_path}"
+        )
+        sys.exit(1 if counts["failed"] else 0)
+
+    # Get question from args or stdin (a replay reuses the stored question)
     question = args.question
-    if not question and not sys.stdin.isatty():
+    if not question and not args.replay and not sys.stdin.isatty():
         question = sys.stdin.read().strip()
 
-    if not question:
+    if not question and not args.replay:
         print("Error: No question provided")
-        print("Usage: council_ask.py \"<question>\" [--quick] [--chairman <model>]")
+        print("Usage: council_ask.py \"<question>\" [--quick] [--chairman <model>] [--stream] [--speculative] [--no-cache] [--metrics] [--no-daemon]")
+        print("       council_ask.py --replay <run-id> [--replay-stage stage_2|stage_3|format] [--chairman <model>]")
+        print("       council_ask.py --batch <questions.jsonl> [--output <results.jsonl>] [--concurrency <n>] [--quick]")
         sys.exit(1)
 
+    def write_chunk(text: str):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    import asyncio
+
     try:
-        output = asyncio.run(run_council_ask(
-            question=question,
-            quick=args.quick,
-            chairman=args.chairman
-        ))
+        output = None
+        if not args.no_daemon:
+            output = daemon_request("ask", {
+                "question": question,
+                "quick": args.quick,
+                "chairman": args.chairman,
+                "stream": args.stream,
+                "speculative": args.speculative,
+                "replay": args.replay,
+                "replay_stage": args.replay_stage,
+                "use_cache": not args.no_cache,
+                "metrics": args.metrics
+            }, on_chunk=write_chunk)
+        if output is None:
+            output = asyncio.run(run_council_ask(
+                question=question,
+                quick=args.quick,
+                chairman=args.chairman,
+                stream=args.stream,
+                use_cache=not args.no_cache,
+                metrics=args.metrics,
+                speculative=args.speculative,
+                replay=args.replay,
+                replay_stage=args.replay_stage
+            ))
         print(output)
     except ValueError as e:
         print(f"Error: {e}")
@@ -5,17 +5,19 @@ Council Brainstorm Command Handler
 Executes the /council:brainstorm command for collaborative idea generation.
 """
 
-import asyncio
 import argparse
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from council_engine import CouncilEngine
+from council_client import daemon_request
+
+if TYPE_CHECKING:
+    from council_engine import CouncilEngine
 
 
 class BrainstormEngine:
@@ -39,28 +41,68 @@ class BrainstormEngine:
         }
     }
 
-    def __init__(self):
-        self.engine = CouncilEngine()
+    def __init__(self, use_cache: bool = True, engine: Optional["CouncilEngine"] = None):
+        from council_engine import CouncilEngine
+
+        self.engine = engine or CouncilEngine(use_cache=use_cache)
 
     async def run_brainstorm(
         self,
         topic: str,
         rounds: int = 2,
-        style: str = "balanced"
+        style: str = "balanced",
+        pipelined: Optional[bool] = None,
+        min_peers: Optional[int] = None
     ) -> str:
-        """Execute brainstorming workflow."""
+        """
+        Execute brainstorming workflow.
+
+        `pipelined` and `min_peers` default to council.json `brainstorm`
+        (see _run_pipelined_rounds).
+        """
         models = self.engine.get_enabled_models()
 
         if len(models) < 2:
             raise ValueError("Brainstorming requires at least 2 enabled models")
 
         style_config = self.STYLES.get(style, self.STYLES["balanced"])
+        brainstorm_config = self.engine.council_config.get("brainstorm", {})
+        if pipelined is None:
+            pipelined = brainstorm_config.get("pipelined", False)
+        if min_peers is None:
+            min_peers = brainstorm_config.get("min_peers", 2)
+
+        if pipelined:
+            all_ideas, cross_pollination = await self._run_pipelined_rounds(
+                topic, models, rounds, style_config, min_peers
+            )
+        else:
+            all_ideas, cross_pollination = await self._run_rounds(topic, rounds, style_config)
+
+        # Chairman synthesis
+        chairman = self.engine.select_chairman(models, warm=set(all_ideas))
+        synthesis = await self._get_chairman_synthesis(
+            topic, all_ideas, cross_pollination, style_config, chairman
+        )
 
+        return self._format_brainstorm_output(
+            topic, style, all_ideas, cross_pollination,
+            synthesis, chairman["name"]
+        )
+
+    async def _run_rounds(
+        self,
+        topic: str,
+        rounds: int,
+        style_config: dict
+    ) -> tuple[dict[str, list], list[dict]]:
+        """Run the rounds in lockstep: each round starts once every model finished the last."""
         # Round 1: Independent idea generation
         round1_prompt = self._build_round1_prompt(topic, style_config)
         round1_responses = await self.engine.run_stage_1(
             round1_prompt,
-            f"You are brainstorming. {style_config['prompt_modifier']}"
+            f"You are brainstorming. {style_config['prompt_modifier']}",
+            stage="round_1"
         )
 
         # Parse round 1 ideas
@@ -78,7 +120,8 @@ class BrainstormEngine:
             )
             round_responses = await self.engine.run_stage_1(
                 round_prompt,
-                "Build on others' ideas. Combine, improve, and generate new variations."
+                "Build on others' ideas. Combine, improve, and generate new variations.",
+                stage=f"round_{round_num + 1}"
             )
 
             round_ideas = {}
@@ -89,16 +132,85 @@ class BrainstormEngine:
 
             cross_pollination.append(round_ideas)
 
-        # Chairman synthesis
-        chairman = self.engine.select_chairman(models)
-        synthesis = await self._get_chairman_synthesis(
-            topic, all_ideas, cross_pollination, style_config, chairman
-        )
+        return all_ideas, cross_pollination
 
-        return self._format_brainstorm_output(
-            topic, style, all_ideas, cross_pollination,
-            synthesis, chairman["name"]
-        )
+    async def _run_pipelined_rounds(
+        self,
+        topic: str,
+        models: list[dict],
+        rounds: int,
+        style_config: dict,
+        min_peers: int
+    ) -> tuple[dict[str, list], list[dict]]:
+        """
+        Run every round without waiting for the slowest model.
+
+        Each model moves to its next round as soon as it has finished the
+        previous one and at least `min_peers` other models have ideas from
+        that round (or every other model has finished it). Its prompt then
+        shows the previous-round ideas available at that moment. A model that
+        falls behind skips ahead to the round the others are on (or stops if
+        they are done), so the session is paced by the fast models rather
+        than the slowest. Skipped rounds count as finished (without ideas)
+        for that model, so peers waiting on them are never stranded. Returns
+        round 1 ideas and the cross-pollination rounds, both in model order.
+        """
+        import asyncio
+
+        min_peers = max(1, min(min_peers, len(models) - 1))
+        ideas_by_round: list[dict[str, list]] = [{} for _ in range(rounds)]
+        finished: list[set[str]] = [set() for _ in range(rounds)]
+        progress = asyncio.Condition()
+
+        def peers_with_ideas(round_index: int, name: str) -> int:
+            return sum(1 for p in finished[round_index] - {name} if ideas_by_round[round_index].get(p))
+
+        def peers_ready(round_index: int, name: str) -> bool:
+            peers_done = finished[round_index] - {name}
+            return peers_with_ideas(round_index, name) >= min_peers or len(peers_done) == len(models) - 1
+
+        def next_round(round_index: int, name: str) -> int:
+            """The round after this one, or later if min_peers others already finished it."""
+            following = round_index + 1
+            while following < rounds and peers_with_ideas(following, name) >= min_peers:
+                following += 1
+            return following
+
+        def in_model_order(ideas: dict[str, list]) -> dict[str, list]:
+            return {m["name"]: ideas[m["name"]] for m in models if m["name"] in ideas}
+
+        async def participant(model: dict) -> None:
+            name = model["name"]
+            round_index = 0
+            while round_index < rounds:
+                if round_index == 0:
+                    prompt = self._build_round1_prompt(topic, style_config)
+                    system_prompt = f"You are brainstorming. {style_config['prompt_modifier']}"
+                else:
+                    async with progress:
+                        await progress.wait_for(lambda: peers_ready(round_index - 1, name))
+                    prompt = self._build_cross_pollination_prompt(
+                        topic, in_model_order(ideas_by_round[round_index - 1]), style_config, round_index
+                    )
+                    system_prompt = "Build on others' ideas. Combine, improve, and generate new variations."
+
+                response = await self.engine.call_model(
+                    model, prompt, system_prompt, stage=f"round_{round_index + 1}"
+                )
+                async with progress:
+                    if not response.error:
+                        ideas_by_round[round_index][name] = self._parse_ideas(response.response)
+                    finished[round_index].add(name)
+                    following = next_round(round_index, name)
+                    for skipped in range(round_index + 1, following):
+                        finished[skipped].add(name)
+                    progress.notify_all()
+                    round_index = following
+
+        await asyncio.gather(*(participant(model) for model in models))
+
+        rounds_in_order = [in_model_order(ideas) for ideas in ideas_by_round]
+        return rounds_in_order[0], rounds_in_order[1:]
 
     def _build_round1_prompt(self, topic: str, style_config: dict) -> str:
         """Build initial brainstorming prompt."""
@@ -130,12 +242,14 @@ Format:
         round_num: int
     ) -> str:
         """Build cross-pollination prompt."""
+        from council_engine import anonymous_id
+
         # Format others' ideas (anonymized)
-        ideas_text = ""
-        for i, (model, ideas) in enumerate(all_ideas.items()):
-            ideas_text += f"\n### Participant {chr(65 + i)}\n"
-            for j, idea in enumerate(ideas[:5], 1):
-                ideas_text += f"{j}. {idea}\n"
+        parts = []
+        for i, ideas in enumerate(all_ideas.values()):
+            parts.append(f"\n### {anonymous_id(i, 'Participant')}\n")
+            parts.extend(f"{j}. {idea}\n" for j, idea in enumerate(ideas[:5], 1))
+        ideas_text = "".join(parts)
 
         return f"""## Brainstorming Topic
 {topic}
@@ -182,18 +296,17 @@ Format each as:
     ) -> str:
         """Get chairman's synthesis of all ideas."""
         # Compile all ideas
-        all_ideas_text = "## Round 1 Ideas\n"
+        parts = ["## Round 1 Ideas\n"]
         for model, ideas in round1_ideas.items():
-            all_ideas_text += f"\n### {model}\n"
-            for i, idea in enumerate(ideas, 1):
-                all_ideas_text += f"{i}. {idea}\n"
+            parts.append(f"\n### {model}\n")
+            parts.extend(f"{i}. {idea}\n" for i, idea in enumerate(ideas, 1))
 
         for round_num, round_ideas in enumerate(cross_pollination, 2):
-            all_ideas_text += f"\n## Round {round_num} Ideas\n"
+            parts.append(f"\n## Round {round_num} Ideas\n")
             for model, ideas in round_ideas.items():
-                all_ideas_text += f"\n### {model}\n"
-                for i, idea in enumerate(ideas, 1):
-                    all_ideas_text += f"{i}. {idea}\n"
+                parts.append(f"\n### {model}\n")
+                parts.extend(f"{i}. {idea}\n" for i, idea in enumerate(ideas, 1))
+        all_ideas_text = "".join(parts)
 
         synthesis_prompt = f"""You are synthesizing a brainstorming session.
 
@@ -222,7 +335,8 @@ Be concise but comprehensive. Prioritize quality over quantity.
 
         response = await self.engine.call_model(
             chairman, synthesis_prompt,
-            "You are synthesizing brainstorming results into actionable insights."
+            "You are synthesizing brainstorming results into actionable insights.",
+            stage="synthesis"
         )
         return response.response if not response.error else "Synthesis failed."
 
@@ -274,6 +388,30 @@ Be concise but comprehensive. Prioritize quality over quantity.
         return "\n".join(lines)
 
 
+async def run_council_brainstorm(
+    topic: str,
+    rounds: int = 2,
+    style: str = "balanced",
+    use_cache: bool = True,
+    engine: Optional["CouncilEngine"] = None,
+    pipelined: Optional[bool] = None,
+    min_peers: Optional[int] = None
+) -> str:
+    """
+    Execute council brainstorm workflow.
+
+    A caller-supplied `engine` (the daemon's) is shared and left open.
+    """
+    brainstorm = BrainstormEngine(use_cache=use_cache, engine=engine)
+    try:
+        return await brainstorm.run_brainstorm(
+            topic=topic, rounds=rounds, style=style, pipelined=pipelined, min_peers=min_peers
+        )
+    finally:
+        if engine is None:
+            await brainstorm.engine.aclose()
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Brainstorm with the council")
@@ -282,6 +420,13 @@ def parse_args():
     parser.add_argument("--style", type=str, default="balanced",
                         choices=["wild", "practical", "balanced"],
                         help="Brainstorming style")
+    parser.add_argument("--pipelined", action="store_true", default=None,
+                        help="Start each model's next round once --min-peers others have ideas")
+    parser.add_argument("--min-peers", type=int,
+                        help="Peer idea sets needed before a pipelined round starts (default: config)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run in-process even if the council daemon is running")
     return parser.parse_args()
 
 
@@ -294,16 +439,31 @@ def main():
 
     if not topic:
         print("Error: No topic provided")
-        print('Usage: council_brainstorm.py "<topic>" [--rounds N] [--style wild|practical|balanced]')
+        print('Usage: council_brainstorm.py "<topic>" [--rounds N] [--style wild|practical|balanced] [--pipelined [--min-peers K]] [--no-cache] [--no-daemon]')
         sys.exit(1)
 
+    import asyncio
+
     try:
-        engine = BrainstormEngine()
-        output = asyncio.run(engine.run_brainstorm(
-            topic=topic,
-            rounds=args.rounds,
-            style=args.style
-        ))
+        output = None
+        if not args.no_daemon:
+            output = daemon_request("brainstorm", {
+                "topic": topic,
+                "rounds": args.rounds,
+                "style": args.style,
+                "pipelined": args.pipelined,
+                "min_peers": args.min_peers,
+                "use_cache": not args.no_cache
+            })
+        if output is None:
+            output = asyncio.run(run_council_brainstorm(
+                topic=topic,
+                rounds=args.rounds,
+                style=args.style,
+                pipelined=args.pipelined,
+                min_peers=args.min_peers,
+                use_cache=not args.no_cache
+            ))
         print(output)
     except ValueError as e:
         print(f"Error: {e}")
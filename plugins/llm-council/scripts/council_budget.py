@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Council Prompt Budget
+
+Keeps prompts that quote other models' output (peer review, synthesis, debate
+verdict) under a token budget. Token counts are estimated from characters;
+when the quoted sections don't fit, small sections are kept verbatim and the
+rest share the remaining budget equally, each compressed with the configured
+strategy:
+
+- truncate:   keep the opening of the section, cut at a paragraph or sentence
+- extractive: keep the highest-scoring sentences, in their original order
+- summarize:  ask a (cheap) model for a summary, falling back to extractive
+"""
+
+import asyncio
+import math
+import re
+from collections import Counter
+from typing import Awaitable, Callable, Optional
+
+# Summarizer callback: (text, target_tokens) -> summary, or None on failure
+Summarizer = Callable[[str, int], Awaitable[Optional[str]]]
+
+DEFAULT_BUDGET = {
+    "enabled": True,
+    "max_prompt_tokens": 32000,
+    "strategy": "extractive",
+    "summarizer_model": None,
+    "chars_per_token": 4,
+}
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(*\-])|\n+")
+_WORD = re.compile(r"[a-z][a-z0-9_\-]{3,}")
+_STOPWORDS = {
+    "that", "this", "with", "from", "have", "will", "would", "should", "could",
+    "their", "there", "these", "those", "which", "when", "what", "where", "about",
+    "into", "more", "also", "than", "then", "them", "they", "been", "being",
+    "your", "some", "such", "very", "just", "only", "other", "each", "most",
+}
+
+
+def estimate_tokens(text: str, chars_per_token: float = 4) -> int:
+    """Rough token count: providers average about four characters per token for English."""
+    return math.ceil(len(text) / chars_per_token) if text else 0
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """Keep the start of `text`, ending on a paragraph or sentence break when one is close."""
+    if len(text) <= max_chars:
+        return text
+
+    marker = "\n\n[... truncated to fit the prompt budget]"
+    head = text[:max(0, max_chars - len(marker))]
+    for boundary in ("\n\n", ". ", "\n"):
+        cut = head.rfind(boundary)
+        if cut >= len(head) * 0.6:
+            head = head[:cut + 1]
+            break
+    return head.rstrip() + marker
+
+
+def extractive_summary(text: str, max_chars: int) -> str:
+    """
+    Select the most informative sentences that fit in `max_chars`.
+
+    Sentences are scored by the frequency of their content words within the
+    section, with a bonus for headings, list items and the opening sentences;
+    the chosen ones are emitted in their original order.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s and s.strip()]
+    if len(sentences) < 2:
+        return truncate(text, max_chars)
+
+    frequencies = Counter(
+        w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS
+    )
+
+    def score(index: int, sentence: str) -> float:
+        words = [w for w in _WORD.findall(sentence.lower()) if w not in _STOPWORDS]
+        value = sum(frequencies[w] for w in words) / math.sqrt(len(words) + 1)
+        if sentence.startswith(("#", "-", "*", "|")) or re.match(r"\d+\.", sentence):
+            value *= 1.5
+        if index < 2:
+            value *= 2.0
+        return value
+
+    marker = "[... condensed to fit the prompt budget]"
+    remaining = max_chars - len(marker) - 1
+    ranked = sorted(range(len(sentences)), key=lambda i: score(i, sentences[i]), reverse=True)
+    chosen = []
+    for index in ranked:
+        cost = len(sentences[index]) + 1
+        if cost <= remaining:
+            chosen.append(index)
+            remaining -= cost
+
+    if not chosen:
+        return truncate(text, max_chars)
+    return "\n".join(sentences[i] for i in sorted(chosen)) + "\n" + marker
+
+
+def allocate(sizes: list[int], available: int) -> list[int]:
+    """
+    Split `available` tokens across sections (water-filling).
+
+    Sections under their fair share keep their full size; what they leave
+    unused is shared equally among the larger ones.
+    """
+    allotted = list(sizes)
+    if sum(sizes) <= available:
+        return allotted
+
+    remaining = max(0, available)
+    pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    while pending:
+        share = remaining // len(pending)
+        index = pending[0]
+        if sizes[index] <= share:
+            allotted[index] = sizes[index]
+            remaining -= sizes[index]
+            pending.pop(0)
+        else:
+            for index in pending:
+                allotted[index] = share
+            break
+    return allotted
+
+
+async def compress_sections(
+    sections: list[str],
+    fixed_text: str,
+    config: Optional[dict] = None,
+    summarize: Optional[Summarizer] = None
+) -> list[str]:
+    """
+    Fit quoted sections into the prompt budget around `fixed_text`.
+
+    `fixed_text` is the prompt with the sections left empty; it always stays
+    intact. Returns the sections unchanged when they already fit or the
+    budget is disabled.
+    """
+    budget = {**DEFAULT_BUDGET, **(config or {})}
+    if not budget.get("enabled") or not budget.get("max_prompt_tokens"):
+        return sections
+
+    chars_per_token = budget.get("chars_per_token") or 4
+    sizes = [estimate_tokens(s, chars_per_token) for s in sections]
+    available = budget["max_prompt_tokens"] - estimate_tokens(fixed_text, chars_per_token)
+    if sum(sizes) <= available:
+        return sections
+
+    allotted = allocate(sizes, available)
+    strategy = budget.get("strategy", "extractive")
+
+    async def compress(text: str, size: int, tokens: int) -> str:
+        if size <= tokens:
+            return text
+        max_chars = int(tokens * chars_per_token)
+        if strategy == "summarize" and summarize is not None:
+            summary = await summarize(text, tokens)
+            if summary and len(summary) <= max_chars:
+                return summary
+            return extractive_summary(summary or text, max_chars)
+        if strategy == "truncate":
+            return truncate(text, max_chars)
+        return extractive_summary(text, max_chars)
+
+    return list(await asyncio.gather(*(
+        compress(text, size, tokens)
+        for text, size, tokens in zip(sections, sizes, allotted)
+    )))
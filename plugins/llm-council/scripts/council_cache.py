@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Council Response Cache
+
+Content-addressed on-disk cache for model responses. Each entry is keyed by a
+hash of everything that determines a completion (provider, model, prompts and
+sampling settings), expires after a TTL, and the cache is capped at a maximum
+number of entries with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "llm-council" / "responses"
+)
+
+
+class ResponseCache:
+    """On-disk response cache with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: float = 86400,
+        max_entries: int = 500
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        schema: Optional[dict] = None
+    ) -> str:
+        """Hash the inputs that determine a completion into a cache key."""
+        fields = [provider, model, system_prompt, prompt, temperature, max_tokens]
+        if schema is not None:
+            fields.append(schema)  # Keys of plain-text calls stay as before
+        payload = json.dumps(fields, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss or expired entry."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch mtime so eviction sees this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response and evict the least recently used entries over the cap."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path(key).with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"created_at": time.time(), "response": response}, f)
+            os.replace(tmp_path, self._path(key))
+            self._evict()
+        except OSError:
+            pass  # A failed write only means a miss next time
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        entries = list(self.cache_dir.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+
+        def mtime(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        entries.sort(key=mtime)
+        for path in entries[:len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Council Daemon Client
+
+Stdlib-only client for the optional council daemon (council_daemon.py). The
+council_* scripts try the daemon first and fall back to running the council
+in-process when no daemon is listening.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "council.json"
+
+
+def daemon_socket_path() -> Path:
+    """
+    Socket the daemon listens on.
+
+    LLM_COUNCIL_SOCKET wins, then `daemon.socket` in council.json, then
+    $XDG_RUNTIME_DIR/llm-council.sock (or ~/.cache/llm-council/daemon.sock).
+    """
+    if os.environ.get("LLM_COUNCIL_SOCKET"):
+        return Path(os.environ["LLM_COUNCIL_SOCKET"]).expanduser()
+
+    try:
+        with open(CONFIG_PATH) as f:
+            configured = json.load(f).get("daemon", {}).get("socket")
+    except (OSError, json.JSONDecodeError):
+        configured = None
+    if configured:
+        return Path(configured).expanduser()
+
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "llm-council.sock"
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_home / "llm-council" / "daemon.sock"
+
+
+def daemon_request(
+    command: str,
+    args: Optional[dict] = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    socket_path: Optional[Path] = None,
+    connect_timeout: float = 0.5
+) -> Optional[Any]:
+    """
+    Run a command on the daemon and return its result.
+
+    Returns None when no daemon is reachable, so callers can fall back to
+    in-process execution. Streamed text is passed to `on_chunk` as it
+    arrives. Errors raised by the command are re-raised here (ValueError
+    stays ValueError, anything else becomes RuntimeError).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = socket_path or daemon_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(connect_timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+
+    with sock, sock.makefile("r", encoding="utf-8") as reader:
+        # The daemon runs provider CLIs in the caller's directory, as in-process runs do
+        request = {"command": command, "args": args or {}, "cwd": os.getcwd()}
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+
+        for line in reader:
+            message = json.loads(line)
+            if "chunk" in message:
+                if on_chunk:
+                    on_chunk(message["chunk"])
+            elif "error" in message:
+                if message.get("type") == "ValueError":
+                    raise ValueError(message["error"])
+                raise RuntimeError(message["error"])
+            else:
+                return message.get("result")
+
+    raise RuntimeError("Council daemon closed the connection before replying")
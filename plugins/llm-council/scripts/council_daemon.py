@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Council Daemon
+
+Optional resident council server on a Unix domain socket. It keeps one
+CouncilEngine warm between commands (config, CLI discovery, pooled HTTP/2
+connections, response cache and rate limiter state), so /council:* commands
+skip per-process startup and cold TLS handshakes. The council_* scripts use
+it automatically when it is running (see council_client.py). Edits to
+models.json or council.json are picked up by the next request: the engines
+are replaced and the old ones closed once no request is using them.
+
+Protocol: one JSON request line per connection, {"command": ..., "args": {...},
+"cwd": caller's working directory (provider CLIs run there)}; the daemon replies with zero or more {"chunk": text} lines followed by either
+{"result": ...} or {"error": message, "type": exception_name}.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from council_client import CONFIG_PATH, daemon_request, daemon_socket_path
+from council_engine import CLI_WORKDIR, CouncilEngine
+from council_ask import run_council_ask
+from council_brainstorm import run_council_brainstorm
+from council_debate import run_council_debate
+from council_decide import run_council_decide
+
+REQUEST_LIMIT = 16 * 1024 * 1024  # Largest request line (long questions arrive via stdin)
+CONFIG_FILES = (CONFIG_PATH.parent / "models.json", CONFIG_PATH)
+
+
+def config_mtimes() -> tuple[Optional[int], ...]:
+    """Modification times of the config files (None for a missing one)."""
+    mtimes = []
+    for path in CONFIG_FILES:
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+class CouncilDaemon:
+    """Serve council commands over a Unix socket from shared, long-lived engines."""
+
+    def __init__(self, socket_path: Path, idle_timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.last_activity = self.started_at
+        self.active = 0
+        self.served = 0
+        self._engines: dict[bool, CouncilEngine] = {}  # use_cache -> engine
+        self._retired: list[CouncilEngine] = []  # Replaced after a config edit, closed when idle
+        self._config_mtimes = config_mtimes()
+        self._stop = asyncio.Event()
+
+    def _engine(self, use_cache: bool) -> CouncilEngine:
+        """Shared engine for cached or uncached runs, created on first use or after a config edit."""
+        mtimes = config_mtimes()
+        if mtimes != self._config_mtimes:
+            self._config_mtimes = mtimes
+            for engine in self._engines.values():
+                engine.health.save()  # The new engines load it back from disk
+            self._retired.extend(self._engines.values())
+            self._engines.clear()
+
+        engine = self._engines.get(use_cache)
+        if engine is None:
+            # Both engines share one health registry (history, circuits, rotation)
+            shared = next((e.health for e in self._engines.values()), None)
+            engine = CouncilEngine(use_cache=use_cache, health=shared)
+            self._engines[use_cache] = engine
+        return engine
+
+    def status(self) -> dict:
+        """Process and load information reported by `status`."""
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "active_requests": self.active,
+            "requests_served": self.served,
+            "warm_origins": sorted({o for e in self._engines.values() for o in e._clients}),
+            "open_circuits": next((e.health.open_circuits() for e in self._engines.values()), {}),
+        }
+
+    async def _dispatch(self, command: str, args: dict, emit: Callable[[str], None]) -> Any:
+        """Run one command against the shared engine; the engine is never closed here."""
+        if command == "ping":
+            return self.status()
+        if command == "shutdown":
+            self._stop.set()
+            return {"stopping": True}
+
+        engine = self._engine(args.get("use_cache", True))
+        if command == "ask":
+            return await run_council_ask(
+                question=args.get("question"),
+                quick=args.get("quick", False),
+                chairman=args.get("chairman"),
+                stream=args.get("stream", False),
+                metrics=args.get("metrics", False),
+                engine=engine,
+                write=emit,
+                speculative=args.get("speculative"),
+                replay=args.get("replay"),
+                replay_stage=args.get("replay_stage", "stage_3")
+            )
+        if command == "debate":
+            return await run_council_debate(
+                topic=args["topic"],
+                rounds=args.get("rounds", 2),
+                positions=args.get("positions"),
+                history=args.get("history"),
+                engine=engine
+            )
+        if command == "brainstorm":
+            return await run_council_brainstorm(
+                topic=args["topic"],
+                rounds=args.get("rounds", 2),
+                style=args.get("style", "balanced"),
+                pipelined=args.get("pipelined"),
+                min_peers=args.get("min_peers"),
+                engine=engine
+            )
+        if command == "decide":
+            return await run_council_decide(
+                decision=args["decision"],
+                options=args["options"],
+                criteria=args.get("criteria"),
+                engine=engine
+            )
+        raise ValueError(f"Unknown daemon command: {command}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve a single request connection."""
+        self.active += 1
+        self.last_activity = time.time()
+
+        def send(message: dict) -> None:
+            if not writer.is_closing():
+                writer.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+
+        try:
+            request = json.loads(await reader.readline())
+            CLI_WORKDIR.set(request.get("cwd") or ".")  # This connection's task only
+            result = await self._dispatch(
+                request.get("command"),
+                request.get("args") or {},
+                lambda text: send({"chunk": text})
+            )
+            send({"result": result})
+        except Exception as e:
+            send({"error": str(e), "type": type(e).__name__})
+        finally:
+            self.active -= 1
+            self.served += 1
+            self.last_activity = time.time()
+            with contextlib.suppress(ConnectionError):
+                await writer.drain()
+            writer.close()
+            if self.active == 0:
+                await self._close_retired()
+
+    async def _close_retired(self) -> None:
+        """Close engines replaced after a config edit."""
+        retired, self._retired = self._retired, []
+        for engine in retired:
+            await engine.aclose()
+
+    async def _wait_for_stop(self) -> None:
+        """Return on `shutdown`, or once idle for longer than idle_timeout."""
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=5)
+                return
+            except asyncio.TimeoutError:
+                idle = time.time() - self.last_activity
+                if self.idle_timeout and self.active == 0 and idle > self.idle_timeout:
+                    return
+
+    async def serve(self) -> None:
+        """Listen until shut down, then close the engines and remove the socket."""
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if daemon_request("ping", socket_path=self.socket_path) is not None:
+                raise RuntimeError(f"Council daemon already running on {self.socket_path}")
+            self.socket_path.unlink()  # Stale socket from a crashed daemon
+
+        server = await asyncio.start_unix_server(
+            self._handle, path=str(self.socket_path), limit=REQUEST_LIMIT
+        )
+        os.chmod(self.socket_path, 0o600)
+        try:
+            async with server:
+                await self._wait_for_stop()
+        finally:
+            self.socket_path.unlink(missing_ok=True)
+            await self._close_retired()
+            for engine in self._engines.values():
+                await engine.aclose()
+
+
+def load_daemon_config() -> dict:
+    """The `daemon` section of council.json."""
+    try:
+        with open(CONFIG_PATH) as f:
+            return json.load(f).get("daemon", {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def start_daemon(socket_path: Path, idle_timeout: Optional[float]) -> int:
+    """Launch `serve` detached from this terminal and wait until it answers."""
+    status = daemon_request("ping", socket_path=socket_path)
+    if status is not None:
+        print(f"Council daemon already running (pid {status['pid']}) on {socket_path}")
+        return 0
+
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    log_path = socket_path.with_suffix(".log")
+    cmd = [sys.executable, str(Path(__file__).resolve()), "serve", "--socket", str(socket_path)]
+    if idle_timeout is not None:
+        cmd += ["--idle-timeout", str(idle_timeout)]
+
+    with open(log_path, "a") as log:
+        subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+
+    for _ in range(100):
+        time.sleep(0.1)
+        status = daemon_request("ping", socket_path=socket_path)
+        if status is not None:
+            print(f"Council daemon started (pid {status['pid']}) on {socket_path}")
+            return 0
+
+    print(f"Error: Council daemon did not start; see {log_path}")
+    return 1
+
+
+def parse_args():
+    """Parse command line arguments."""
+    config = load_daemon_config()
+    parser = argparse.ArgumentParser(description="Run the council as a resident daemon")
+    parser.add_argument("action", choices=["start", "stop", "status", "serve"],
+                        help="start in the background, stop, report status, or serve in the foreground")
+    parser.add_argument("--socket", type=str, help="Unix socket path (default: see council_client.py)")
+    parser.add_argument("--idle-timeout", type=float, default=config.get("idle_timeout_seconds"),
+                        help="Exit after this many idle seconds (default: daemon.idle_timeout_seconds)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if not hasattr(asyncio, "start_unix_server"):
+        print("Error: The council daemon needs Unix domain sockets, which this platform lacks")
+        sys.exit(1)
+
+    socket_path = Path(args.socket).expanduser() if args.socket else daemon_socket_path()
+
+    if args.action == "start":
+        sys.exit(start_daemon(socket_path, args.idle_timeout))
+
+    if args.action == "status":
+        status = daemon_request("ping", socket_path=socket_path)
+        if status is None:
+            print(f"Council daemon not running ({socket_path})")
+            sys.exit(1)
+        print(json.dumps(status, indent=2))
+        return
+
+    if args.action == "stop":
+        if daemon_request("shutdown", socket_path=socket_path) is None:
+            print(f"Council daemon not running ({socket_path})")
+            sys.exit(1)
+        print("Council daemon stopping")
+        return
+
+    try:
+        asyncio.run(CouncilDaemon(socket_path, args.idle_timeout).serve())
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
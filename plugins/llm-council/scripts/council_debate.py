@@ -5,31 +5,47 @@ Council Debate Command Handler
 Executes the /council:debate command for structured debates.
 """
 
-import asyncio
 import argparse
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from council_engine import CouncilEngine, CouncilResult
+from council_client import daemon_request
+
+if TYPE_CHECKING:
+    from council_engine import CouncilEngine  # Runtime import in DebateEngine
 
 
 class DebateEngine:
     """Extended council engine for multi-round debates."""
 
-    def __init__(self):
-        self.engine = CouncilEngine()
+    def __init__(self, use_cache: bool = True, engine: Optional["CouncilEngine"] = None):
+        from council_engine import CouncilEngine
+
+        self.engine = engine or CouncilEngine(use_cache=use_cache)
+        self._round_summaries: dict[int, str] = {}  # round index -> condensed text (rolling history)
 
     async def run_debate(
         self,
         topic: str,
         rounds: int = 2,
-        positions: Optional[list[str]] = None
+        positions: Optional[list[str]] = None,
+        history_mode: Optional[str] = None
     ) -> str:
-        """Execute full debate workflow."""
+        """
+        Execute full debate workflow.
+
+        `history_mode` (default: council.json `debate.history_mode`) controls
+        what rebuttal prompts quote: "full" resends every earlier round
+        verbatim, "rolling" sends only the latest round verbatim and each
+        older round as a summary computed once and reused.
+        """
         models = self.engine.get_enabled_models()
+        debate_config = self.engine.council_config.get("debate", {})
+        history_mode = history_mode or debate_config.get("history_mode", "full")
+        self._round_summaries = {}
 
         if len(models) < 2:
             raise ValueError("Debate requires at least 2 enabled models")
@@ -44,33 +60,41 @@ class DebateEngine:
         opening_prompt = self._build_opening_prompt(topic, position_assignments)
         opening_responses = await self.engine.run_stage_1(
             opening_prompt,
-            "You are participating in a structured debate. Present your position clearly with evidence."
+            "You are participating in a structured debate. Present your position clearly with evidence.",
+            stage="opening"
         )
 
         # Build debate history
         debate_history = self._format_responses_for_context(opening_responses)
+        history_rounds = [("Opening Statements", opening_responses)]
 
         # Rebuttal rounds
         rebuttal_responses = []
         for round_num in range(rounds - 1):
+            if history_mode == "rolling":
+                # Built once per round and shared by every debater's prompt
+                debate_history = await self._rolling_history(history_rounds)
             rebuttal_prompt = self._build_rebuttal_prompt(
                 topic, debate_history, round_num + 1
             )
             round_responses = await self.engine.run_stage_1(
                 rebuttal_prompt,
-                "You are in the rebuttal phase. Address counterarguments and strengthen your position."
+                "You are in the rebuttal phase. Address counterarguments and strengthen your position.",
+                stage=f"rebuttal_{round_num + 1}"
             )
             rebuttal_responses.append(round_responses)
+            history_rounds.append((f"Rebuttal Round {round_num + 1}", round_responses))
             debate_history += "\n\n" + self._format_responses_for_context(round_responses)
 
         # Peer evaluation of final positions
         all_responses = opening_responses + [r for batch in rebuttal_responses for r in batch]
-        peer_reviews, mapping = await self.engine.run_stage_2(
+        peer_reviews, mapping, _ = await self.engine.run_stage_2(
             topic, opening_responses, models
         )
 
         # Chairman verdict
-        chairman = self.engine.select_chairman(models)
+        last_round = rebuttal_responses[-1] if rebuttal_responses else opening_responses
+        chairman = self.engine.select_chairman(models, warm=self.engine.warm_models(last_round))
         verdict = await self._get_chairman_verdict(
             topic, opening_responses, rebuttal_responses, peer_reviews, mapping, chairman
         )
@@ -128,15 +152,55 @@ Be respectful but incisive. Focus on the arguments, not the debaters.
 
     def _format_responses_for_context(self, responses) -> str:
         """Format responses for inclusion in subsequent prompts."""
+        from council_engine import anonymous_id
+
         lines = []
         for i, resp in enumerate(responses):
             if not resp.error:
-                anon_id = f"Debater {chr(65 + i)}"
-                lines.append(f"### {anon_id}")
+                lines.append(f"### {anonymous_id(i, 'Debater')}")
                 lines.append(resp.response)
                 lines.append("")
         return "\n".join(lines)
 
+    async def _rolling_history(self, history_rounds: list[tuple[str, list]]) -> str:
+        """Debate history with older rounds condensed (each summarized once) and the latest verbatim."""
+        *older, (latest_title, latest) = history_rounds
+        parts = []
+        for index, (title, responses) in enumerate(older):
+            if index not in self._round_summaries:
+                self._round_summaries[index] = await self._condense_round(responses)
+            parts.append(f"## {title} (condensed)\n\n{self._round_summaries[index]}")
+        parts.append(f"## {latest_title}\n\n{self._format_responses_for_context(latest)}")
+        return "\n\n".join(parts)
+
+    async def _condense_round(self, responses) -> str:
+        """
+        Condense one round to `debate.summary_tokens` with `debate.summary_strategy`.
+
+        Each debater is condensed separately so the Debater labels match the
+        verbatim rounds.
+        """
+        from council_budget import compress_sections
+        from council_engine import anonymous_id
+
+        debate_config = self.engine.council_config.get("debate", {})
+        budget = {
+            **self.engine.council_config.get("prompt_budget", {}),
+            "enabled": True,
+            "max_prompt_tokens": debate_config.get("summary_tokens", 800),
+            "strategy": debate_config.get("summary_strategy", "extractive"),
+        }
+
+        labelled = [
+            (anonymous_id(i, "Debater"), resp.response)
+            for i, resp in enumerate(responses) if not resp.error
+        ]
+        texts = await compress_sections(
+            [text for _, text in labelled], "", budget,
+            summarize=self.engine.summarize_section
+        )
+        return "\n\n".join(f"### {label}\n{text}" for (label, _), text in zip(labelled, texts))
+
     async def _get_chairman_verdict(
         self,
         topic: str,
@@ -147,19 +211,43 @@ Be respectful but incisive. Focus on the arguments, not the debaters.
         chairman: dict
     ) -> str:
         """Get chairman's verdict on the debate."""
-        # Format all arguments
-        all_arguments = "## Opening Statements\n"
-        for resp in opening:
-            if not resp.error:
-                all_arguments += f"\n### {resp.model_name}\n{resp.response}\n"
+        rounds = [("Opening Statements", opening)] + [
+            (f"Rebuttal Round {i + 1}", round_responses)
+            for i, round_responses in enumerate(rebuttals)
+        ]
+        arguments = [resp for _, batch in rounds for resp in batch if not resp.error]
 
-        for i, round_responses in enumerate(rebuttals):
-            all_arguments += f"\n## Rebuttal Round {i + 1}\n"
-            for resp in round_responses:
+        # Condense long arguments so the verdict prompt fits prompt_budget
+        fixed_text = self._build_verdict_prompt(topic, rounds, [""] * len(arguments))
+        texts = await self.engine.fit_prompt_budget([r.response for r in arguments], fixed_text)
+
+        verdict_prompt = self._build_verdict_prompt(topic, rounds, texts)
+
+        response = await self.engine.call_model(
+            chairman, verdict_prompt,
+            "You are a fair and analytical debate judge.",
+            stage="verdict"
+        )
+        return response.response if not response.error else "Verdict generation failed."
+
+    def _build_verdict_prompt(
+        self,
+        topic: str,
+        rounds: list[tuple[str, list]],
+        texts: list[str]
+    ) -> str:
+        """Build the chairman verdict prompt, quoting `texts` for the successful responses in order."""
+        quoted = iter(texts)
+        sections = []
+        for title, responses in rounds:
+            section = f"## {title}\n"
+            for resp in responses:
                 if not resp.error:
-                    all_arguments += f"\n### {resp.model_name}\n{resp.response}\n"
+                    section += f"\n### {resp.model_name}\n{next(quoted)}\n"
+            sections.append(section)
+        all_arguments = "\n".join(sections)
 
-        verdict_prompt = f"""You are the Chairman of this debate. Review all arguments and provide your verdict.
+        return f"""You are the Chairman of this debate. Review all arguments and provide your verdict.
 
 ## Topic
 {topic}
@@ -177,12 +265,6 @@ Provide:
 Be balanced but decisive. It's okay to declare a winner if one position was clearly stronger.
 """
 
-        response = await self.engine.call_model(
-            chairman, verdict_prompt,
-            "You are a fair and analytical debate judge."
-        )
-        return response.response if not response.error else "Verdict generation failed."
-
     def _format_debate_output(
         self,
         topic: str,
@@ -241,12 +323,40 @@ Be balanced but decisive. It's okay to declare a winner if one position was clea
         return "\n".join(lines)
 
 
+async def run_council_debate(
+    topic: str,
+    rounds: int = 2,
+    positions: Optional[list[str]] = None,
+    use_cache: bool = True,
+    engine: Optional["CouncilEngine"] = None,
+    history: Optional[str] = None
+) -> str:
+    """
+    Execute council debate workflow.
+
+    A caller-supplied `engine` (the daemon's) is shared and left open.
+    """
+    debate = DebateEngine(use_cache=use_cache, engine=engine)
+    try:
+        return await debate.run_debate(
+            topic=topic, rounds=rounds, positions=positions, history_mode=history
+        )
+    finally:
+        if engine is None:
+            await debate.engine.aclose()
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Run a council debate")
     parser.add_argument("topic", nargs="?", help="The debate topic")
     parser.add_argument("--rounds", type=int, default=2, help="Number of rounds")
     parser.add_argument("--positions", type=str, help="Comma-separated positions")
+    parser.add_argument("--history", type=str, choices=["full", "rolling"],
+                        help="Rebuttal context: full history, or rolling summaries (default: config)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run in-process even if the council daemon is running")
     return parser.parse_args()
 
 
@@ -259,18 +369,31 @@ def main():
 
     if not topic:
         print("Error: No topic provided")
-        print("Usage: council_debate.py \"<topic>\" [--rounds N] [--positions a,b,c]")
+        print("Usage: council_debate.py \"<topic>\" [--rounds N] [--positions a,b,c] [--history full|rolling] [--no-cache] [--no-daemon]")
         sys.exit(1)
 
     positions = args.positions.split(",") if args.positions else None
 
+    import asyncio
+
     try:
-        debate = DebateEngine()
-        output = asyncio.run(debate.run_debate(
-            topic=topic,
-            rounds=args.rounds,
-            positions=positions
-        ))
+        output = None
+        if not args.no_daemon:
+            output = daemon_request("debate", {
+                "topic": topic,
+                "rounds": args.rounds,
+                "positions": positions,
+                "history": args.history,
+                "use_cache": not args.no_cache
+            })
+        if output is None:
+            output = asyncio.run(run_council_debate(
+                topic=topic,
+                rounds=args.rounds,
+                positions=positions,
+                history=args.history,
+                use_cache=not args.no_cache
+            ))
         print(output)
     except ValueError as e:
         print(f"Error: {e}")
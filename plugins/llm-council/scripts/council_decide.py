@@ -5,17 +5,18 @@ Council Decide Command Handler
 Executes the /council:decide command for decision support with pros/cons.
 """
 
-import asyncio
 import argparse
-import json
-import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from council_engine import CouncilEngine
+from council_client import daemon_request
+from council_schema import decision_analysis_schema
+
+if TYPE_CHECKING:
+    from council_engine import CouncilEngine, ModelResponse  # Imported by DecisionEngine itself
 
 
 class DecisionEngine:
@@ -23,8 +24,10 @@ class DecisionEngine:
 
     DEFAULT_CRITERIA = ["feasibility", "cost", "complexity", "maintainability"]
 
-    def __init__(self):
-        self.engine = CouncilEngine()
+    def __init__(self, use_cache: bool = True, engine: Optional["CouncilEngine"] = None):
+        from council_engine import CouncilEngine
+
+        self.engine = engine or CouncilEngine(use_cache=use_cache)
 
     async def run_decision(
         self,
@@ -48,25 +51,26 @@ class DecisionEngine:
         analysis_prompt = self._build_analysis_prompt(decision, options, criteria)
         responses = await self.engine.run_stage_1(
             analysis_prompt,
-            "You are a technical analyst. Provide objective, evidence-based analysis."
+            "You are a technical analyst. Provide objective, evidence-based analysis.",
+            stage="analysis",
+            schema=decision_analysis_schema(options, criteria)
         )
 
-        # Parse analyses
         analyses = []
         for resp in responses:
             if not resp.error:
-                parsed = self._parse_analysis(resp.response, options, criteria)
-                parsed["model"] = resp.model_name
-                analyses.append(parsed)
+                analysis = self._analysis_from_response(resp)
+                analysis["model"] = resp.model_name
+                analyses.append(analysis)
 
         # Stage 2: Peer review of analyses
-        reviews, mapping = await self.engine.run_stage_2(
+        reviews, mapping, _ = await self.engine.run_stage_2(
             f"Decision: {decision}\nOptions: {', '.join(options)}",
             responses, models
         )
 
         # Chairman synthesis
-        chairman = self.engine.select_chairman(models)
+        chairman = self.engine.select_chairman(models, warm=self.engine.warm_models(responses))
         recommendation = await self._get_chairman_recommendation(
             decision, options, criteria, analyses, chairman
         )
@@ -105,60 +109,24 @@ class DecisionEngine:
 
 3. **Provide your recommendation** with reasoning
 
-Format your response as JSON:
-```json
-{{
-  "scores": {{
-    "Option1": {{"criterion1": 8, "criterion2": 7, ...}},
-    "Option2": {{"criterion1": 6, "criterion2": 9, ...}}
-  }},
-  "pros_cons": {{
-    "Option1": {{
-      "pros": ["pro1", "pro2", "pro3"],
-      "cons": ["con1", "con2", "con3"]
-    }},
-    "Option2": {{
-      "pros": ["..."],
-      "cons": ["..."]
-    }}
-  }},
-  "recommendation": "Option1",
-  "reasoning": "Your detailed reasoning here..."
-}}
-```
+Answer with `scores` (option -> criterion -> score), `pros_cons` (option ->
+`pros` and `cons`), the recommended option in `recommendation` and your
+`reasoning`, using the option and criterion names exactly as listed above.
 
 Be objective and thorough. Consider real-world implications.
 """
 
-    def _parse_analysis(
-        self,
-        response: str,
-        options: list[str],
-        criteria: list[str]
-    ) -> dict:
-        """Parse model analysis from response."""
-        try:
-            # Extract JSON from response
-            json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group(1))
-            else:
-                data = json.loads(response)
-
-            return {
-                "scores": data.get("scores", {}),
-                "pros_cons": data.get("pros_cons", {}),
-                "recommendation": data.get("recommendation", ""),
-                "reasoning": data.get("reasoning", "")
-            }
-        except (json.JSONDecodeError, KeyError):
-            # Return empty structure if parsing fails
-            return {
-                "scores": {},
-                "pros_cons": {},
-                "recommendation": "",
-                "reasoning": response[:500]  # Use raw response as reasoning
-            }
+    def _analysis_from_response(self, resp: "ModelResponse") -> dict:
+        """Analysis fields from a call_structured response."""
+        if resp.data is not None:
+            return dict(resp.data)
+        # Still invalid after the repair request: keep the answer as prose
+        return {
+            "scores": {},
+            "pros_cons": {},
+            "recommendation": "",
+            "reasoning": resp.response
+        }
 
     async def _get_chairman_recommendation(
         self,
@@ -202,7 +170,8 @@ Be decisive but acknowledge trade-offs.
 
         response = await self.engine.call_model(
             chairman, recommendation_prompt,
-            "You are a senior technical advisor making a final recommendation."
+            "You are a senior technical advisor making a final recommendation.",
+            stage="recommendation"
         )
         return response.response if not response.error else "Recommendation failed."
 
@@ -292,21 +261,31 @@ Be decisive but acknowledge trade-offs.
         options: list[str],
         criteria: list[str]
     ) -> dict[str, float]:
-        """Aggregate scores across all analyses."""
-        totals = {opt: [] for opt in options}
-
-        for analysis in analyses:
-            scores = analysis.get("scores", {})
-            for opt in options:
-                opt_scores = scores.get(opt, {})
-                total = sum(opt_scores.get(c, 0) for c in criteria)
-                if total > 0:
-                    totals[opt].append(total)
-
-        return {
-            opt: sum(vals) / len(vals) if vals else 0
-            for opt, vals in totals.items()
-        }
+        """Mean total score per option across the analyses that scored every criterion."""
+        from council_scoring import ScoreMatrix
+
+        means = ScoreMatrix.from_analyses(analyses, options, criteria).stats()["mean_total"]
+        return {opt: means[opt] or 0 for opt in options}
+
+
+async def run_council_decide(
+    decision: str,
+    options: list[str],
+    criteria: Optional[list[str]] = None,
+    use_cache: bool = True,
+    engine: Optional["CouncilEngine"] = None
+) -> str:
+    """
+    Execute council decision workflow.
+
+    A caller-supplied `engine` (the daemon's) is shared and left open.
+    """
+    decider = DecisionEngine(use_cache=use_cache, engine=engine)
+    try:
+        return await decider.run_decision(decision=decision, options=options, criteria=criteria)
+    finally:
+        if engine is None:
+            await decider.engine.aclose()
 
 
 def parse_args():
@@ -315,6 +294,9 @@ def parse_args():
     parser.add_argument("decision", nargs="?", help="The decision to make")
     parser.add_argument("--options", type=str, required=True, help="Comma-separated options")
     parser.add_argument("--criteria", type=str, help="Comma-separated criteria")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run in-process even if the council daemon is running")
     return parser.parse_args()
 
 
@@ -327,19 +309,30 @@ def main():
 
     if not decision:
         print("Error: No decision provided")
-        print('Usage: council_decide.py "<decision>" --options "a,b,c" [--criteria "x,y,z"]')
+        print('Usage: council_decide.py "<decision>" --options "a,b,c" [--criteria "x,y,z"] [--no-cache] [--no-daemon]')
         sys.exit(1)
 
     options = [o.strip() for o in args.options.split(",")]
     criteria = [c.strip() for c in args.criteria.split(",")] if args.criteria else None
 
+    import asyncio
+
     try:
-        engine = DecisionEngine()
-        output = asyncio.run(engine.run_decision(
-            decision=decision,
-            options=options,
-            criteria=criteria
-        ))
+        output = None
+        if not args.no_daemon:
+            output = daemon_request("decide", {
+                "decision": decision,
+                "options": options,
+                "criteria": criteria,
+                "use_cache": not args.no_cache
+            })
+        if output is None:
+            output = asyncio.run(run_council_decide(
+                decision=decision,
+                options=options,
+                criteria=criteria,
+                use_cache=not args.no_cache
+            ))
         print(output)
     except ValueError as e:
         print(f"Error: {e}")
@@ -8,40 +8,64 @@ Core three-stage execution engine implementing Karpathy's council pattern:
 3. Chairman Synthesis - Designated model creates final answer
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
+import contextvars
+import functools
+import importlib.util
 import json
 import os
 import random
 import shutil
-import subprocess
+import signal
 import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Optional
-import httpx
-
-try:
-    from dotenv import load_dotenv
-
-    # Search for .env in multiple locations
-    _script_dir = Path(__file__).parent
-    _env_locations = [
-        _script_dir.parent / "config" / ".env",  # plugins/llm-council/config/.env
-        _script_dir.parent.parent.parent / ".env",  # claude-marketplace/.env (project root)
-    ]
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+from council_budget import compress_sections, estimate_tokens
+from council_cache import ResponseCache
+from council_health import DEFAULT_HEALTH_PATH, HealthRegistry
+from council_limits import RETRYABLE_STATUS, RateLimiter, RateLimitError
+from council_store import RunStore
+from council_topology import assign_reviews
+from council_schema import (
+    apply_schema, check_answer, peer_review_schema, repair_prompt, schema_instructions
+)
+
+if TYPE_CHECKING:
+    import httpx  # Imported on first API call; see _get_client
+    from council_scoring import ScoreMatrix  # Imports NumPy; see score_matrix
+
+# Search for .env in multiple locations
+_ENV_LOCATIONS = [
+    Path(__file__).parent.parent / "config" / ".env",  # plugins/llm-council/config/.env
+    Path(__file__).parent.parent.parent.parent / ".env",  # claude-marketplace/.env (project root)
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load API keys from the first .env found, once per process (first engine created)."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # python-dotenv not installed, use shell env only
 
-    for _env_file in _env_locations:
-        if _env_file.exists():
-            load_dotenv(_env_file)
+    for env_file in _ENV_LOCATIONS:
+        if env_file.exists():
+            load_dotenv(env_file)
             break
     else:
         load_dotenv()  # Fallback to current directory
-except ImportError:
-    pass  # python-dotenv not installed, use shell env only
 
 
-# Check for available CLI tools
+# Check for available CLI tools (memoized: discovery runs on first use, once per name)
+@functools.lru_cache(maxsize=None)
 def _find_cli(name: str) -> Optional[str]:
     """Find CLI tool, checking for .cmd on Windows."""
     if sys.platform == "win32":
@@ -50,20 +74,141 @@ def _find_cli(name: str) -> Optional[str]:
             return cmd_name
     return shutil.which(name)
 
-CODEX_CLI = _find_cli("codex")
-GEMINI_CLI = _find_cli("gemini")
-CLAUDE_CLI = _find_cli("claude")
 
+# Provider -> CLI tried before its HTTP API
+PROVIDER_CLIS = {"openai": "codex", "google": "gemini", "anthropic": "claude"}
+
+
+# Background circuit probe: the smallest request that proves a path answers
+PROBE_PROMPT = "Reply with OK."
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a failed API call points at the provider being down rather than at the request."""
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+@functools.lru_cache(maxsize=None)
+def _http2_available() -> bool:
+    """Whether h2 is installed (enables HTTP/2 in httpx); otherwise HTTP/1.1 keep-alive."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# Generous line limit: some CLIs emit their whole JSON result on one line
+_CLI_STREAM_LIMIT = 16 * 1024 * 1024
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """Kill a CLI subprocess and everything it spawned."""
+    if proc.returncode is not None:
+        return
+    try:
+        if sys.platform == "win32":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _run_cli_async(
+    cmd: list[str],
+    workdir: str = ".",
+    timeout: int = 120,
+    on_output: Optional[Callable[[str], None]] = None
+) -> tuple[int, str, str]:
+    """
+    Run a CLI as a native asyncio subprocess and return (returncode, stdout, stderr).
 
-def _run_codex_cli_sync(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
+    stdout is read incrementally; each line is passed to `on_output` as soon
+    as it arrives. The CLI runs in its own process group, so a timeout or a
+    cancelled task kills it together with any children instead of leaving a
+    blocked thread behind. Raises asyncio.TimeoutError on timeout.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=workdir,
+        limit=_CLI_STREAM_LIMIT,
+        start_new_session=sys.platform != "win32",
+    )
+
+    stdout_lines = []
+
+    async def read_stdout():
+        async for raw_line in proc.stdout:
+            line = raw_line.decode("utf-8", errors="replace")
+            stdout_lines.append(line)
+            if on_output:
+                on_output(line)
+
+    readers = asyncio.gather(read_stdout(), proc.stderr.read())
+    try:
+        _, stderr = await asyncio.wait_for(readers, timeout=timeout)
+        returncode = await proc.wait()
+    except BaseException:
+        # Timeout or cancellation (e.g. a hedged call that lost the race)
+        _kill_process_group(proc)
+        readers.cancel()
+        await asyncio.gather(readers, proc.wait(), return_exceptions=True)
+        raise
+
+    return returncode, "".join(stdout_lines), stderr.decode("utf-8", errors="replace")
+
+
+def _parse_codex_output(stdout: str) -> str:
+    """Extract the assistant message from Codex --json event lines."""
+    # Codex --json returns newline-delimited JSON events
+    response_text = ""
+    for line in stdout.strip().split('\n'):
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+            if event.get('type') == 'message' and event.get('role') == 'assistant':
+                response_text = event.get('content', '')
+            elif 'message' in event:
+                response_text = event.get('message', '')
+        except json.JSONDecodeError:
+            response_text = line
+
+    if not response_text and stdout:
+        response_text = stdout.strip()
+    return response_text
+
+
+def _parse_gemini_output(stdout: str) -> str:
+    """Extract the response from Gemini --output-format json."""
+    if not stdout:
+        return ""
+    try:
+        data = json.loads(stdout)
+        return data.get('response', data.get('text', json.dumps(data)))
+    except json.JSONDecodeError:
+        return stdout.strip()
+
+
+async def run_codex_cli_async(
+    prompt: str,
+    workdir: str = ".",
+    timeout: int = 120,
+    on_output: Optional[Callable[[str], None]] = None
+) -> tuple[bool, str, str]:
     """
-    Run Codex CLI synchronously and return (success, response, error).
+    Run Codex CLI asynchronously and return (success, response, error).
     """
-    if not CODEX_CLI:
+    codex_cli = _find_cli("codex")
+    if not codex_cli:
         return False, "", "codex CLI not found"
 
     cmd = [
-        CODEX_CLI, "exec",
+        codex_cli, "exec",
         "--full-auto",
         "--json",
         "--sandbox", "read-only",
@@ -73,142 +218,145 @@ def _run_codex_cli_sync(prompt: str, workdir: str = ".", timeout: int = 120) ->
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=workdir
-        )
-
-        # Codex --json returns newline-delimited JSON events
-        response_text = ""
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-                if event.get('type') == 'message' and event.get('role') == 'assistant':
-                    response_text = event.get('content', '')
-                elif 'message' in event:
-                    response_text = event.get('message', '')
-            except json.JSONDecodeError:
-                response_text = line
-
-        if not response_text and result.stdout:
-            response_text = result.stdout.strip()
-
-        if result.returncode == 0 and response_text:
-            return True, response_text, ""
-        return False, response_text, result.stderr or "Codex returned no response"
-
-    except subprocess.TimeoutExpired:
+        returncode, stdout, stderr = await _run_cli_async(cmd, workdir, timeout, on_output)
+    except asyncio.TimeoutError:
         return False, "", f"Timeout after {timeout}s"
     except Exception as e:
         return False, "", str(e)
 
+    response_text = _parse_codex_output(stdout)
+    if returncode == 0 and response_text:
+        return True, response_text, ""
+    return False, response_text, stderr or "Codex returned no response"
+
 
-def _run_gemini_cli_sync(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
+async def run_gemini_cli_async(
+    prompt: str,
+    workdir: str = ".",
+    timeout: int = 120,
+    on_output: Optional[Callable[[str], None]] = None
+) -> tuple[bool, str, str]:
     """
-    Run Gemini CLI synchronously and return (success, response, error).
+    Run Gemini CLI asynchronously and return (success, response, error).
     """
-    if not GEMINI_CLI:
+    gemini_cli = _find_cli("gemini")
+    if not gemini_cli:
         return False, "", "gemini CLI not found"
 
     cmd = [
-        GEMINI_CLI,
+        gemini_cli,
         prompt,
         "--output-format", "json",
         "--approval-mode", "yolo"
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=workdir
-        )
-
-        response_text = ""
-        if result.stdout:
-            try:
-                data = json.loads(result.stdout)
-                response_text = data.get('response', data.get('text', json.dumps(data)))
-            except json.JSONDecodeError:
-                response_text = result.stdout.strip()
-
-        if result.returncode == 0 and response_text:
-            return True, response_text, ""
-        return False, response_text, result.stderr or "Gemini returned no response"
-
-    except subprocess.TimeoutExpired:
+        returncode, stdout, stderr = await _run_cli_async(cmd, workdir, timeout, on_output)
+    except asyncio.TimeoutError:
         return False, "", f"Timeout after {timeout}s"
     except Exception as e:
         return False, "", str(e)
 
-
-async def run_codex_cli_async(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
-    """
-    Run Codex CLI asynchronously (non-blocking).
-    Wraps sync subprocess call in executor for parallel execution.
-    """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _run_codex_cli_sync, prompt, workdir, timeout)
-
-
-async def run_gemini_cli_async(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
-    """
-    Run Gemini CLI asynchronously (non-blocking).
-    Wraps sync subprocess call in executor for parallel execution.
-    """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _run_gemini_cli_sync, prompt, workdir, timeout)
+    response_text = _parse_gemini_output(stdout)
+    if returncode == 0 and response_text:
+        return True, response_text, ""
+    return False, response_text, stderr or "Gemini returned no response"
 
 
-def _run_claude_cli_sync(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
+async def run_claude_cli_async(
+    prompt: str,
+    workdir: str = ".",
+    timeout: int = 120,
+    on_output: Optional[Callable[[str], None]] = None
+) -> tuple[bool, str, str]:
     """
-    Run Claude Code CLI synchronously and return (success, response, error).
+    Run Claude Code CLI asynchronously and return (success, response, error).
     """
-    if not CLAUDE_CLI:
+    claude_cli = _find_cli("claude")
+    if not claude_cli:
         return False, "", "claude CLI not found"
 
     cmd = [
-        CLAUDE_CLI,
+        claude_cli,
         "--print",  # Print response and exit
         "--dangerously-skip-permissions",
         prompt
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=workdir
-        )
-
-        response_text = result.stdout.strip() if result.stdout else ""
-
-        if result.returncode == 0 and response_text:
-            return True, response_text, ""
-        return False, response_text, result.stderr or "Claude returned no response"
-
-    except subprocess.TimeoutExpired:
+        returncode, stdout, stderr = await _run_cli_async(cmd, workdir, timeout, on_output)
+    except asyncio.TimeoutError:
         return False, "", f"Timeout after {timeout}s"
     except Exception as e:
         return False, "", str(e)
 
+    response_text = stdout.strip()
+    if returncode == 0 and response_text:
+        return True, response_text, ""
+    return False, response_text, stderr or "Claude returned no response"
+
+
+def anonymous_id(index: int, prefix: str = "Response") -> str:
+    """
+    Label for the index-th anonymized item: A-Z, then AA, AB, ... like
+    spreadsheet columns, so councils of any size get distinct ids.
+    """
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return f"{prefix} {letters}"
+
+
+# Speculative Stage 3: the draft names its sources so the reviews can be checked against them
+DRAFT_BASIS_INSTRUCTIONS = """
 
-async def run_claude_cli_async(prompt: str, workdir: str = ".", timeout: int = 120) -> tuple[bool, str, str]:
+End your answer with one line listing the council members whose responses it mainly draws on:
+Relied on: <model name>, <model name>"""
+
+
+def _split_draft_basis(draft: str, model_names: list[str]) -> tuple[str, Optional[set[str]]]:
     """
-    Run Claude Code CLI asynchronously (non-blocking).
-    Wraps sync subprocess call in executor for parallel execution.
+    Strip the "Relied on:" line from a speculative draft.
+
+    Returns the draft without it and the known model names it listed, or
+    None when the draft did not name any.
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _run_claude_cli_sync, prompt, workdir, timeout)
+    body, _, last = draft.rstrip().rpartition("\n")
+    label, colon, names = last.partition(":")
+    if not colon or label.strip(" *_").lower() != "relied on":
+        return draft, None
+    listed = {name.strip(" *_`") for name in names.split(",")}
+    basis = {name for name in model_names if name in listed}
+    return body.rstrip(), basis or None
+
+
+@dataclass
+class CallMetrics:
+    """Timing and token usage for a single model call."""
+    model_name: str
+    stage: str
+    started_at: float  # Unix timestamp
+    path: str = ""  # "cli", "api", "cache" or "circuit" (skipped: circuit open)
+    queue_wait_ms: float = 0.0  # Waiting for a concurrency slot or the provider rate limiter
+    slot_wait_ms: float = 0.0  # Waiting for a Stage 2 review slot before the call started (not in total_ms)
+    connect_ms: Optional[float] = None  # TCP+TLS setup; 0 when a pooled connection was reused
+    ttfb_ms: Optional[float] = None  # First response byte (API) or first output line (CLI)
+    total_ms: float = 0.0
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    retries: int = 0  # HTTP attempts beyond the first (429, 5xx, transport errors)
+    error: Optional[str] = None
+
+
+# Collects CallMetrics for the council run in progress (set by execute)
+_CALL_LOG: contextvars.ContextVar[Optional[list[CallMetrics]]] = contextvars.ContextVar(
+    "council_call_log", default=None
+)
+
+# Directory the provider CLIs run in; the daemon sets its caller's for each request
+CLI_WORKDIR: contextvars.ContextVar[str] = contextvars.ContextVar("council_cli_workdir", default=".")
 
 
 @dataclass
@@ -219,6 +367,11 @@ class ModelResponse:
     latency_ms: float
     tokens_used: int = 0
     error: Optional[str] = None
+    chunks: Optional[AsyncIterator[str]] = field(default=None, repr=False)  # Set by stream_model
+    cutoff: bool = False  # Stage 1 quorum proceeded without waiting for this model
+    late_task: Optional[asyncio.Task] = field(default=None, repr=False)  # Still-running call if cut off
+    metrics: Optional[CallMetrics] = None
+    data: Optional[Any] = None  # Validated JSON from call_structured
 
 
 @dataclass
@@ -245,21 +398,150 @@ class CouncilResult:
     chairman_model: str
     total_latency_ms: float
     anonymous_mapping: dict[str, str]  # anonymous_id -> model_name
+    cutoff_models: list[str] = field(default_factory=list)  # Stage 1 stragglers cut off by quorum
+    call_metrics: list[CallMetrics] = field(default_factory=list)
+    review_stats: dict = field(default_factory=dict)  # ScoreMatrix.stats() of the peer reviews
+    review_topology: Optional[str] = None  # Stage 2 topology: full, ring or random_k (None if skipped)
+    review_assignments: dict[str, list[str]] = field(default_factory=dict)  # reviewer -> anonymous ids
+    synthesis_mode: str = "standard"  # standard, speculative (draft kept) or revised (draft + reviews)
+    run_id: Optional[str] = None  # Id in the run store (None when the store is disabled)
+    replay_of: Optional[str] = None  # Stored run this result was replayed from
 
 
 class CouncilEngine:
     """Execute three-stage LLM council process."""
 
-    ANONYMOUS_IDS = ["Response A", "Response B", "Response C", "Response D", "Response E"]
-
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        health: Optional[HealthRegistry] = None
+    ):
         if config_dir is None:
             config_dir = Path(__file__).parent.parent / "config"
 
+        _load_env()
         self.config_dir = config_dir
         self.models_config = self._load_config("models.json")
         self.council_config = self._load_config("council.json")
-        self.chairman_index = 0  # For rotating chairman
+        self._clients: dict[str, httpx.AsyncClient] = {}  # origin -> pooled client
+        self._endpoint_slots: dict[str, asyncio.Semaphore] = {}  # endpoint -> max_concurrency slots
+
+        settings = self.models_config.get("settings", {})
+        self.limiter = RateLimiter(settings.get("rate_limits"), settings.get("retry"))
+
+        cache_config = self.council_config.get("cache", {})
+        self.cache: Optional[ResponseCache] = None
+        if use_cache and cache_config.get("enabled", False):
+            cache_dir = cache_config.get("dir")
+            self.cache = ResponseCache(
+                cache_dir=Path(cache_dir).expanduser() if cache_dir else None,
+                ttl_seconds=cache_config.get("ttl_seconds", 86400),
+                max_entries=cache_config.get("max_entries", 500),
+            )
+
+        health_config = self.council_config.get("health", {})
+        health_path = health_config.get("path")
+        # Latency/error history, circuit breakers and chairman rotation, kept across runs
+        self.health = health or HealthRegistry(
+            (Path(health_path).expanduser() if health_path else DEFAULT_HEALTH_PATH)
+            if health_config.get("persist", True) else None,
+            window=health_config.get("window", 50),
+            max_age_hours=health_config.get("max_age_hours", 168),
+            circuit=health_config.get("circuit"),
+        )
+        self._probes: dict[str, asyncio.Task] = {}  # circuit key -> background probe
+
+        store_config = self.council_config.get("store", {})
+        store_path = store_config.get("path")
+        self.store: Optional[RunStore] = None  # Where runs are saved (None when disabled)
+        self._run_store = RunStore(Path(store_path).expanduser() if store_path else None)
+        if store_config.get("enabled", False):
+            self.store = self._run_store
+
+    async def __aenter__(self) -> "CouncilEngine":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all pooled HTTP clients owned by this engine and save the health history."""
+        probes = list(self._probes.values())
+        self._probes.clear()
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+        self.health.save()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def _get_client(self, endpoint: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for an endpoint's origin, creating it on first use.
+
+        One client per scheme/host/port keeps TCP+TLS connections (and HTTP/2
+        streams) alive across Stage 1, every Stage 2 review and Stage 3.
+        """
+        import httpx
+
+        url = httpx.URL(endpoint)
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+        client = self._clients.get(origin)
+        if client is None:
+            settings = self.models_config.get("settings", {})
+            http_config = settings.get("http", {})
+            limits = httpx.Limits(
+                max_connections=http_config.get("max_connections", 20),
+                max_keepalive_connections=http_config.get("max_keepalive_connections", 10),
+                keepalive_expiry=http_config.get("keepalive_expiry_seconds", 60),
+            )
+            client = httpx.AsyncClient(
+                timeout=settings.get("timeout_seconds", 120),
+                limits=limits,
+                http2=http_config.get("http2", True) and _http2_available(),
+            )
+            self._clients[origin] = client
+
+        return client
+
+    @contextlib.asynccontextmanager
+    async def _endpoint_slot(self, model_config: dict, metrics: CallMetrics) -> AsyncIterator[None]:
+        """
+        Hold one of the endpoint's request slots for the duration of an API call.
+
+        Models with `max_concurrency` share that many in-flight requests per
+        endpoint URL (e.g. a local vLLM or llama.cpp server); others are
+        unlimited. Time spent waiting counts as queue wait.
+        """
+        limit = model_config.get("max_concurrency")
+        if not limit:
+            yield
+            return
+
+        semaphore = self._endpoint_slots.get(model_config["endpoint"])
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._endpoint_slots[model_config["endpoint"]] = semaphore
+        queued_at = time.time()
+        async with semaphore:
+            metrics.queue_wait_ms += (time.time() - queued_at) * 1000
+            yield
+
+    def _api_key(self, model_config: dict) -> Optional[str]:
+        """
+        API key from the model's `api_key_env`, or None if it is not set.
+
+        openai_compatible models without an `api_key_env` (local servers)
+        get "" and are called without an Authorization header.
+        """
+        env_name = model_config.get("api_key_env")
+        if not env_name:
+            return "" if model_config["provider"] == "openai_compatible" else None
+        return os.environ.get(env_name) or None
 
     def _load_config(self, filename: str) -> dict:
         """Load configuration file."""
@@ -271,94 +553,407 @@ class CouncilEngine:
         """Get list of enabled models."""
         return [m for m in self.models_config["models"] if m.get("enabled", False)]
 
+    def _has_cli(self, provider: str) -> bool:
+        """Whether a CLI is installed for this provider."""
+        cli_name = PROVIDER_CLIS.get(provider)
+        return bool(cli_name and _find_cli(cli_name))
+
+    def _cli_usable(self, provider: str) -> bool:
+        """Whether the provider's CLI is installed and its circuit is not open."""
+        return self._has_cli(provider) and self.health.open_for(f"cli:{PROVIDER_CLIS[provider]}") is None
+
+    def _api_circuit(self, model_config: dict) -> str:
+        """Circuit key for a model's HTTP API: provider plus endpoint host."""
+        return f"api:{model_config['provider']}@{urlsplit(model_config['endpoint']).netloc}"
+
+    def circuit_blocked(self, model_config: dict) -> bool:
+        """Whether every path to the model is behind an open circuit (calls would be skipped)."""
+        return (
+            self.health.open_for(self._api_circuit(model_config)) is not None
+            and not self._cli_usable(model_config["provider"])
+        )
+
+    def _record_circuit(self, key: str, ok: bool, probe: Callable[[], Awaitable[bool]]) -> None:
+        """Feed a call's outcome to the circuit for `key`, probing it if that opened it."""
+        if self.health.record_outcome(key, ok):
+            self._schedule_probe(key, probe)
+
+    def _schedule_probe(self, key: str, probe: Callable[[], Awaitable[bool]]) -> None:
+        """Start the background probe for an open circuit unless one is already running."""
+        if not self.council_config.get("health", {}).get("circuit", {}).get("probe", True):
+            return
+        task = self._probes.get(key)
+        if task is None or task.done():
+            self._probes[key] = asyncio.create_task(self._probe_circuit(key, probe))
+
+    async def _probe_circuit(self, key: str, probe: Callable[[], Awaitable[bool]]) -> None:
+        """
+        Wait out the circuit's cooldown, then probe until the path answers.
+
+        A successful probe closes the circuit before the next real call needs
+        it; a failed one reopens it with a longer cooldown. Stops as soon as a
+        real call closes the circuit. Probes are not part of any run's metrics.
+        """
+        while key in self.health.circuits:
+            remaining = self.health.open_for(key)
+            if remaining is not None:
+                await asyncio.sleep(remaining)
+                continue
+            try:
+                ok = await probe()
+            except Exception:
+                ok = False
+            self.health.record_outcome(key, ok)
+            self.health.save()
+
+    async def _run_cli(
+        self,
+        provider: str,
+        full_prompt: str,
+        timeout: int,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> tuple[bool, str]:
+        """Run the provider's CLI in CLI_WORKDIR; returns (success, response text)."""
+        workdir = CLI_WORKDIR.get()
+        if provider == "openai":
+            success, response, _ = await run_codex_cli_async(full_prompt, workdir, timeout, on_output)
+        elif provider == "google":
+            success, response, _ = await run_gemini_cli_async(full_prompt, workdir, timeout, on_output)
+        elif provider == "anthropic":
+            success, response, _ = await run_claude_cli_async(full_prompt, workdir, timeout, on_output)
+        else:
+            return False, ""
+        return success, response
+
+    async def _call_cli(
+        self,
+        provider: str,
+        full_prompt: str,
+        timeout: int,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """
+        Try the provider's CLI (codex/gemini/claude) if available.
+
+        Returns the response text, or None when there is no CLI, its circuit
+        is open or it failed, so the caller can fall back to the HTTP API.
+        """
+        if not self._has_cli(provider):
+            return None
+
+        key = f"cli:{PROVIDER_CLIS[provider]}"
+
+        async def probe() -> bool:
+            success, _ = await self._run_cli(provider, PROBE_PROMPT, timeout)
+            return success
+
+        if self.health.open_for(key) is not None:
+            self._schedule_probe(key, probe)
+            return None
+
+        success, response = await self._run_cli(provider, full_prompt, timeout, on_output)
+        self._record_circuit(key, success, probe)
+        return response if success else None
+
+    def _call_settings(self, max_tokens: Optional[int] = None) -> dict:
+        """models.json settings, with max_tokens lowered for one call when given."""
+        settings = self.models_config.get("settings", {})
+        if max_tokens is None:
+            return settings
+        return {**settings, "max_tokens": min(max_tokens, settings.get("max_tokens", 4096))}
+
+    def _cache_key(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        schema: Optional[dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Cache key for a call under the current sampling settings."""
+        settings = self._call_settings(max_tokens)
+        return ResponseCache.make_key(
+            model_config["provider"],
+            model_config["model"],
+            system_prompt,
+            prompt,
+            settings.get("temperature", 0.7),
+            settings.get("max_tokens", 4096),
+            schema,
+        )
+
     async def call_model(
         self,
         model_config: dict,
         prompt: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        stage: str = "call",
+        schema: Optional[dict] = None,
+        max_tokens: Optional[int] = None
     ) -> ModelResponse:
         """
         Call a single model. Deterministic flow:
+        0. Return the cached response if an identical call is cached
         1. Try CLI first (codex/gemini/claude) if available
         2. Fall back to HTTP API
 
+        With settings.hedge_delay_seconds set, the API request is started
+        alongside a CLI that has stayed silent that long (see _call_hedged).
+
         All CLI calls are async (non-blocking) for parallel execution.
+        The returned response carries CallMetrics labelled with `stage`.
+        With `schema` the model is asked for matching JSON (see council_schema);
+        use call_structured to also validate and repair the answer.
+        `max_tokens` caps this call's output below settings.max_tokens (API
+        path only; CLIs have no such option).
         """
-        start_time = time.time()
+        metrics = CallMetrics(model_name=model_config["name"], stage=stage, started_at=time.time())
+        key = self._cache_key(model_config, prompt, system_prompt, schema, max_tokens) if self.cache else None
+        cached = self.cache.get(key) if self.cache else None
+
+        if cached is not None:
+            metrics.path = "cache"
+            response = ModelResponse(
+                model_name=model_config["name"],
+                response=cached,
+                latency_ms=(time.time() - metrics.started_at) * 1000
+            )
+        else:
+            response = await self._call_model(model_config, prompt, system_prompt, metrics, schema, max_tokens)
+            if self.cache and not response.error:
+                self.cache.put(key, response.response)
+
+        self._finish_metrics(response, metrics)
+        return response
+
+    async def call_structured(
+        self,
+        model_config: dict,
+        prompt: str,
+        schema: dict,
+        system_prompt: Optional[str] = None,
+        stage: str = "call"
+    ) -> ModelResponse:
+        """
+        Call a model for JSON matching `schema` and validate it locally.
+
+        An answer that does not parse or validate gets one targeted repair
+        request (`structured_output.repair`) that sends it back with the
+        problems found and the original prompt, so missing parts can be
+        filled in rather than only reformatted. The validated object is returned in `data`; it stays
+        None when the repair fails too, with the raw answer kept in `response`.
+        """
+        response = await self.call_model(model_config, prompt, system_prompt, stage=stage, schema=schema)
+        if response.error:
+            return response
+
+        response.data, problems = check_answer(response.response, schema)
+        if not problems or not self.council_config.get("structured_output", {}).get("repair", True):
+            return response
+
+        repaired = await self.call_model(
+            model_config, repair_prompt(response.response, problems, schema, prompt), system_prompt,
+            stage=f"{stage}_repair", schema=schema
+        )
+        if repaired.error:
+            return response
+        repaired.data, _ = check_answer(repaired.response, schema)
+        if repaired.data is None:
+            return response
+        repaired.latency_ms += response.latency_ms
+        return repaired
+
+    def _finish_metrics(self, response: ModelResponse, metrics: CallMetrics) -> None:
+        """Close out a call's metrics, attach them and log them for the current run."""
+        metrics.total_ms = (time.time() - metrics.started_at) * 1000
+        metrics.error = response.error
+        if metrics.prompt_tokens is not None or metrics.completion_tokens is not None:
+            response.tokens_used = (metrics.prompt_tokens or 0) + (metrics.completion_tokens or 0)
+        response.metrics = metrics
+        if metrics.path in ("cli", "api"):
+            self.health.record(
+                metrics.model_name, metrics.total_ms - metrics.queue_wait_ms, ok=not response.error
+            )
+
+        call_log = _CALL_LOG.get()
+        if call_log is not None:
+            call_log.append(metrics)
+
+    async def _call_model(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        metrics: CallMetrics,
+        schema: Optional[dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """Uncached call_model: CLI first (optionally hedged), then HTTP API."""
+        start_time = metrics.started_at
         provider = model_config["provider"]
         settings = self.models_config.get("settings", {})
         timeout = settings.get("timeout_seconds", 120)
+        hedge_delay = settings.get("hedge_delay_seconds")
 
-        # Combine system prompt and user prompt for CLI
+        if schema is not None and not self.council_config.get("structured_output", {}).get("native", True):
+            # Native JSON modes disabled: ask for the schema in the prompt only
+            prompt += schema_instructions(schema)
+            schema = None
+
+        # Combine system prompt and user prompt for CLI (CLIs have no JSON mode)
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        if schema is not None:
+            full_prompt += schema_instructions(schema)
+
+        if (
+            hedge_delay is not None
+            and self._cli_usable(provider)
+            and self._api_key(model_config) is not None
+        ):
+            return await self._call_hedged(
+                model_config, prompt, system_prompt, full_prompt, timeout, hedge_delay, metrics, schema,
+                max_tokens
+            )
 
         # DETERMINISTIC: Try CLI first for supported providers
-        if provider == "openai" and CODEX_CLI:
-            success, response, _ = await run_codex_cli_async(full_prompt, timeout=timeout)
-            if success:
-                return ModelResponse(
-                    model_name=model_config["name"],
-                    response=response,
-                    latency_ms=(time.time() - start_time) * 1000
-                )
-            # CLI failed, will fall back to HTTP API below
-
-        elif provider == "google" and GEMINI_CLI:
-            success, response, _ = await run_gemini_cli_async(full_prompt, timeout=timeout)
-            if success:
-                return ModelResponse(
-                    model_name=model_config["name"],
-                    response=response,
-                    latency_ms=(time.time() - start_time) * 1000
-                )
-            # CLI failed, will fall back to HTTP API below
-
-        elif provider == "anthropic" and CLAUDE_CLI:
-            success, response, _ = await run_claude_cli_async(full_prompt, timeout=timeout)
-            if success:
-                return ModelResponse(
-                    model_name=model_config["name"],
-                    response=response,
-                    latency_ms=(time.time() - start_time) * 1000
+        response = await self._call_cli(
+            provider, full_prompt, timeout, on_output=self._cli_ttfb_hook(metrics)
+        )
+        if response is not None:
+            metrics.path = "cli"
+            return ModelResponse(
+                model_name=model_config["name"],
+                response=response,
+                latency_ms=(time.time() - start_time) * 1000
+            )
+        # CLI missing or failed, fall back to HTTP API
+        metrics.ttfb_ms = None
+        return await self._call_api(model_config, prompt, system_prompt, metrics, schema, max_tokens)
+
+    def _cli_ttfb_hook(self, metrics: CallMetrics) -> Callable[[str], None]:
+        """on_output callback that records the CLI's time to first output line."""
+        def on_output(_line: str) -> None:
+            if metrics.ttfb_ms is None:
+                metrics.ttfb_ms = (time.time() - metrics.started_at) * 1000
+        return on_output
+
+    async def _call_hedged(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        full_prompt: str,
+        timeout: int,
+        hedge_delay: float,
+        metrics: CallMetrics,
+        schema: Optional[dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """
+        Race the CLI against the HTTP API.
+
+        The CLI starts immediately. If it has produced no output after
+        `hedge_delay` seconds, the API request starts as well; the first
+        successful result wins and the other call is cancelled (which kills
+        the CLI's process group).
+        """
+        start_time = metrics.started_at
+        first_output = asyncio.Event()
+        record_ttfb = self._cli_ttfb_hook(metrics)
+
+        def on_output(line: str) -> None:
+            record_ttfb(line)
+            first_output.set()
+
+        cli_task = asyncio.create_task(self._call_cli(
+            model_config["provider"], full_prompt, timeout, on_output=on_output
+        ))
+        output_task = asyncio.create_task(first_output.wait())
+        api_task = None
+
+        try:
+            await asyncio.wait(
+                {cli_task, output_task}, timeout=hedge_delay,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            output_task.cancel()
+
+            if not cli_task.done() and not first_output.is_set():
+                # CLI looks hung: hedge with the API
+                api_task = asyncio.create_task(
+                    self._call_api(model_config, prompt, system_prompt, metrics, schema, max_tokens)
                 )
-            # CLI failed, will fall back to HTTP API below
 
-        # FALLBACK: HTTP API (or primary for deepseek which has no CLI)
-        api_key = os.environ.get(model_config["api_key_env"], "")
+            pending = {t for t in (cli_task, api_task) if t is not None}
+            api_response = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if cli_task in done and cli_task.result() is not None:
+                    metrics.path = "cli"
+                    return ModelResponse(
+                        model_name=model_config["name"],
+                        response=cli_task.result(),
+                        latency_ms=(time.time() - start_time) * 1000
+                    )
+                if api_task is not None and api_task in done:
+                    api_response = api_task.result()
+                    if not api_response.error:
+                        return api_response
+
+            # Both paths failed, or the CLI failed before the hedge started
+            if api_response is None:
+                api_response = await self._call_api(model_config, prompt, system_prompt, metrics, schema, max_tokens)
+            return api_response
+        finally:
+            for task in (cli_task, output_task, api_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _call_api(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        metrics: CallMetrics,
+        schema: Optional[dict] = None,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """
+        Call a model over its HTTP API (the only path for providers without a CLI).
+
+        While the endpoint's circuit is open the call is skipped at once with
+        an error instead of waiting out timeouts and retries.
+        """
+        start_time = metrics.started_at
+        metrics.path = "api"
+        settings = self._call_settings(max_tokens)
+        api_key = self._api_key(model_config)
 
-        if not api_key:
+        if api_key is None:
             return ModelResponse(
                 model_name=model_config["name"],
                 response="",
                 latency_ms=0,
-                error=f"Missing API key: {model_config['api_key_env']} (and no CLI available)"
+                error=f"Missing API key: {model_config.get('api_key_env')} (and no CLI available)"
             )
 
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                if provider == "openai":
-                    response = await self._call_openai(client, model_config, prompt, system_prompt, api_key, settings)
-                elif provider == "google":
-                    response = await self._call_google(client, model_config, prompt, system_prompt, api_key, settings)
-                elif provider == "anthropic":
-                    response = await self._call_anthropic(client, model_config, prompt, system_prompt, api_key, settings)
-                elif provider == "deepseek":
-                    response = await self._call_deepseek(client, model_config, prompt, system_prompt, api_key, settings)
-                else:
-                    return ModelResponse(
-                        model_name=model_config["name"],
-                        response="",
-                        latency_ms=0,
-                        error=f"Unknown provider: {provider}"
-                    )
+        key = self._api_circuit(model_config)
+        probe = functools.partial(self._probe_api, model_config, api_key)
+        remaining = self.health.open_for(key)
+        if remaining is not None:
+            metrics.path = "circuit"
+            self._schedule_probe(key, probe)
+            return ModelResponse(
+                model_name=model_config["name"],
+                response="",
+                latency_ms=0,
+                error=f"Skipped: circuit open for {key} after repeated failures (retry in {remaining:.0f}s)"
+            )
 
-                latency_ms = (time.time() - start_time) * 1000
-                return ModelResponse(
-                    model_name=model_config["name"],
-                    response=response,
-                    latency_ms=latency_ms
-                )
+        try:
+            response = await self._request_api(model_config, prompt, system_prompt, api_key, settings, metrics, schema)
         except Exception as e:
+            self._record_circuit(key, not _is_outage(e), probe)
             return ModelResponse(
                 model_name=model_config["name"],
                 response="",
@@ -366,75 +961,381 @@ class CouncilEngine:
                 error=str(e)
             )
 
-    async def _call_openai(
+        self._record_circuit(key, True, probe)
+        return ModelResponse(
+            model_name=model_config["name"],
+            response=response,
+            latency_ms=(time.time() - start_time) * 1000
+        )
+
+    async def _request_api(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        api_key: str,
+        settings: dict,
+        metrics: CallMetrics,
+        schema: Optional[dict] = None
+    ) -> str:
+        """Send one request through the provider's API adapter and return the answer text."""
+        provider = model_config["provider"]
+        client = self._get_client(model_config["endpoint"])
+        async with self._endpoint_slot(model_config, metrics):
+            if provider == "openai":
+                return await self._call_openai(client, model_config, prompt, system_prompt, api_key, settings, metrics, schema)
+            if provider == "google":
+                return await self._call_google(client, model_config, prompt, system_prompt, api_key, settings, metrics, schema)
+            if provider == "anthropic":
+                return await self._call_anthropic(client, model_config, prompt, system_prompt, api_key, settings, metrics, schema)
+            if provider in ("deepseek", "openai_compatible"):
+                return await self._call_deepseek(client, model_config, prompt, system_prompt, api_key, settings, metrics, schema)
+        raise RuntimeError(f"Unknown provider: {provider}")
+
+    async def _probe_api(self, model_config: dict, api_key: str) -> bool:
+        """Background circuit probe: a tiny request to the model's endpoint."""
+        settings = self._call_settings(max_tokens=16)
+        metrics = CallMetrics(model_name=model_config["name"], stage="probe", started_at=time.time())
+        try:
+            await self._request_api(model_config, PROBE_PROMPT, None, api_key, settings, metrics)
+        except Exception as e:
+            return not _is_outage(e)
+        return True
+
+    async def stream_model(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stage: str = "call",
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """
+        Call a single model in streaming mode.
+
+        Returns immediately with a ModelResponse whose `chunks` iterator yields
+        text as the provider's SSE stream delivers it. `response`, `latency_ms`
+        and `error` are filled in once the iterator has been drained. Unlike
+        call_model, the API is preferred whenever the model has an API key:
+        CLIs return their answer only at the end. Cache hits and the CLI
+        fallback (no key) yield one chunk.
+        `max_tokens` caps the output as in call_model.
+        """
+        start_time = time.time()
+        result = ModelResponse(model_name=model_config["name"], response="", latency_ms=0)
+        metrics = CallMetrics(model_name=model_config["name"], stage=stage, started_at=start_time)
+
+        key = self._cache_key(model_config, prompt, system_prompt, max_tokens=max_tokens) if self.cache else None
+
+        async def chunks() -> AsyncIterator[str]:
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                metrics.path = "cache"
+                result.response = cached
+                result.latency_ms = (time.time() - start_time) * 1000
+                self._finish_metrics(result, metrics)
+                yield cached
+                return
+
+            parts = []
+            try:
+                async for chunk in self._stream_chunks(model_config, prompt, system_prompt, metrics, max_tokens):
+                    parts.append(chunk)
+                    yield chunk
+            except Exception as e:
+                result.error = str(e)
+            finally:
+                result.response = "".join(parts)
+                result.latency_ms = (time.time() - start_time) * 1000
+                self._finish_metrics(result, metrics)
+
+            if self.cache and not result.error:
+                self.cache.put(key, result.response)
+
+        result.chunks = chunks()
+        return result
+
+    async def _stream_chunks(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        metrics: CallMetrics,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Yield response text for stream_model: provider SSE, or the CLI without an API key."""
+        provider = model_config["provider"]
+        settings = self._call_settings(max_tokens)
+        timeout = settings.get("timeout_seconds", 120)
+
+        api_key = self._api_key(model_config)
+        if api_key is None:
+            full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+            response = await self._call_cli(
+                provider, full_prompt, timeout, on_output=self._cli_ttfb_hook(metrics)
+            )
+            if response is None:
+                raise RuntimeError(
+                    f"Missing API key: {model_config.get('api_key_env')} (and no CLI available)"
+                )
+            metrics.path = "cli"
+            yield response
+            return
+
+        metrics.path = "api"
+
+        key = self._api_circuit(model_config)
+        probe = functools.partial(self._probe_api, model_config, api_key)
+        remaining = self.health.open_for(key)
+        if remaining is not None:
+            metrics.path = "circuit"
+            self._schedule_probe(key, probe)
+            raise RuntimeError(f"Skipped: circuit open for {key} after repeated failures (retry in {remaining:.0f}s)")
+
+        try:
+            client = self._get_client(model_config["endpoint"])
+            async with self._endpoint_slot(model_config, metrics):
+                async for text in self._stream_api(client, model_config, prompt, system_prompt, api_key, settings, metrics):
+                    yield text
+        except Exception as e:
+            self._record_circuit(key, not _is_outage(e), probe)
+            raise
+        self._record_circuit(key, True, probe)
+
+    async def _stream_api(
         self,
         client: httpx.AsyncClient,
         model_config: dict,
         prompt: str,
         system_prompt: Optional[str],
         api_key: str,
+        settings: dict,
+        metrics: CallMetrics
+    ) -> AsyncIterator[str]:
+        """Yield response text from the provider's SSE stream."""
+        provider = model_config["provider"]
+        if provider in ("openai", "deepseek", "openai_compatible"):
+            url, headers, body = self._openai_request(model_config, prompt, system_prompt, api_key, settings)
+            body["stream"] = True
+            body["stream_options"] = {"include_usage": True}
+            async for event in self._iter_sse(client, provider, url, headers, body, metrics):
+                choices = event.get("choices") or [{}]
+                text = choices[0].get("delta", {}).get("content")
+                if text:
+                    yield text
+        elif provider == "google":
+            url, headers, body = self._google_request(model_config, prompt, system_prompt, api_key, settings)
+            url = url.replace(":generateContent?", ":streamGenerateContent?alt=sse&")
+            async for event in self._iter_sse(client, provider, url, headers, body, metrics):
+                for candidate in event.get("candidates", []):
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+        elif provider == "anthropic":
+            url, headers, body = self._anthropic_request(model_config, prompt, system_prompt, api_key, settings)
+            body["stream"] = True
+            async for event in self._iter_sse(client, provider, url, headers, body, metrics):
+                if event.get("type") == "error":
+                    raise RuntimeError(event.get("error", {}).get("message", "Anthropic stream error"))
+                if event.get("type") == "content_block_delta":
+                    text = event.get("delta", {}).get("text")
+                    if text:
+                        yield text
+        else:
+            raise RuntimeError(f"Unknown provider: {provider}")
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        provider: str,
+        url: str,
+        headers: dict,
+        body: dict,
+        metrics: Optional[CallMetrics] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """
+        POST through the provider's rate limiter, retrying with backoff.
+
+        429s, transient 5xx statuses and transport errors are retried up to
+        settings.retry.max_attempts with jittered exponential backoff (never
+        sooner than Retry-After). Any other error status is raised at once,
+        and so is RateLimitError when the server asks for a longer wait than
+        settings.retry.max_delay_seconds. A streamed response is returned
+        open for the caller to read and close.
+        """
+        import httpx
+
+        limiter = self.limiter
+        request_tokens = estimate_tokens(json.dumps(body))  # Checked against remaining-tokens headers
+        attempt = 0
+        while True:
+            waited = await limiter.acquire(provider)
+            if metrics:
+                metrics.queue_wait_ms += waited * 1000
+                metrics.ttfb_ms = None
+            extensions = {"trace": self._trace_hook(metrics)} if metrics else None
+            request = client.build_request("POST", url, headers=headers, json=body, extensions=extensions)
+
+            try:
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError:
+                if attempt + 1 >= limiter.max_attempts:
+                    raise
+                delay = limiter.backoff(attempt)
+            else:
+                retry_after = limiter.on_response(provider, response.status_code, response.headers, request_tokens)
+                if not response.is_error:
+                    return response
+                if stream:
+                    await response.aclose()
+                if response.status_code not in RETRYABLE_STATUS or attempt + 1 >= limiter.max_attempts:
+                    response.raise_for_status()
+                if retry_after is not None and retry_after > limiter.max_delay:
+                    raise RateLimitError(
+                        f"{provider} returned {response.status_code} and asked to wait {retry_after:.0f}s "
+                        f"(more than retry.max_delay_seconds={limiter.max_delay:g})"
+                    )
+                delay = limiter.backoff(attempt, retry_after)
+
+            attempt += 1
+            if metrics:
+                metrics.retries = attempt
+            await asyncio.sleep(delay)
+
+    async def _post_json(
+        self,
+        client: httpx.AsyncClient,
+        provider: str,
+        url: str,
+        headers: dict,
+        body: dict,
+        metrics: Optional[CallMetrics] = None
+    ) -> dict:
+        """POST a JSON request, recording connect/TTFB/token metrics, and return the JSON body."""
+        response = await self._send(client, provider, url, headers, body, metrics)
+        data = response.json()
+        if metrics:
+            self._record_usage(metrics, data)
+        return data
+
+    def _trace_hook(self, metrics: CallMetrics) -> Callable:
+        """httpx trace extension that records connection setup and time to first byte."""
+        connect_started = None
+        metrics.connect_ms = 0.0  # Stays 0 if a pooled connection is reused
+
+        async def trace(event: str, info: dict) -> None:
+            nonlocal connect_started
+            now = time.time()
+            if event == "connection.connect_tcp.started":
+                connect_started = now
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                if connect_started is not None:
+                    metrics.connect_ms = (now - connect_started) * 1000
+            elif event.endswith("receive_response_headers.complete") and metrics.ttfb_ms is None:
+                metrics.ttfb_ms = (now - metrics.started_at) * 1000
+
+        return trace
+
+    def _record_usage(self, metrics: CallMetrics, data: dict) -> None:
+        """Copy token counts from an OpenAI, Anthropic or Gemini usage block."""
+        usage = data.get("usage") or {}
+        if not usage and data.get("message"):  # Anthropic message_start stream event
+            usage = data["message"].get("usage") or {}
+        gemini_usage = data.get("usageMetadata") or {}
+
+        prompt_tokens = (
+            usage.get("prompt_tokens")
+            or usage.get("input_tokens")
+            or gemini_usage.get("promptTokenCount")
+        )
+        completion_tokens = (
+            usage.get("completion_tokens")
+            or usage.get("output_tokens")
+            or gemini_usage.get("candidatesTokenCount")
+        )
+        if prompt_tokens is not None:
+            metrics.prompt_tokens = prompt_tokens
+        if completion_tokens is not None:
+            metrics.completion_tokens = completion_tokens
+
+    async def _iter_sse(
+        self,
+        client: httpx.AsyncClient,
+        provider: str,
+        url: str,
+        headers: dict,
+        body: dict,
+        metrics: Optional[CallMetrics] = None
+    ) -> AsyncIterator[dict]:
+        """POST a streaming request and yield the JSON payload of each SSE event."""
+        response = await self._send(client, provider, url, headers, body, metrics, stream=True)
+        async with contextlib.aclosing(response):
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if not data or data == "[DONE]":
+                    continue
+                event = json.loads(data)
+                if metrics:
+                    self._record_usage(metrics, event)
+                yield event
+
+    def _openai_request(
+        self,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        api_key: str,
         settings: dict
-    ) -> str:
-        """Call OpenAI API."""
+    ) -> tuple[str, dict, dict]:
+        """Build (url, headers, body) for an OpenAI-compatible chat completion."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await client.post(
-            model_config["endpoint"],
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": model_config["model"],
-                "messages": messages,
-                "max_tokens": settings.get("max_tokens", 4096),
-                "temperature": settings.get("temperature", 0.7)
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        body = {
+            "model": model_config["model"],
+            "messages": messages,
+            "max_tokens": settings.get("max_tokens", 4096),
+            "temperature": settings.get("temperature", 0.7)
+        }
+        return model_config["endpoint"], headers, body
 
-    async def _call_google(
+    def _google_request(
         self,
-        client: httpx.AsyncClient,
         model_config: dict,
         prompt: str,
         system_prompt: Optional[str],
         api_key: str,
         settings: dict
-    ) -> str:
-        """Call Google Gemini API."""
+    ) -> tuple[str, dict, dict]:
+        """Build (url, headers, body) for a Gemini generateContent call."""
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
 
-        response = await client.post(
-            f"{model_config['endpoint']}?key={api_key}",
-            headers={"Content-Type": "application/json"},
-            json={
-                "contents": [{"parts": [{"text": full_prompt}]}],
-                "generationConfig": {
-                    "maxOutputTokens": settings.get("max_tokens", 4096),
-                    "temperature": settings.get("temperature", 0.7)
-                }
+        body = {
+            "contents": [{"parts": [{"text": full_prompt}]}],
+            "generationConfig": {
+                "maxOutputTokens": settings.get("max_tokens", 4096),
+                "temperature": settings.get("temperature", 0.7)
             }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["candidates"][0]["content"]["parts"][0]["text"]
+        }
+        return f"{model_config['endpoint']}?key={api_key}", {"Content-Type": "application/json"}, body
 
-    async def _call_anthropic(
+    def _anthropic_request(
         self,
-        client: httpx.AsyncClient,
         model_config: dict,
         prompt: str,
         system_prompt: Optional[str],
         api_key: str,
         settings: dict
-    ) -> str:
-        """Call Anthropic Claude API."""
+    ) -> tuple[str, dict, dict]:
+        """Build (url, headers, body) for an Anthropic messages call."""
         body = {
             "model": model_config["model"],
             "max_tokens": settings.get("max_tokens", 4096),
@@ -443,17 +1344,70 @@ class CouncilEngine:
         if system_prompt:
             body["system"] = system_prompt
 
-        response = await client.post(
-            model_config["endpoint"],
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "Content-Type": "application/json"
-            },
-            json=body
-        )
-        response.raise_for_status()
-        data = response.json()
+        headers = {
+            "x-api-key": api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json"
+        }
+        return model_config["endpoint"], headers, body
+
+    async def _call_openai(
+        self,
+        client: httpx.AsyncClient,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        api_key: str,
+        settings: dict,
+        metrics: Optional[CallMetrics] = None,
+        schema: Optional[dict] = None
+    ) -> str:
+        """Call OpenAI API."""
+        url, headers, body = self._openai_request(model_config, prompt, system_prompt, api_key, settings)
+        if schema is not None:
+            apply_schema(model_config["provider"], body, schema)
+        data = await self._post_json(client, model_config["provider"], url, headers, body, metrics)
+        return data["choices"][0]["message"]["content"]
+
+    async def _call_google(
+        self,
+        client: httpx.AsyncClient,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        api_key: str,
+        settings: dict,
+        metrics: Optional[CallMetrics] = None,
+        schema: Optional[dict] = None
+    ) -> str:
+        """Call Google Gemini API."""
+        url, headers, body = self._google_request(model_config, prompt, system_prompt, api_key, settings)
+        if schema is not None:
+            apply_schema(model_config["provider"], body, schema)
+        data = await self._post_json(client, model_config["provider"], url, headers, body, metrics)
+        return data["candidates"][0]["content"]["parts"][0]["text"]
+
+    async def _call_anthropic(
+        self,
+        client: httpx.AsyncClient,
+        model_config: dict,
+        prompt: str,
+        system_prompt: Optional[str],
+        api_key: str,
+        settings: dict,
+        metrics: Optional[CallMetrics] = None,
+        schema: Optional[dict] = None
+    ) -> str:
+        """Call Anthropic Claude API."""
+        url, headers, body = self._anthropic_request(model_config, prompt, system_prompt, api_key, settings)
+        if schema is not None:
+            apply_schema(model_config["provider"], body, schema)
+        data = await self._post_json(client, model_config["provider"], url, headers, body, metrics)
+        if schema is not None:
+            # Forced tool call: the structured answer is the tool input
+            for block in data["content"]:
+                if block.get("type") == "tool_use":
+                    return json.dumps(block["input"], ensure_ascii=False)
         return data["content"][0]["text"]
 
     async def _call_deepseek(
@@ -463,29 +1417,15 @@ class CouncilEngine:
         prompt: str,
         system_prompt: Optional[str],
         api_key: str,
-        settings: dict
+        settings: dict,
+        metrics: Optional[CallMetrics] = None,
+        schema: Optional[dict] = None
     ) -> str:
-        """Call DeepSeek API (OpenAI-compatible)."""
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
-        response = await client.post(
-            model_config["endpoint"],
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": model_config["model"],
-                "messages": messages,
-                "max_tokens": settings.get("max_tokens", 4096),
-                "temperature": settings.get("temperature", 0.7)
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
+        """Call DeepSeek or another OpenAI-compatible API (JSON mode without json_schema)."""
+        url, headers, body = self._openai_request(model_config, prompt, system_prompt, api_key, settings)
+        if schema is not None:
+            apply_schema(model_config["provider"], body, schema)
+        data = await self._post_json(client, model_config["provider"], url, headers, body, metrics)
         return data["choices"][0]["message"]["content"]
 
     def anonymize_responses(
@@ -510,102 +1450,298 @@ class CouncilEngine:
         anonymized = []
 
         for i, resp in enumerate(shuffled):
-            if i < len(self.ANONYMOUS_IDS):
-                anon_id = self.ANONYMOUS_IDS[i]
-                mapping[anon_id] = resp.model_name
-                anonymized.append((anon_id, resp.response))
+            anon_id = anonymous_id(i)
+            mapping[anon_id] = resp.model_name
+            anonymized.append((anon_id, resp.response))
 
         return mapping, anonymized
 
-    def select_chairman(self, models: list[dict]) -> dict:
-        """Select chairman model based on strategy."""
-        strategy = self.council_config.get("chairman_strategy", "rotating")
+    def select_chairman(
+        self,
+        models: list[dict],
+        fixed_model: Optional[str] = None,
+        warm: Optional[set[str]] = None
+    ) -> dict:
+        """
+        Select chairman model based on strategy.
+
+        - fixed: `chairman_fixed_model`
+        - rotating (default): round-robin, the position persisted across runs
+        - fastest-healthy: lowest median latency in the health history among
+          models under `chairman_selection.max_error_rate`
+        - cheapest-adequate: lowest `cost_per_mtok` among healthy models within
+          `latency_slack` times the fastest one's latency
+
+        `warm` names the models that answered earlier in this run (open
+        connection, known to be up); the history-based strategies prefer them.
+        Without enough history they fall back to rotating. Models whose
+        circuits are open are passed over unless every model is. `fixed_model`
+        overrides the configured strategy for this call only, leaving
+        council_config untouched for other runs sharing the engine.
+        """
+        strategy = "fixed" if fixed_model else self.council_config.get("chairman_strategy", "rotating")
+        models = [m for m in models if not self.circuit_blocked(m)] or models
 
         if strategy == "fixed":
-            fixed_name = self.council_config.get("chairman_fixed_model")
+            fixed_name = fixed_model or self.council_config.get("chairman_fixed_model")
             for m in models:
                 if m["name"] == fixed_name:
                     return m
 
-        # Rotating (default)
-        chairman = models[self.chairman_index % len(models)]
-        self.chairman_index += 1
-        return chairman
+        if strategy in ("fastest-healthy", "cheapest-adequate"):
+            chairman = self._chairman_from_health(models, strategy, warm or set())
+            if chairman is not None:
+                return chairman
+
+        # Rotating (default), over the models that answered this run when known
+        pool = [m for m in models if m["name"] in warm] if warm else []
+        pool = pool or models
+        return pool[self.health.next_rotation() % len(pool)]
+
+    def _chairman_from_health(self, models: list[dict], strategy: str, warm: set[str]) -> Optional[dict]:
+        """fastest-healthy / cheapest-adequate pick, or None without enough history."""
+        config = self.council_config.get("chairman_selection", {})
+        min_samples = config.get("min_samples", 3)
+        max_error_rate = config.get("max_error_rate", 0.25)
+
+        stats = {m["name"]: self.health.stats(m["name"]) for m in models}
+        healthy = [
+            m for m in models
+            if stats[m["name"]]["calls"] >= min_samples
+            and stats[m["name"]]["error_rate"] <= max_error_rate
+            and stats[m["name"]]["median_ms"] is not None
+        ]
+        if config.get("prefer_warm", True):
+            healthy = [m for m in healthy if m["name"] in warm] or healthy
+        if not healthy:
+            return None
+
+        def latency(m: dict) -> float:
+            return stats[m["name"]]["median_ms"]
+
+        fastest = min(healthy, key=latency)
+        if strategy == "fastest-healthy":
+            return fastest
+
+        def price(m: dict) -> float:
+            cost = m.get("cost_per_mtok")
+            if not cost:
+                return float("inf")  # Unknown cost ranks last
+            return cost.get("input", 0) + cost.get("output", 0)
+
+        slack = config.get("latency_slack", 1.5)
+        adequate = [m for m in healthy if latency(m) <= latency(fastest) * slack]
+        return min(adequate, key=lambda m: (price(m), latency(m)))
+
+    def warm_models(self, responses: list[ModelResponse]) -> set[str]:
+        """Models that answered in `responses` (for select_chairman's `warm`)."""
+        return {r.model_name for r in responses if not r.error and not r.cutoff}
 
     async def run_stage_1(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        models: Optional[list[dict]] = None
+        models: Optional[list[dict]] = None,
+        stage: str = "stage_1",
+        schema: Optional[dict] = None,
+        keep_late: bool = False
     ) -> list[ModelResponse]:
-        """Stage 1: Get independent responses from all models."""
+        """
+        Stage 1: Get independent responses from all models.
+
+        With `schema`, each model is called through call_structured.
+
+        By default waits for every model. With `quorum.min_responses` set in
+        council.json, proceeds once that many models answered successfully
+        plus at most `quorum.straggler_grace_seconds`; stragglers come back
+        as `cutoff` responses in model order and their calls are cancelled.
+        Only a caller passing `keep_late` (execute, which later runs
+        _attach_late_responses) lets them keep running when
+        `quorum.late_responses` is "attach".
+        """
         if models is None:
             models = self.get_enabled_models()
 
-        tasks = [
-            self.call_model(model, prompt, system_prompt)
-            for model in models
-        ]
+        quorum = self.council_config.get("quorum", {})
+        min_responses = quorum.get("min_responses")
+
+        def call(model: dict) -> Awaitable[ModelResponse]:
+            if schema is not None:
+                return self.call_structured(model, prompt, schema, system_prompt, stage=stage)
+            return self.call_model(model, prompt, system_prompt, stage=stage)
+
+        if not min_responses or min_responses >= len(models):
+            return await asyncio.gather(*(call(model) for model in models))
+
+        start_time = time.time()
+        tasks = [asyncio.create_task(call(model)) for model in models]
+        try:
+            await self._wait_for_quorum(
+                tasks, min_responses, quorum.get("straggler_grace_seconds") or 0
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        attach = keep_late and quorum.get("late_responses", "cancel") == "attach"
+        responses = []
+        for model, task in zip(models, tasks):
+            if task.done():
+                responses.append(task.result())
+                continue
+
+            if not attach:
+                task.cancel()
+            responses.append(ModelResponse(
+                model_name=model["name"],
+                response="",
+                latency_ms=(time.time() - start_time) * 1000,
+                error=f"Cut off by quorum after {min_responses} responses",
+                cutoff=True,
+                late_task=task if attach else None
+            ))
 
-        return await asyncio.gather(*tasks)
+        return responses
+
+    async def _wait_for_quorum(
+        self,
+        tasks: list[asyncio.Task],
+        min_responses: int,
+        grace_seconds: float
+    ) -> None:
+        """Wait until `min_responses` calls succeeded, then up to `grace_seconds` more."""
+        pending = set(tasks)
+        succeeded = 0
+
+        while pending and succeeded < min_responses:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            succeeded += sum(1 for task in done if not task.result().error)
+
+        if pending and grace_seconds > 0:
+            await asyncio.wait(pending, timeout=grace_seconds)
+
+    def _attach_late_responses(self, responses: list[ModelResponse]) -> list[ModelResponse]:
+        """
+        Swap in late Stage 1 answers that finished while later stages ran.
+
+        Calls still running are cancelled; attached responses keep
+        `cutoff=True` because they were not part of peer review or synthesis.
+        """
+        attached = []
+        for resp in responses:
+            task = resp.late_task
+            if task is None:
+                attached.append(resp)
+            elif task.done() and not task.cancelled() and not task.result().error:
+                late = task.result()
+                late.cutoff = True
+                attached.append(late)
+            else:
+                task.cancel()
+                resp.late_task = None
+                attached.append(resp)
+        return attached
 
     async def run_stage_2(
         self,
         original_prompt: str,
         responses: list[ModelResponse],
         models: Optional[list[dict]] = None
-    ) -> tuple[list[PeerReview], dict[str, str]]:
-        """Stage 2: Peer review with anonymization."""
-        if not self.council_config.get("peer_review", {}).get("enabled", True):
-            return [], {}
+    ) -> tuple[list[PeerReview], dict[str, str], dict[str, list[str]]]:
+        """
+        Stage 2: Peer review with anonymization.
+
+        `peer_review.topology` in council.json picks who reviews what (see
+        council_topology): `full`, or `ring` / `random_k` with `k` responses
+        per reviewer. Returns the reviews, the anonymous mapping and the
+        assignments ({reviewer_model: [anonymous_id, ...]}). Models that
+        Stage 1 quorum cut off do not review.
+        """
+        peer_review = self.council_config.get("peer_review", {})
+        if not peer_review.get("enabled", True):
+            return [], {}, {}
 
         if models is None:
             models = self.get_enabled_models()
+        cutoff = {r.model_name for r in responses if r.cutoff}
+        models = [model for model in models if model["name"] not in cutoff]
 
         # Anonymize responses
         mapping, anonymized = self.anonymize_responses(responses)
 
         if len(anonymized) < 2:
-            return [], mapping
+            return [], mapping, {}
 
         # Build peer review prompt
-        scoring_config = self.council_config.get("peer_review", {}).get("scoring", {})
+        scoring_config = peer_review.get("scoring", {})
         criteria = scoring_config.get("criteria", ["accuracy", "completeness", "clarity", "insight"])
         scale = scoring_config.get("scale", 10)
 
-        review_prompt = self._build_peer_review_prompt(
-            original_prompt, anonymized, criteria, scale
+        topology = peer_review.get("topology", "full")
+        seed = peer_review.get("seed")
+        assignments = assign_reviews(
+            [model["name"] for model in models], mapping, topology, peer_review.get("k", 2),
+            random.Random(seed) if seed is not None else None
         )
 
-        # Each model reviews all others
-        all_reviews = []
-        for model in models:
+        async def condense(selected: list[tuple[str, str]]) -> list[tuple[str, str]]:
+            """Condense long responses so a review prompt quoting `selected` fits prompt_budget."""
+            fixed_text = self._build_peer_review_prompt(
+                original_prompt, [(anon_id, "") for anon_id, _ in selected], criteria, scale
+            )
+            texts = await self.fit_prompt_budget([text for _, text in selected], fixed_text)
+            return [(anon_id, text) for (anon_id, _), text in zip(selected, texts)]
+
+        # Full review quotes nearly every response in every prompt: condense once
+        if topology == "full":
+            anonymized = await condense(anonymized)
+        texts_by_id = dict(anonymized)
+
+        # Each model reviews its assigned responses, concurrently up to max_concurrency
+        max_concurrency = peer_review.get("max_concurrency")
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def review(model: dict) -> list[PeerReview]:
             model_name = model["name"]
 
-            # Get responses from other models only
             others_anonymized = [
-                (anon_id, text) for anon_id, text in anonymized
-                if mapping[anon_id] != model_name
+                (anon_id, texts_by_id[anon_id]) for anon_id in assignments[model_name]
             ]
-
             if not others_anonymized:
-                continue
+                return []
+            if topology != "full":
+                others_anonymized = await condense(others_anonymized)
 
             # Build specific review prompt for this model
             specific_prompt = self._build_peer_review_prompt(
                 original_prompt, others_anonymized, criteria, scale
             )
 
-            response = await self.call_model(
-                model, specific_prompt,
-                "You are evaluating responses from other AI models. Be objective and thorough."
-            )
+            schema = peer_review_schema([anon_id for anon_id, _ in others_anonymized], criteria, scale)
 
-            if not response.error:
-                reviews = self._parse_peer_reviews(response.response, model_name, criteria)
-                all_reviews.extend(reviews)
+            queued_at = time.time()
+            async with semaphore or contextlib.nullcontext():
+                slot_wait_ms = (time.time() - queued_at) * 1000
+                response = await self.call_structured(
+                    model, specific_prompt, schema,
+                    "You are evaluating responses from other AI models. Be objective and thorough.",
+                    stage="stage_2"
+                )
+            response.metrics.slot_wait_ms += slot_wait_ms
+
+            if response.error or response.data is None:
+                return []
+            return self._parse_peer_reviews(response.data, model_name)
+
+        # gather() preserves model order, so reviews stay deterministic
+        reviews_per_model = await asyncio.gather(*(review(model) for model in models))
+
+        all_reviews = []
+        for reviews in reviews_per_model:
+            all_reviews.extend(reviews)
 
-        return all_reviews, mapping
+        return all_reviews, mapping, assignments
 
     def _build_peer_review_prompt(
         self,
@@ -642,68 +1778,34 @@ For EACH response, provide:
 
 4. **Ranking**: Rank all responses from best to worst.
 
-Format your evaluation as JSON:
-```json
-{{
-  "evaluations": [
-    {{
-      "response_id": "Response A",
-      "scores": {{"accuracy": 8, "completeness": 7, ...}},
-      "strengths": ["...", "..."],
-      "weaknesses": ["...", "..."]
-    }}
-  ],
-  "ranking": ["Response A", "Response B", ...]
-}}
-```
+Give one entry in `evaluations` per response, identified by its `response_id`
+(the heading above) with its `scores`, `strengths` and `weaknesses`, and list
+every response id in `ranking`, best first.
 """
 
     def _parse_peer_reviews(
         self,
-        review_text: str,
-        reviewer_model: str,
-        criteria: list[str]
+        data: dict,
+        reviewer_model: str
     ) -> list[PeerReview]:
-        """Parse peer review response into structured reviews."""
+        """Turn a validated peer_review_schema answer into PeerReviews."""
+        ranking = data["ranking"]
         reviews = []
 
-        try:
-            # Try to extract JSON from response
-            import re
-            json_match = re.search(r'```json\s*(.*?)\s*```', review_text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group(1))
-            else:
-                # Try parsing entire response as JSON
-                data = json.loads(review_text)
-
-            ranking = data.get("ranking", [])
-
-            for i, eval_data in enumerate(data.get("evaluations", [])):
-                response_id = eval_data.get("response_id", f"Response {chr(65+i)}")
-                scores = eval_data.get("scores", {})
-
-                # Ensure all criteria have scores
-                for c in criteria:
-                    if c not in scores:
-                        scores[c] = 5  # Default middle score
-
-                total_score = sum(scores.values())
-
-                rank = ranking.index(response_id) + 1 if response_id in ranking else i + 1
-
-                reviews.append(PeerReview(
-                    reviewer_model=reviewer_model,
-                    reviewed_anonymous_id=response_id,
-                    scores=scores,
-                    total_score=total_score,
-                    strengths=eval_data.get("strengths", []),
-                    weaknesses=eval_data.get("weaknesses", []),
-                    ranking=rank
-                ))
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # If parsing fails, return empty reviews
-            pass
+        for i, evaluation in enumerate(data["evaluations"]):
+            response_id = evaluation["response_id"]
+            scores = {c: int(score) for c, score in evaluation["scores"].items()}
+            rank = ranking.index(response_id) + 1 if response_id in ranking else i + 1
+
+            reviews.append(PeerReview(
+                reviewer_model=reviewer_model,
+                reviewed_anonymous_id=response_id,
+                scores=scores,
+                total_score=sum(scores.values()),
+                strengths=evaluation["strengths"],
+                weaknesses=evaluation["weaknesses"],
+                ranking=rank
+            ))
 
         return reviews
 
@@ -713,37 +1815,196 @@ Format your evaluation as JSON:
         responses: list[ModelResponse],
         reviews: list[PeerReview],
         mapping: dict[str, str],
-        chairman: dict
+        chairman: dict,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        scores: Optional[ScoreMatrix] = None,
+        stage: str = "stage_3",
+        instructions: str = ""
     ) -> str:
-        """Stage 3: Chairman synthesis."""
+        """
+        Stage 3: Chairman synthesis.
+
+        If `on_chunk` is given, the synthesis is streamed and each text chunk
+        is passed to it as soon as the provider sends it. `scores` is the
+        run's score matrix, built from `reviews` when not given.
+        `instructions` is appended to the synthesis prompt.
+        """
+        review_summary = self._summarize_reviews(reviews, mapping, scores)
+
+        # Condense long responses so the synthesis prompt fits prompt_budget
+        answered = [r for r in responses if not r.error]
+        fixed_text = self._build_synthesis_prompt(
+            original_prompt, [replace(r, response="") for r in answered], review_summary
+        ) + instructions
+        texts = await self.fit_prompt_budget([r.response for r in answered], fixed_text)
+        answered = [replace(r, response=text) for r, text in zip(answered, texts)]
+
         synthesis_prompt = self._build_synthesis_prompt(
-            original_prompt, responses, reviews, mapping
+            original_prompt, answered, review_summary
+        ) + instructions
+        system_prompt = "You are the Chairman of an LLM council. Synthesize all perspectives into a comprehensive final answer."
+        response = await self._chairman_call(chairman, synthesis_prompt, system_prompt, stage, on_chunk)
+        return response.response if not response.error else f"Synthesis failed: {response.error}"
+
+    async def _chairman_call(
+        self,
+        chairman: dict,
+        prompt: str,
+        system_prompt: str,
+        stage: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        max_tokens: Optional[int] = None
+    ) -> ModelResponse:
+        """One chairman call, streamed through `on_chunk` when given."""
+        if on_chunk is None:
+            return await self.call_model(chairman, prompt, system_prompt, stage=stage, max_tokens=max_tokens)
+
+        response = await self.stream_model(chairman, prompt, system_prompt, stage=stage, max_tokens=max_tokens)
+        async for chunk in response.chunks:
+            on_chunk(chunk)
+        return response
+
+    async def run_speculative_stage_3(
+        self,
+        original_prompt: str,
+        responses: list[ModelResponse],
+        reviews: Awaitable[tuple[list[PeerReview], dict[str, str], dict[str, list[str]]]],
+        chairman: dict,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> tuple[str, str, tuple, Optional[ScoreMatrix]]:
+        """
+        Stage 3 overlapped with Stage 2.
+
+        The chairman drafts a synthesis from the Stage 1 responses alone while
+        `reviews` (the pending run_stage_2) runs, naming the responses it drew
+        on. The draft is kept unless the reviews contradict that basis (see
+        _draft_contradictions); then a revision call, capped at
+        `synthesis.revision_max_tokens`, appends a short correction to it. A
+        failed draft falls back to the standard synthesis.
+
+        Returns (synthesis, mode, stage 2 result, score matrix), where mode is
+        "speculative", "revised" or "standard". With `on_chunk`, the draft is
+        emitted in one piece as soon as it is ready, before peer review ends,
+        and a correction is streamed after it.
+        """
+        draft_task = asyncio.create_task(self.run_stage_3(
+            original_prompt, responses, [], {}, chairman, stage="stage_3_draft",
+            instructions=DRAFT_BASIS_INSTRUCTIONS
+        ))
+        reviews_task = asyncio.ensure_future(reviews)
+        try:
+            draft = await draft_task
+            failed = draft.startswith("Synthesis failed:")
+            if not failed:
+                draft, basis = _split_draft_basis(draft, [r.model_name for r in responses if not r.error])
+                if on_chunk is not None:
+                    on_chunk(draft)
+            stage_2 = await reviews_task
+        finally:
+            for task in (draft_task, reviews_task):
+                if not task.done():
+                    task.cancel()
+
+        stage_2_reviews, mapping, _ = stage_2
+        scores = self.score_matrix(stage_2_reviews) if stage_2_reviews else None
+
+        if failed:
+            synthesis = await self.run_stage_3(
+                original_prompt, responses, stage_2_reviews, mapping, chairman,
+                on_chunk=on_chunk, scores=scores
+            )
+            return synthesis, "standard", stage_2, scores
+
+        contradictions = self._draft_contradictions(basis, scores, mapping)
+        if not contradictions:
+            return draft, "speculative", stage_2, scores
+
+        config = self.council_config.get("synthesis", {})
+        max_tokens = config.get("revision_max_tokens", 600)
+        revision_prompt = self._build_revision_prompt(
+            original_prompt, draft, self._summarize_reviews(stage_2_reviews, mapping, scores),
+            contradictions, max_words=int(max_tokens * 0.6)
         )
+        system_prompt = "You are the Chairman of an LLM council. Correct your draft answer in light of the peer reviews."
+        if on_chunk is not None:
+            on_chunk("\n\n")
+        response = await self._chairman_call(
+            chairman, revision_prompt, system_prompt, "stage_3_revision", on_chunk, max_tokens=max_tokens
+        )
+        if response.error or not response.response.strip():
+            # Keep the draft rather than losing the answer; it is only missing the review input
+            return draft, "speculative", stage_2, scores
+        return f"{draft}\n\n{response.response.strip()}", "revised", stage_2, scores
+
+    def _draft_contradictions(
+        self,
+        basis: Optional[set[str]],
+        scores: Optional[ScoreMatrix],
+        mapping: dict[str, str]
+    ) -> list[str]:
+        """
+        Review outcomes that undercut what a speculative draft relied on.
 
-        response = await self.call_model(
-            chairman, synthesis_prompt,
-            "You are the Chairman of an LLM council. Synthesize all perspectives into a comprehensive final answer."
+        `basis` holds the model names the draft said it drew on; None (the
+        draft did not say) counts as all of them. A contradiction is an
+        agreed best response the draft left out, or a response it used that
+        scored below `synthesis.revise_below` of the scoring scale. Empty
+        when the draft can stand.
+        """
+        if scores is None:
+            return []
+        scale = self.council_config.get("peer_review", {}).get("scoring", {}).get("scale", 10)
+        floor = self.council_config.get("synthesis", {}).get("revise_below", 0.5) * scale
+        relied_on = {
+            anon_id for anon_id in scores.responses
+            if basis is None or mapping.get(anon_id, anon_id) in basis
+        }
+        return scores.contradictions(
+            relied_on, floor, labels=mapping, thresholds=self.council_config.get("thresholds")
         )
 
-        return response.response if not response.error else f"Synthesis failed: {response.error}"
+    async def fit_prompt_budget(self, sections: list[str], fixed_text: str) -> list[str]:
+        """
+        Compress quoted model output to fit council.json `prompt_budget`.
+
+        `fixed_text` is the prompt with the sections left empty. See
+        council_budget for the truncate/extractive/summarize strategies.
+        """
+        return await compress_sections(
+            sections, fixed_text,
+            self.council_config.get("prompt_budget", {}),
+            summarize=self.summarize_section
+        )
+
+    async def summarize_section(self, text: str, max_tokens: int) -> Optional[str]:
+        """Summarize one section with prompt_budget.summarizer_model (default: first enabled model)."""
+        name = self.council_config.get("prompt_budget", {}).get("summarizer_model")
+        candidates = [m for m in self.models_config["models"] if m["name"] == name]
+        model = (candidates or self.get_enabled_models() or [None])[0]
+        if model is None:
+            return None
+
+        prompt = f"""Summarize the following text in at most {int(max_tokens * 0.75)} words.
+Keep concrete claims, recommendations, numbers and caveats. Drop repetition and filler.
+Reply with the summary only.
+
+{text}"""
+        response = await self.call_model(model, prompt, stage="compress")
+        return response.response if not response.error else None
 
     def _build_synthesis_prompt(
         self,
         original_prompt: str,
         responses: list[ModelResponse],
-        reviews: list[PeerReview],
-        mapping: dict[str, str]
+        review_summary: str
     ) -> str:
-        """Build the chairman synthesis prompt."""
+        """Build the chairman synthesis prompt around the peer review summary."""
         # Build responses section
         responses_text = "\n\n".join([
             f"### {r.model_name}\n{r.response}"
             for r in responses if not r.error
         ])
 
-        # Build peer review summary
-        review_summary = self._summarize_reviews(reviews, mapping)
-
         config = self.council_config.get("synthesis", {})
 
         return f"""You are the Chairman of an LLM council. Multiple AI models have responded to a question, and each has peer-reviewed the others.
@@ -772,41 +2033,86 @@ Create a comprehensive final answer that:
 Be decisive. Where models disagree, make a judgment call and explain your reasoning.
 """
 
+    def _build_revision_prompt(
+        self,
+        original_prompt: str,
+        draft: str,
+        review_summary: str,
+        contradictions: list[str],
+        max_words: int = 350
+    ) -> str:
+        """Build the speculative-mode correction prompt: the draft plus what peer review found."""
+        contradiction_text = "\n".join(f"- {c}" for c in contradictions)
+
+        return f"""You are the Chairman of an LLM council. You drafted a synthesis from the council's responses before their peer reviews were in. The reviews are now available.
+
+## Original Question
+{original_prompt}
+
+## Your Draft Synthesis
+{draft}
+
+## Peer Review Summary
+{review_summary}
+
+## Where the Reviews Contradict Your Draft
+{contradiction_text}
+
+## Your Task
+
+Your draft has already been shown to the user. Write a short correction to follow it, at most {max_words} words, headed "## After Peer Review": say which parts of the draft no longer hold and what the answer should be instead. Do not repeat the parts of the draft that stand.
+"""
+
+    def score_matrix(self, reviews: list[PeerReview]) -> ScoreMatrix:
+        """Build the reviewer x response x criterion score matrix (imports NumPy on first use)."""
+        from council_scoring import ScoreMatrix
+
+        scoring_config = self.council_config.get("peer_review", {}).get("scoring", {})
+        criteria = scoring_config.get("criteria", ["accuracy", "completeness", "clarity", "insight"])
+        return ScoreMatrix.from_reviews(reviews, criteria)
+
     def _summarize_reviews(
         self,
         reviews: list[PeerReview],
-        mapping: dict[str, str]
+        mapping: dict[str, str],
+        scores: Optional[ScoreMatrix] = None
     ) -> str:
         """Summarize peer reviews for synthesis."""
         if not reviews:
             return "No peer reviews available."
 
-        # Aggregate scores by response
-        scores_by_response: dict[str, list[int]] = {}
-        feedback_by_response: dict[str, dict] = {}
+        if scores is None:
+            scores = self.score_matrix(reviews)
 
+        feedback_by_response: dict[str, dict] = {}
         for review in reviews:
-            anon_id = review.reviewed_anonymous_id
-            if anon_id not in scores_by_response:
-                scores_by_response[anon_id] = []
-                feedback_by_response[anon_id] = {"strengths": [], "weaknesses": []}
-
-            scores_by_response[anon_id].append(review.total_score)
-            feedback_by_response[anon_id]["strengths"].extend(review.strengths)
-            feedback_by_response[anon_id]["weaknesses"].extend(review.weaknesses)
+            feedback = feedback_by_response.setdefault(
+                review.reviewed_anonymous_id, {"strengths": [], "weaknesses": []}
+            )
+            feedback["strengths"].extend(review.strengths)
+            feedback["weaknesses"].extend(review.weaknesses)
 
         # Build summary text
         lines = ["### Average Scores\n"]
-        lines.append("| Response | Model | Avg Score |")
-        lines.append("|----------|-------|-----------|")
+        lines.append("| Response | Model | Avg Score | Spread (SD) |")
+        lines.append("|----------|-------|-----------|-------------|")
 
-        for anon_id, scores in sorted(scores_by_response.items()):
-            avg = sum(scores) / len(scores) if scores else 0
+        stats = scores.stats()
+        for anon_id in scores.responses:
+            avg = stats["mean_total"][anon_id]
+            variance = stats["total_variance"][anon_id]
             model_name = mapping.get(anon_id, "Unknown")
-            lines.append(f"| {anon_id} | {model_name} | {avg:.1f} |")
+            avg_text = f"{avg:.1f}" if avg is not None else "-"
+            spread_text = f"{variance ** 0.5:.1f}" if variance is not None else "-"
+            lines.append(f"| {anon_id} | {model_name} | {avg_text} | {spread_text} |")
+
+        if stats["rank_agreement"] is not None:
+            lines.append(
+                f"\nReviewer ranking agreement (Kendall tau, -1 to 1): {stats['rank_agreement']:.2f}"
+            )
 
         lines.append("\n### Key Feedback\n")
-        for anon_id in sorted(feedback_by_response.keys()):
+        for anon_id in scores.responses:
             model_name = mapping.get(anon_id, "Unknown")
             feedback = feedback_by_response[anon_id]
 
@@ -824,9 +2130,124 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
         prompt: str,
         system_prompt: Optional[str] = None,
         skip_peer_review: bool = False,
-        models: Optional[list[dict]] = None
+        models: Optional[list[dict]] = None,
+        on_synthesis_chunk: Optional[Callable[[str], None]] = None,
+        chairman: Optional[str] = None,
+        speculative: Optional[bool] = None
+    ) -> CouncilResult:
+        """
+        Execute full three-stage council process.
+
+        Pass `on_synthesis_chunk` to stream the Stage 3 synthesis as it is
+        generated (see run_stage_3), and `chairman` to force a chairman model
+        for this run. `speculative` (default: council.json
+        `synthesis.speculative`) drafts the synthesis during peer review (see
+        run_speculative_stage_3). Every model call made during the run is
+        recorded in `CouncilResult.call_metrics` (see format_metrics).
+        """
+        if speculative is None:
+            speculative = self.council_config.get("synthesis", {}).get("speculative", False)
+
+        result = await self._logged(self._execute(
+            prompt, system_prompt, skip_peer_review, models, on_synthesis_chunk, chairman,
+            speculative
+        ))
+        self._persist(result, prompt, system_prompt)
+        return result
+
+    def load_run(self, run_id: str) -> dict:
+        """A stored run record for replay(), even when saving new runs is disabled."""
+        return self._run_store.load(run_id)
+
+    async def replay(
+        self,
+        record: dict,
+        from_stage: str = "stage_3",
+        on_synthesis_chunk: Optional[Callable[[str], None]] = None,
+        chairman: Optional[str] = None,
+        speculative: Optional[bool] = None
+    ) -> CouncilResult:
+        """
+        Re-run part of a stored council run (see RunStore.load).
+
+        `from_stage` is "stage_2" (new peer review and synthesis from the
+        stored Stage 1 responses), "stage_3" (new synthesis from the stored
+        reviews) or "format" (the stored result as is). Current council.json
+        settings apply, so changed scoring criteria or synthesis options take
+        effect without repeating Stage 1. The chairman defaults to the stored
+        run's. Replays are stored as new runs linked by `replay_of`.
+        """
+        stored = self.result_from_dict(record["result"])
+        stored.run_id = record.get("run_id", stored.run_id)
+        if from_stage == "format":
+            return stored
+        if from_stage not in ("stage_2", "stage_3"):
+            raise ValueError(f"Unknown replay stage: {from_stage} (expected stage_2, stage_3 or format)")
+
+        # Late answers saved with the run are ordinary Stage 1 output for a replay
+        responses = [replace(r, cutoff=False) if r.cutoff and not r.error else r for r in stored.stage_1_responses]
+        names = {r.model_name for r in responses}
+        models = [m for m in self.models_config["models"] if m["name"] in names]
+        if len(models) < 2:
+            raise ValueError("Replay requires at least 2 of the stored run's models in models.json")
+
+        stage_2 = None
+        if from_stage == "stage_3":
+            stage_2 = (stored.stage_2_reviews, stored.anonymous_mapping, stored.review_assignments)
+        # A stored quick run has no reviews to resynthesize from
+        skip_peer_review = from_stage == "stage_3" and not stored.stage_2_reviews
+        if speculative is None:
+            speculative = self.council_config.get("synthesis", {}).get("speculative", False)
+
+        result = await self._logged(self._execute(
+            record["question"], record.get("system_prompt"), skip_peer_review, models,
+            on_synthesis_chunk, chairman or stored.chairman_model, speculative,
+            stage_1_responses=responses, stage_2=stage_2
+        ))
+        if stage_2 is not None:
+            result.review_topology = stored.review_topology
+        result.replay_of = stored.run_id
+        self._persist(result, record["question"], record.get("system_prompt"))
+        return result
+
+    async def _logged(self, run: Awaitable[CouncilResult]) -> CouncilResult:
+        """Await a council run, collecting every model call it makes into call_metrics."""
+        call_log: list[CallMetrics] = []
+        token = _CALL_LOG.set(call_log)
+        try:
+            result = await run
+        finally:
+            _CALL_LOG.reset(token)
+            self.health.save()
+
+        result.call_metrics = call_log
+        return result
+
+    def _persist(self, result: CouncilResult, prompt: str, system_prompt: Optional[str]) -> None:
+        """Append the run to the run store and set its run_id (best-effort, like the cache)."""
+        if self.store is None:
+            return
+        record = {"question": prompt, "system_prompt": system_prompt, "result": self.result_to_dict(result)}
+        result.run_id = self.store.save(record, replay_of=result.replay_of)
+
+    async def _execute(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        skip_peer_review: bool,
+        models: Optional[list[dict]],
+        on_synthesis_chunk: Optional[Callable[[str], None]],
+        chairman_name: Optional[str] = None,
+        speculative: bool = False,
+        stage_1_responses: Optional[list[ModelResponse]] = None,
+        stage_2: Optional[tuple[list[PeerReview], dict[str, str], dict[str, list[str]]]] = None
     ) -> CouncilResult:
-        """Execute full three-stage council process."""
+        """
+        Run the three stages for execute().
+
+        replay() passes stored `stage_1_responses` (and `stage_2` reviews,
+        mapping and assignments) to skip those stages.
+        """
         start_time = time.time()
 
         if models is None:
@@ -836,31 +2257,59 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
             raise ValueError("Council requires at least 2 enabled models")
 
         # Stage 1: Independent responses
-        stage_1_responses = await self.run_stage_1(prompt, system_prompt, models)
+        if stage_1_responses is None:
+            stage_1_responses = await self.run_stage_1(prompt, system_prompt, models, keep_late=True)
 
-        # Stage 2: Peer review
-        if skip_peer_review:
-            stage_2_reviews = []
-            mapping = {}
-        else:
-            stage_2_reviews, mapping = await self.run_stage_2(
-                prompt, stage_1_responses, models
+        topology = self.council_config.get("peer_review", {}).get("topology", "full")
+        synthesis_mode = "standard"
+
+        # Quorum stragglers would hold up Stage 2 as reviewers
+        cutoff = {r.model_name for r in stage_1_responses if r.cutoff}
+        reviewers = [model for model in models if model["name"] not in cutoff]
+
+        if speculative and not skip_peer_review and stage_2 is None:
+            # Stages 2 and 3 overlapped: the chairman drafts while peer review runs
+            chairman = self.select_chairman(
+                models, fixed_model=chairman_name, warm=self.warm_models(stage_1_responses)
             )
+            synthesis, synthesis_mode, stage_2, scores = await self.run_speculative_stage_3(
+                prompt, stage_1_responses, self.run_stage_2(prompt, stage_1_responses, reviewers),
+                chairman, on_chunk=on_synthesis_chunk
+            )
+            stage_2_reviews, mapping, assignments = stage_2
+        else:
+            # Stage 2: Peer review
+            if skip_peer_review:
+                stage_2_reviews = []
+                mapping = {}
+                assignments = {}
+            elif stage_2 is not None:
+                stage_2_reviews, mapping, assignments = stage_2
+            else:
+                stage_2_reviews, mapping, assignments = await self.run_stage_2(
+                    prompt, stage_1_responses, reviewers
+                )
+            scores = self.score_matrix(stage_2_reviews) if stage_2_reviews else None
 
-        # Select chairman
-        chairman = self.select_chairman(models)
+            # Select chairman
+            chairman = self.select_chairman(
+                models, fixed_model=chairman_name, warm=self.warm_models(stage_1_responses)
+            )
 
-        # Stage 3: Synthesis
-        synthesis = await self.run_stage_3(
-            prompt, stage_1_responses, stage_2_reviews, mapping, chairman
-        )
+            # Stage 3: Synthesis
+            synthesis = await self.run_stage_3(
+                prompt, stage_1_responses, stage_2_reviews, mapping, chairman,
+                on_chunk=on_synthesis_chunk, scores=scores
+            )
 
         total_latency = (time.time() - start_time) * 1000
 
-        # Extract consensus and disagreements from synthesis
-        consensus, disagreements, unique = self._extract_findings(
-            stage_1_responses, stage_2_reviews
-        )
+        # Record quorum stragglers, attaching any that finished in the meantime
+        stage_1_responses = self._attach_late_responses(stage_1_responses)
+        cutoff_models = [r.model_name for r in stage_1_responses if r.cutoff]
+
+        # Consensus and disagreements from the peer review scores
+        consensus, disagreements, unique = self._extract_findings(scores, mapping)
 
         return CouncilResult(
             stage_1_responses=stage_1_responses,
@@ -871,31 +2320,188 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
             unique_insights=unique,
             chairman_model=chairman["name"],
             total_latency_ms=total_latency,
-            anonymous_mapping=mapping
+            anonymous_mapping=mapping,
+            cutoff_models=cutoff_models,
+            review_stats=scores.stats() if scores is not None else {},
+            review_topology=topology if assignments else None,
+            review_assignments=assignments,
+            synthesis_mode=synthesis_mode
         )
 
     def _extract_findings(
         self,
-        responses: list[ModelResponse],
-        reviews: list[PeerReview]
+        scores: Optional[ScoreMatrix],
+        mapping: dict[str, str]
     ) -> tuple[list[str], list[str], dict[str, list[str]]]:
-        """Extract consensus, disagreements, and unique insights."""
-        # Placeholder - actual implementation would analyze responses
-        return [], [], {}
+        """
+        Extract consensus, disagreements, and unique insights.
+
+        Agreement is measured on the peer review scores against council.json
+        `thresholds` (see ScoreMatrix.findings); unique insights are keyed by
+        model name.
+        """
+        if scores is None:
+            return [], [], {}
+        return scores.findings(labels=mapping, thresholds=self.council_config.get("thresholds"))
+
+    def summarize_metrics(self, calls: list[CallMetrics]) -> dict[str, dict]:
+        """Aggregate call metrics per stage: wall time, latency, tokens and serving path."""
+        stages: dict[str, dict] = {}
+
+        for m in calls:
+            stage = stages.setdefault(m.stage, {
+                "calls": 0,
+                "errors": 0,
+                "retries": 0,
+                "first_start": m.started_at,
+                "last_end": m.started_at,
+                "max_total_ms": 0.0,
+                "sum_total_ms": 0.0,
+                "sum_queue_wait_ms": 0.0,
+                "sum_slot_wait_ms": 0.0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "paths": {},
+            })
+            stage["calls"] += 1
+            stage["errors"] += 1 if m.error else 0
+            stage["retries"] += m.retries
+            stage["first_start"] = min(stage["first_start"], m.started_at)
+            stage["last_end"] = max(stage["last_end"], m.started_at + m.total_ms / 1000)
+            stage["max_total_ms"] = max(stage["max_total_ms"], m.total_ms)
+            stage["sum_total_ms"] += m.total_ms
+            stage["sum_queue_wait_ms"] += m.queue_wait_ms
+            stage["sum_slot_wait_ms"] += m.slot_wait_ms
+            stage["prompt_tokens"] += m.prompt_tokens or 0
+            stage["completion_tokens"] += m.completion_tokens or 0
+            if m.path:
+                stage["paths"][m.path] = stage["paths"].get(m.path, 0) + 1
+
+        summary = {}
+        for name, stage in stages.items():
+            summary[name] = {
+                "calls": stage["calls"],
+                "errors": stage["errors"],
+                "retries": stage["retries"],
+                "wall_ms": round((stage["last_end"] - stage["first_start"]) * 1000, 1),
+                "max_call_ms": round(stage["max_total_ms"], 1),
+                "mean_call_ms": round(stage["sum_total_ms"] / stage["calls"], 1),
+                "queue_wait_ms": round(stage["sum_queue_wait_ms"], 1),
+                "slot_wait_ms": round(stage["sum_slot_wait_ms"], 1),
+                "prompt_tokens": stage["prompt_tokens"],
+                "completion_tokens": stage["completion_tokens"],
+                "paths": stage["paths"],
+            }
+        return summary
+
+    def result_to_dict(self, result: CouncilResult) -> dict:
+        """Convert a council result to JSON-serializable data, dropping stream and task handles."""
+        responses = []
+        for resp in result.stage_1_responses:
+            responses.append({
+                "model_name": resp.model_name,
+                "response": resp.response,
+                "latency_ms": resp.latency_ms,
+                "tokens_used": resp.tokens_used,
+                "error": resp.error,
+                "cutoff": resp.cutoff,
+                "metrics": asdict(resp.metrics) if resp.metrics else None,
+            })
+
+        return {
+            "stage_1_responses": responses,
+            "stage_2_reviews": [asdict(review) for review in result.stage_2_reviews],
+            "stage_3_synthesis": result.stage_3_synthesis,
+            "consensus_items": result.consensus_items,
+            "disagreements": result.disagreements,
+            "unique_insights": result.unique_insights,
+            "chairman_model": result.chairman_model,
+            "total_latency_ms": result.total_latency_ms,
+            "anonymous_mapping": result.anonymous_mapping,
+            "cutoff_models": result.cutoff_models,
+            "call_metrics": [asdict(m) for m in result.call_metrics],
+            "review_stats": result.review_stats,
+            "review_topology": result.review_topology,
+            "review_assignments": result.review_assignments,
+            "synthesis_mode": result.synthesis_mode,
+            "run_id": result.run_id,
+            "replay_of": result.replay_of,
+        }
 
-    def format_result(self, result: CouncilResult) -> str:
-        """Format council result for display."""
+    def result_from_dict(self, data: dict) -> CouncilResult:
+        """Rebuild a council result from result_to_dict output (e.g. a stored run)."""
+        def metrics(m: Optional[dict]) -> Optional[CallMetrics]:
+            return CallMetrics(**m) if m else None
+
+        responses = [
+            ModelResponse(
+                model_name=r["model_name"],
+                response=r["response"],
+                latency_ms=r["latency_ms"],
+                tokens_used=r.get("tokens_used", 0),
+                error=r.get("error"),
+                cutoff=r.get("cutoff", False),
+                metrics=metrics(r.get("metrics")),
+            )
+            for r in data["stage_1_responses"]
+        ]
+        return CouncilResult(
+            stage_1_responses=responses,
+            stage_2_reviews=[PeerReview(**r) for r in data.get("stage_2_reviews", [])],
+            stage_3_synthesis=data.get("stage_3_synthesis", ""),
+            consensus_items=data.get("consensus_items", []),
+            disagreements=data.get("disagreements", []),
+            unique_insights=data.get("unique_insights", {}),
+            chairman_model=data["chairman_model"],
+            total_latency_ms=data.get("total_latency_ms", 0.0),
+            anonymous_mapping=data.get("anonymous_mapping", {}),
+            cutoff_models=data.get("cutoff_models", []),
+            call_metrics=[metrics(m) for m in data.get("call_metrics", [])],
+            review_stats=data.get("review_stats", {}),
+            review_topology=data.get("review_topology"),
+            review_assignments=data.get("review_assignments", {}),
+            synthesis_mode=data.get("synthesis_mode", "standard"),
+            run_id=data.get("run_id"),
+            replay_of=data.get("replay_of"),
+        )
+
+    def format_metrics(self, result: CouncilResult) -> str:
+        """Format per-stage and per-call timing/token metrics as JSON."""
+        return json.dumps({
+            "total_latency_ms": round(result.total_latency_ms, 1),
+            "stages": self.summarize_metrics(result.call_metrics),
+            "calls": [asdict(m) for m in result.call_metrics],
+        }, indent=2)
+
+    def format_result(self, result: CouncilResult, include_synthesis: bool = True) -> str:
+        """
+        Format council result for display.
+
+        Set `include_synthesis=False` when the synthesis was already streamed.
+        """
         lines = [
             "# Council Result",
             f"**Chairman**: {result.chairman_model}",
             f"**Total Time**: {result.total_latency_ms:.0f}ms",
+        ]
+        if result.cutoff_models:
+            lines.append(f"**Cut off by quorum**: {', '.join(result.cutoff_models)}")
+        if result.run_id:
+            replay = f" (replay of {result.replay_of})" if result.replay_of else ""
+            lines.append(f"**Run**: {result.run_id}{replay}")
+        if result.synthesis_mode != "standard":
+            lines.append(f"**Synthesis**: {result.synthesis_mode} (drafted during peer review)")
+        lines.extend([
             "",
             "## Stage 1: Individual Responses",
             ""
-        ]
+        ])
 
         for resp in result.stage_1_responses:
-            if resp.error:
+            if resp.cutoff and not resp.error:
+                lines.append(f"### {resp.model_name} (late, not reviewed)")
+                lines.append(resp.response)
+            elif resp.error:
                 lines.append(f"### {resp.model_name} (ERROR)")
                 lines.append(f"*{resp.error}*")
             else:
@@ -906,6 +2512,10 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
         if result.stage_2_reviews:
             lines.append("## Stage 2: Peer Evaluation")
             lines.append("")
+            if result.review_topology and result.review_topology != "full":
+                assigned = sum(len(ids) for ids in result.review_assignments.values())
+                lines.append(f"*Review topology: {result.review_topology} ({assigned} assigned reviews)*")
+                lines.append("")
             lines.append("| Response | Reviewer | Score |")
             lines.append("|----------|----------|-------|")
 
@@ -917,9 +2527,19 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
                 )
             lines.append("")
 
-        lines.append("## Stage 3: Chairman Synthesis")
-        lines.append("")
-        lines.append(result.stage_3_synthesis)
+        if result.consensus_items or result.disagreements:
+            lines.append("## Reviewer Agreement")
+            lines.append("")
+            for item in result.consensus_items:
+                lines.append(f"- Consensus: {item}")
+            for item in result.disagreements:
+                lines.append(f"- Disagreement: {item}")
+            lines.append("")
+
+        if include_synthesis:
+            lines.append("## Stage 3: Chairman Synthesis")
+            lines.append("")
+            lines.append(result.stage_3_synthesis)
 
         return "\n".join(lines)
 
@@ -927,11 +2547,11 @@ Be decisive. Where models disagree, make a judgment call and explain your reason
 # For running directly
 if __name__ == "__main__":
     async def main():
-        engine = CouncilEngine()
-        result = await engine.execute(
-            "What are the key considerations when choosing a database for a new project?",
-            skip_peer_review=False
-        )
-        print(engine.format_result(result))
+        async with CouncilEngine() as engine:
+            result = await engine.execute(
+                "What are the key considerations when choosing a database for a new project?",
+                skip_peer_review=False
+            )
+            print(engine.format_result(result))
 
     asyncio.run(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Council Model Health
+
+Rolling per-model history of call latency and errors, kept across runs in a
+small JSON file so that choices depending on it (chairman selection) do not
+start from scratch with every process. Each model keeps its last `window`
+calls that went to a provider (CLI or API; cache hits are not recorded),
+dropping samples older than `max_age_hours`. The rotating chairman position is
+stored here too.
+
+The registry also keeps a circuit breaker per call path: "cli:<name>" for a
+provider CLI and "api:<provider>@<host>" for an HTTP endpoint. After
+`failure_threshold` consecutive outage-type failures the circuit opens and
+callers skip that path for `cooldown_seconds`; afterwards it is half-open and
+the next call (or the engine's background probe) decides. A failure while
+half-open reopens it with the cooldown doubled, up to `max_cooldown_seconds`.
+
+Writes are best-effort and last-writer-wins: concurrent processes may drop
+each other's newest samples, never corrupt the file.
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_HEALTH_PATH = (
+    Path(os.environ.get("XDG_STATE_HOME", Path.home() / ".local" / "state")) / "llm-council" / "health.json"
+)
+
+
+class HealthRegistry:
+    """Per-model latency/error history, persisted to `path` (in memory only when None)."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        window: int = 50,
+        max_age_hours: float = 168,
+        circuit: Optional[dict] = None
+    ):
+        self.path = path
+        self.window = window
+        self.max_age_seconds = max_age_hours * 3600
+        circuit = circuit or {}
+        self.failure_threshold = circuit.get("failure_threshold", 3)
+        self.cooldown_seconds = circuit.get("cooldown_seconds", 60)
+        self.max_cooldown_seconds = circuit.get("max_cooldown_seconds", 900)
+        self.samples: dict[str, list[list]] = {}  # model -> [[timestamp, latency_ms, ok], ...]
+        self.circuits: dict[str, dict] = {}  # path key -> {"failures", "opened_at", "cooldown"}
+        self.rotation = 0  # Rotating chairman position
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        self.samples = {name: list(s) for name, s in data.get("models", {}).items()}
+        self.rotation = int(data.get("rotation", 0))
+        self.circuits = {key: dict(c) for key, c in data.get("circuits", {}).items()}
+
+    def save(self) -> None:
+        """Write the registry if anything changed since the last save."""
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"rotation": self.rotation, "models": self.samples, "circuits": self.circuits}, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # Unsaved samples are rebuilt by the next runs
+
+    def record(self, model: str, latency_ms: float, ok: bool) -> None:
+        """Add one provider call's outcome to the model's rolling window."""
+        samples = self.samples.setdefault(model, [])
+        samples.append([round(time.time(), 1), round(latency_ms, 1), ok])
+        del samples[:-self.window]
+        self._dirty = True
+
+    def next_rotation(self) -> int:
+        """Current rotating-chairman position, advancing it for the next run."""
+        position = self.rotation
+        self.rotation += 1
+        self._dirty = True
+        return position
+
+    def open_for(self, key: str) -> Optional[float]:
+        """Seconds until the circuit for `key` half-opens, or None if calls may go through."""
+        circuit = self.circuits.get(key)
+        if not circuit or circuit.get("opened_at") is None:
+            return None
+        remaining = circuit["opened_at"] + circuit["cooldown"] - time.time()
+        return remaining if remaining > 0 else None
+
+    def record_outcome(self, key: str, ok: bool) -> bool:
+        """
+        Update the circuit for `key` after a call; True if this failure opened it.
+
+        Failures from calls that were already in flight when the circuit
+        opened do not extend the cooldown.
+        """
+        circuit = self.circuits.get(key)
+        if ok:
+            if circuit is not None:
+                del self.circuits[key]
+                self._dirty = True
+            return False
+
+        if circuit is None:
+            circuit = self.circuits[key] = {"failures": 0, "opened_at": None, "cooldown": self.cooldown_seconds}
+        circuit["failures"] += 1
+        self._dirty = True
+        if circuit["failures"] < self.failure_threshold or self.open_for(key) is not None:
+            return False
+        if circuit["opened_at"] is not None:
+            # Failed again while half-open: back off further
+            circuit["cooldown"] = min(circuit["cooldown"] * 2, self.max_cooldown_seconds)
+        circuit["opened_at"] = round(time.time(), 1)
+        return True
+
+    def open_circuits(self) -> dict[str, float]:
+        """Open circuits and the seconds left in their cooldowns."""
+        remaining = {key: self.open_for(key) for key in self.circuits}
+        return {key: round(seconds, 1) for key, seconds in remaining.items() if seconds is not None}
+
+    def stats(self, model: str) -> dict:
+        """
+        Recent calls, error rate and median successful latency for a model.
+
+        `median_ms` is None until the model has a successful call in the window.
+        """
+        cutoff = time.time() - self.max_age_seconds
+        recent = [s for s in self.samples.get(model, []) if s[0] >= cutoff]
+        latencies = [s[1] for s in recent if s[2]]
+        errors = len(recent) - len(latencies)
+        return {
+            "calls": len(recent),
+            "errors": errors,
+            "error_rate": errors / len(recent) if recent else 0.0,
+            "median_ms": statistics.median(latencies) if latencies else None,
+        }
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Council Rate Limits
+
+Client-side throttling and retry policy for provider HTTP APIs. Each provider
+gets a token bucket that every call in the engine draws from, 429 responses
+pause the whole provider for the server-requested interval and temporarily
+halve its rate, and retryable failures are retried with jittered exponential
+backoff that honours Retry-After and the providers' rate-limit reset headers.
+No caller waits longer than retry.max_delay_seconds on the server's say-so:
+when a provider asks for more, calls fail with RateLimitError until the
+requested time has passed.
+"""
+
+import asyncio
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Mapping, Optional
+
+# Status codes worth retrying: rate limited, timeouts, overloaded or transient server errors
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Headers that carry "remaining"/"reset" pairs, in provider order (OpenAI/DeepSeek, Anthropic),
+# and whether the budget they count is tokens (else requests)
+_RESET_HEADERS = [
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests", False),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens", True),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset", False),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset", True),
+]
+
+
+class RateLimitError(RuntimeError):
+    """The provider asked us to wait longer than retry.max_delay_seconds."""
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """
+    Parse a reset header into seconds from now.
+
+    Accepts plain seconds ("12"), OpenAI-style durations ("1m30s", "250ms"),
+    RFC 3339 timestamps (Anthropic) and HTTP dates (Retry-After).
+    """
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        from email.utils import parsedate_to_datetime  # Rare path; keep module import cheap
+
+        try:
+            reset_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, reset_at.timestamp() - time.time())
+
+
+def retry_after_seconds(headers: Mapping[str, str], request_tokens: int = 1) -> Optional[float]:
+    """
+    How long the server asked us to wait, from Retry-After or exhausted rate-limit headers.
+
+    A budget counts as exhausted when no request is left, or fewer tokens
+    than a request of `request_tokens` needs.
+    """
+    if headers.get("retry-after-ms"):
+        try:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if headers.get("retry-after"):
+        delay = _parse_reset(headers["retry-after"])
+        if delay is not None:
+            return delay
+
+    delays = []
+    for remaining_header, reset_header, counts_tokens in _RESET_HEADERS:
+        if not headers.get(remaining_header) or not headers.get(reset_header):
+            continue
+        try:
+            remaining = float(headers[remaining_header])
+        except ValueError:
+            continue
+        if remaining < (request_tokens if counts_tokens else 1):
+            delay = _parse_reset(headers[reset_header])
+            if delay is not None:
+                delays.append(delay)
+    return max(delays) if delays else None
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of polling.
+
+    Tokens may go negative: each caller takes one immediately and sleeps for
+    its share of the deficit, so concurrent waiters are served in arrival order.
+    A bucket without a rate never throttles but still honours pause().
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: float = 1.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if not self.rate:
+            return
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it."""
+        now = time.monotonic()
+        if not self.rate:
+            return max(0.0, self.paused_until - now)
+        self._refill(now)
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least this long (server said slow down)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def throttle(self) -> None:
+        """Halve the rate after a 429; recover() restores it gradually."""
+        if not self.rate:
+            return
+        self._refill(time.monotonic())
+        self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def recover(self) -> None:
+        """Step the rate back towards its configured maximum after a success."""
+        if self.rate and self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate * 1.25)
+
+
+class RateLimiter:
+    """Per-provider token buckets plus the retry/backoff policy, shared by one engine."""
+
+    def __init__(self, rate_limits: Optional[dict] = None, retry: Optional[dict] = None):
+        self.rate_limits = rate_limits or {}
+        retry = retry or {}
+        self.max_attempts = max(1, retry.get("max_attempts", 4))
+        self.base_delay = retry.get("base_delay_seconds", 0.5)
+        self.max_delay = retry.get("max_delay_seconds", 30.0)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, provider: str) -> TokenBucket:
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            limit = self.rate_limits.get(provider) or self.rate_limits.get("default") or {}
+            rate = limit.get("requests_per_second")
+            bucket = TokenBucket(rate, limit.get("burst") or max(1.0, rate or 1.0))
+            self._buckets[provider] = bucket
+        return bucket
+
+    async def acquire(self, provider: str) -> float:
+        """
+        Wait for the provider's next request slot; return the seconds spent waiting.
+
+        Raises RateLimitError while the provider is paused for longer than
+        max_delay instead of parking the call.
+        """
+        bucket = self._bucket(provider)
+        paused_for = bucket.paused_until - time.monotonic()
+        if paused_for > self.max_delay:
+            raise RateLimitError(
+                f"{provider} rate limit exhausted; server asked to wait {paused_for:.0f}s "
+                f"(more than retry.max_delay_seconds={self.max_delay:g})"
+            )
+        wait = bucket.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential delay for a retry, never shorter than what the server asked for."""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def on_response(
+        self,
+        provider: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        request_tokens: int = 1
+    ) -> Optional[float]:
+        """
+        Feed a response back into the provider's bucket.
+
+        A 429 (or rate-limit headers exhausted for a request of
+        `request_tokens`) pauses every caller for the provider and halves its
+        rate; successes recover the rate. Returns the server-requested delay,
+        if any. Pauses longer than max_delay make acquire() fail rather than
+        wait (see RateLimitError).
+        """
+        bucket = self._bucket(provider)
+        retry_after = retry_after_seconds(headers, request_tokens)
+        if status_code == 429:
+            bucket.throttle()
+            bucket.pause(retry_after if retry_after is not None else self.base_delay)
+        elif retry_after is not None:
+            bucket.pause(retry_after)
+        elif status_code < 400:
+            bucket.recover()
+        return retry_after
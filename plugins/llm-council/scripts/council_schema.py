@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Council Structured Output
+
+JSON schemas for the council's machine-read answers (peer reviews, decision
+analyses), the provider-specific ways of requesting them, and a small local
+validator. Providers are asked for schema-conforming JSON natively where they
+support it:
+
+- openai:    response_format json_schema
+- google:    generationConfig responseMimeType + responseSchema
+- anthropic: a forced tool call whose input_schema is the schema
+- deepseek, openai_compatible: response_format json_object, with the schema
+  in the prompt
+
+CLI calls get the schema in the prompt. Every answer is validated here; the
+engine sends one repair request when validation fails (see
+CouncilEngine.call_structured).
+"""
+
+import json
+from typing import Any, Optional
+
+_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+}
+
+# Keys Gemini's responseSchema (an OpenAPI subset) accepts
+_GOOGLE_KEYS = {
+    "type", "format", "description", "nullable", "enum", "properties", "required",
+    "items", "minItems", "maxItems", "minimum", "maximum", "propertyOrdering",
+}
+
+
+def schema_name(schema: dict) -> str:
+    """Identifier for the schema in provider requests (its title)."""
+    return schema.get("title", "response")
+
+
+def peer_review_schema(response_ids: list[str], criteria: list[str], scale: int) -> dict:
+    """Schema for one reviewer's evaluations of the anonymized responses."""
+    return {
+        "title": "peer_review",
+        "type": "object",
+        "properties": {
+            "evaluations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "response_id": {"type": "string", "enum": response_ids},
+                        "scores": {
+                            "type": "object",
+                            "properties": {
+                                c: {"type": "integer", "minimum": 1, "maximum": scale}
+                                for c in criteria
+                            },
+                            "required": criteria,
+                            "additionalProperties": False,
+                        },
+                        "strengths": {"type": "array", "items": {"type": "string"}},
+                        "weaknesses": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["response_id", "scores", "strengths", "weaknesses"],
+                    "additionalProperties": False,
+                },
+                "minItems": len(response_ids),
+            },
+            "ranking": {
+                "type": "array",
+                "items": {"type": "string", "enum": response_ids},
+                "minItems": len(response_ids),
+            },
+        },
+        "required": ["evaluations", "ranking"],
+        "additionalProperties": False,
+    }
+
+
+def decision_analysis_schema(options: list[str], criteria: list[str], scale: int = 10) -> dict:
+    """Schema for one model's scored analysis of the decision options."""
+    def per_option(value_schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {opt: value_schema for opt in options},
+            "required": options,
+            "additionalProperties": False,
+        }
+
+    string_list = {"type": "array", "items": {"type": "string"}}
+    return {
+        "title": "decision_analysis",
+        "type": "object",
+        "properties": {
+            "scores": per_option({
+                "type": "object",
+                "properties": {
+                    c: {"type": "integer", "minimum": 1, "maximum": scale} for c in criteria
+                },
+                "required": criteria,
+                "additionalProperties": False,
+            }),
+            "pros_cons": per_option({
+                "type": "object",
+                "properties": {"pros": string_list, "cons": string_list},
+                "required": ["pros", "cons"],
+                "additionalProperties": False,
+            }),
+            "recommendation": {"type": "string", "enum": options},
+            "reasoning": {"type": "string"},
+        },
+        "required": ["scores", "pros_cons", "recommendation", "reasoning"],
+        "additionalProperties": False,
+    }
+
+
+def _type_matches(value: Any, expected: str) -> bool:
+    if expected == "integer":
+        if isinstance(value, bool):
+            return False
+        return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+    if expected == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if expected == "null":
+        return value is None
+    return isinstance(value, _TYPES[expected])
+
+
+def validate(data: Any, schema: dict, path: str = "$") -> list[str]:
+    """
+    Check `data` against the JSON Schema subset used here.
+
+    Supports type, enum, properties, required, additionalProperties, items,
+    minItems, minimum and maximum. Returns human-readable problems (empty
+    when valid).
+    """
+    expected = schema.get("type")
+    if expected and not _type_matches(data, expected):
+        return [f"{path}: expected {expected}, got {type(data).__name__}"]
+
+    problems = []
+    if "enum" in schema and data not in schema["enum"]:
+        problems.append(f"{path}: {data!r} is not one of {schema['enum']}")
+    if "minimum" in schema and isinstance(data, (int, float)) and data < schema["minimum"]:
+        problems.append(f"{path}: {data} is below the minimum {schema['minimum']}")
+    if "maximum" in schema and isinstance(data, (int, float)) and data > schema["maximum"]:
+        problems.append(f"{path}: {data} is above the maximum {schema['maximum']}")
+
+    if isinstance(data, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", []):
+            if key not in data:
+                problems.append(f"{path}: missing required field {key!r}")
+        for key, value in data.items():
+            if key in properties:
+                problems.extend(validate(value, properties[key], f"{path}.{key}"))
+            elif schema.get("additionalProperties") is False:
+                problems.append(f"{path}: unexpected field {key!r}")
+    elif isinstance(data, list):
+        if len(data) < schema.get("minItems", 0):
+            problems.append(f"{path}: expected at least {schema['minItems']} items, got {len(data)}")
+        for i, item in enumerate(data if "items" in schema else []):
+            problems.extend(validate(item, schema["items"], f"{path}[{i}]"))
+
+    return problems
+
+
+def parse_json(text: str) -> Any:
+    """
+    Decode the JSON value in a model answer.
+
+    Native JSON modes return bare JSON; CLI and prompt-only answers may wrap
+    it in a code fence or prose, so the first complete JSON object or array
+    in the text is used. Raises ValueError when there is none.
+    """
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    decoder = json.JSONDecoder()
+    for i, char in enumerate(text):
+        if char in "{[":
+            try:
+                return decoder.raw_decode(text, i)[0]
+            except json.JSONDecodeError:
+                continue
+    raise ValueError("No JSON object found in the response")
+
+
+def check_answer(text: str, schema: dict) -> tuple[Optional[Any], list[str]]:
+    """Parse and validate an answer: (data, []) when valid, (None, problems) otherwise."""
+    try:
+        data = parse_json(text)
+    except ValueError as e:
+        return None, [str(e)]
+    problems = validate(data, schema)
+    return (None, problems) if problems else (data, [])
+
+
+def schema_instructions(schema: dict) -> str:
+    """Prompt suffix that asks for bare JSON matching `schema` (CLI and json_object paths)."""
+    return (
+        "\n\nRespond with only a JSON object (no prose, no code fence) that matches "
+        f"this JSON Schema:\n{json.dumps(schema, ensure_ascii=False)}"
+    )
+
+
+def repair_prompt(answer: str, problems: list[str], schema: dict, original_prompt: str) -> str:
+    """
+    Targeted follow-up that sends back an invalid answer with what was wrong with it.
+
+    The original prompt is repeated so that problems such as a missing
+    evaluation can be fixed, not just reformatted.
+    """
+    problem_list = "\n".join(f"- {p}" for p in problems[:20])
+    return f"""Your previous answer to the request below was not valid JSON for the required schema.
+
+## Original Request
+{original_prompt}
+
+## Your Previous Answer
+{answer}
+
+## Problems
+{problem_list}
+
+## Your Task
+Return your answer to the original request as corrected JSON. Keep the judgments you already made and add \
+whatever the problems say is missing.{schema_instructions(schema)}"""
+
+
+def _google_schema(schema: dict) -> dict:
+    """Translate a JSON Schema into Gemini's OpenAPI-subset responseSchema."""
+    converted = {}
+    for key, value in schema.items():
+        if key not in _GOOGLE_KEYS:
+            continue
+        if key == "type":
+            converted[key] = value.upper()
+        elif key == "properties":
+            converted[key] = {name: _google_schema(sub) for name, sub in value.items()}
+            converted["propertyOrdering"] = list(value)
+        elif key == "items":
+            converted[key] = _google_schema(value)
+        else:
+            converted[key] = value
+    return converted
+
+
+def apply_schema(provider: str, body: dict, schema: dict) -> None:
+    """Add the provider's native structured-output options for `schema` to a request body."""
+    name = schema_name(schema)
+    if provider == "openai":
+        body["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": name, "schema": schema, "strict": False},
+        }
+    elif provider == "google":
+        config = body.setdefault("generationConfig", {})
+        config["responseMimeType"] = "application/json"
+        config["responseSchema"] = _google_schema(schema)
+    elif provider == "anthropic":
+        body["tools"] = [{
+            "name": name,
+            "description": "Record your answer in this structure.",
+            "input_schema": schema,
+        }]
+        body["tool_choice"] = {"type": "tool", "name": name}
+    else:
+        # OpenAI-compatible endpoints without json_schema support (deepseek, local servers)
+        body["response_format"] = {"type": "json_object"}
+        body["messages"][-1]["content"] += schema_instructions(schema)
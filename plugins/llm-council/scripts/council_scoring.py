@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Council Score Aggregation
+
+Peer-review and decision scores as one NumPy array of shape
+(reviewer, response, criterion), built once per run. Unscored cells are NaN
+(reviewers never score their own response), so every statistic is a single
+vectorized reduction instead of nested dict loops:
+
+- means and variance of each response's total score across reviewers
+- Kendall tau-b agreement between reviewers' rankings
+- consensus and disagreement findings against council.json `thresholds`
+
+Imported on first use by the engine, so commands that never aggregate scores
+do not pay for NumPy.
+"""
+
+import warnings
+from typing import Callable, Optional
+
+import numpy as np
+
+DEFAULT_THRESHOLDS = {
+    "consensus": 1.0,  # Share of reviewers that must agree for consensus
+    "high_agreement": 0.67,  # Below this share, a response or criterion is contested
+    "score_tolerance": 1.0,  # Points from the median (per criterion) that still count as agreeing
+}
+
+
+def _nan_reduce(func: Callable, values: np.ndarray, axis: int) -> np.ndarray:
+    """Apply a nan* reduction, yielding NaN quietly for all-missing slices."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return func(values, axis=axis)
+
+
+class ScoreMatrix:
+    """Scores indexed [reviewer, response, criterion], with NaN for missing scores."""
+
+    def __init__(
+        self,
+        reviewers: list[str],
+        responses: list[str],
+        criteria: list[str],
+        scores: np.ndarray,
+        ranks: Optional[np.ndarray] = None
+    ):
+        self.reviewers = reviewers
+        self.responses = responses
+        self.criteria = criteria
+        self.scores = scores
+        # Explicit rankings [reviewer, response] (1 = best); derived from totals when absent
+        self.ranks = ranks
+
+    @classmethod
+    def from_reviews(cls, reviews: list, criteria: Optional[list[str]] = None) -> "ScoreMatrix":
+        """Build the matrix from PeerReviews (reviewer model x anonymous response)."""
+        reviewers = list(dict.fromkeys(r.reviewer_model for r in reviews))
+        # Presentation order: "Response Z" before "Response AA"
+        responses = sorted({r.reviewed_anonymous_id for r in reviews}, key=lambda a: (len(a), a))
+        if criteria is None:
+            criteria = list(dict.fromkeys(c for r in reviews for c in r.scores))
+
+        reviewer_index = {name: i for i, name in enumerate(reviewers)}
+        response_index = {anon_id: j for j, anon_id in enumerate(responses)}
+        criterion_index = {c: k for k, c in enumerate(criteria)}
+
+        scores = np.full((len(reviewers), len(responses), len(criteria)), np.nan)
+        ranks = np.full((len(reviewers), len(responses)), np.nan)
+        for review in reviews:
+            i = reviewer_index[review.reviewer_model]
+            j = response_index[review.reviewed_anonymous_id]
+            ranks[i, j] = review.ranking
+            for criterion, score in review.scores.items():
+                if criterion in criterion_index:
+                    scores[i, j, criterion_index[criterion]] = score
+
+        return cls(reviewers, responses, criteria, scores, ranks)
+
+    @classmethod
+    def from_analyses(cls, analyses: list[dict], options: list[str], criteria: list[str]) -> "ScoreMatrix":
+        """Build the matrix from decide analyses (analyst model x option)."""
+        reviewers = [a.get("model", f"analysis {i + 1}") for i, a in enumerate(analyses)]
+        scores = np.full((len(analyses), len(options), len(criteria)), np.nan)
+        for i, analysis in enumerate(analyses):
+            option_scores = analysis.get("scores", {})
+            for j, option in enumerate(options):
+                for k, criterion in enumerate(criteria):
+                    value = option_scores.get(option, {}).get(criterion)
+                    if isinstance(value, (int, float)):
+                        scores[i, j, k] = value
+        return cls(reviewers, options, criteria, scores)
+
+    @property
+    def empty(self) -> bool:
+        return not np.isfinite(self.scores).any()
+
+    def totals(self) -> np.ndarray:
+        """[reviewer, response] total over criteria; NaN unless every criterion was scored."""
+        return self.scores.sum(axis=2)
+
+    def mean_totals(self) -> np.ndarray:
+        """[response] mean total score across the reviewers that scored it."""
+        return _nan_reduce(np.nanmean, self.totals(), axis=0)
+
+    def mean_scores(self) -> np.ndarray:
+        """[response, criterion] mean score across reviewers."""
+        return _nan_reduce(np.nanmean, self.scores, axis=0)
+
+    def total_variance(self) -> np.ndarray:
+        """[response] population variance of the total score across reviewers."""
+        return _nan_reduce(np.nanvar, self.totals(), axis=0)
+
+    def reviewer_counts(self) -> np.ndarray:
+        """[response] number of reviewers with a complete score for it."""
+        return np.isfinite(self.totals()).sum(axis=0)
+
+    def rank_agreement(self) -> Optional[float]:
+        """
+        Mean pairwise Kendall tau-b between reviewers' rankings.
+
+        Each pair of reviewers is compared on the responses both ranked
+        (peer reviewers skip their own). 1.0 is identical order, -1.0 reversed;
+        None when no pair shares two responses.
+        """
+        order = -self.ranks if self.ranks is not None else self.totals()
+        valid = np.isfinite(order)
+        if len(self.reviewers) < 2:
+            return None
+
+        filled = np.where(valid, order, 0.0)
+        # [reviewer, i, j] sign of the preference between responses i and j
+        signs = np.sign(filled[:, :, None] - filled[:, None, :])
+        pair_valid = (valid[:, :, None] & valid[:, None, :]).astype(float)
+        signs *= pair_valid
+
+        # Upper triangle only: each unordered response pair counted once
+        upper = np.triu(np.ones(order.shape[1]), k=1)
+        signs *= upper
+        pair_valid *= upper
+
+        concordance = np.einsum("aij,bij->ab", signs, signs)
+        untied = np.einsum("aij,bij->ab", signs ** 2, pair_valid)  # a's untied pairs shared with b
+        with np.errstate(all="ignore"):
+            tau = concordance / np.sqrt(untied * untied.T)
+
+        off_diagonal = ~np.eye(len(self.reviewers), dtype=bool)
+        shared = np.einsum("aij,bij->ab", pair_valid, pair_valid) > 0
+        values = tau[off_diagonal & shared & np.isfinite(tau)]
+        return float(values.mean()) if values.size else None
+
+    def agreement(self, tolerance: float) -> np.ndarray:
+        """
+        [response, criterion] share of reviewers within `tolerance` of the median score.
+
+        NaN where fewer than two reviewers scored the cell.
+        """
+        valid = np.isfinite(self.scores)
+        counts = valid.sum(axis=0)
+        median = _nan_reduce(np.nanmedian, self.scores, axis=0)
+        with np.errstate(invalid="ignore"):
+            close = (np.abs(self.scores - median[None]) <= tolerance) & valid
+        share = close.sum(axis=0) / np.maximum(counts, 1)
+        return np.where(counts >= 2, share, np.nan)
+
+    def first_place_votes(self) -> tuple[np.ndarray, int]:
+        """
+        [response] reviewers that ranked it first, and how many reviewers voted.
+
+        Only reviewers that compared two or more responses vote; with fewer
+        than two such reviewers nobody does and the count is 0.
+        """
+        order = -self.ranks if self.ranks is not None else self.totals()
+        has_order = np.isfinite(order).sum(axis=1) >= 2
+        if has_order.sum() < 2:
+            return np.zeros(len(self.responses), dtype=int), 0
+        firsts = np.nanargmax(np.where(np.isfinite(order), order, -np.inf)[has_order], axis=1)
+        return np.bincount(firsts, minlength=len(self.responses)), int(has_order.sum())
+
+    def findings(
+        self,
+        labels: Optional[dict[str, str]] = None,
+        thresholds: Optional[dict] = None
+    ) -> tuple[list[str], list[str], dict[str, list[str]]]:
+        """
+        Consensus items, disagreements and unique strengths from the scores.
+
+        A response (or criterion of one) is consensus when at least
+        `thresholds.consensus` of its reviewers score within `score_tolerance`
+        of the median, and contested below `high_agreement`. A response that
+        beats every other one on a criterion by more than the tolerance is a
+        unique strength, keyed by its label (e.g. the model behind it).
+        """
+        thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        labels = labels or {}
+        consensus: list[str] = []
+        disagreements: list[str] = []
+        unique: dict[str, list[str]] = {}
+        if self.empty:
+            return consensus, disagreements, unique
+
+        tolerance = thresholds["score_tolerance"]
+        agreement = self.agreement(tolerance)
+        means = self.mean_scores()
+        mean_totals = self.mean_totals()
+        reviewers = self.reviewer_counts()
+
+        def name(j: int) -> str:
+            response = self.responses[j]
+            label = labels.get(response)
+            return f"{response} ({label})" if label and label != response else response
+
+        # Best response: how many reviewers (of those comparing two or more) ranked it first
+        votes, voters = self.first_place_votes()
+        if voters:
+            best = int(votes.argmax())
+            share = votes[best] / voters
+            if share >= thresholds["high_agreement"]:
+                consensus.append(
+                    f"{name(best)} ranked best by {votes[best]}/{voters} reviewers"
+                )
+            else:
+                disagreements.append(
+                    "No agreed best response: "
+                    + ", ".join(f"{name(j)} {votes[j]}" for j in np.flatnonzero(votes))
+                )
+
+        # Whole-response agreement, then the criteria reviewers split on
+        for j in range(len(self.responses)):
+            cells = agreement[j]
+            if not np.isfinite(cells).any():
+                continue
+            overall = float(np.nanmin(cells))
+            mean_total = mean_totals[j]
+            if overall >= thresholds["consensus"] and np.isfinite(mean_total):
+                consensus.append(
+                    f"{name(j)}: all {reviewers[j]} reviewers agree on every criterion "
+                    f"(mean total {mean_total:.1f})"
+                )
+                continue
+            for k in np.flatnonzero(cells < thresholds["high_agreement"]):
+                column = self.scores[:, j, k]
+                column = column[np.isfinite(column)]
+                disagreements.append(
+                    f"{name(j)}: reviewers split on {self.criteria[k]} "
+                    f"(scores {column.min():g}-{column.max():g}, {cells[k]:.0%} agree)"
+                )
+
+        # Criteria where one response clearly leads all others
+        if len(self.responses) >= 2:
+            ranked = np.sort(np.where(np.isfinite(means), means, -np.inf), axis=0)
+            leaders = np.nanargmax(np.where(np.isfinite(means), means, -np.inf), axis=0)
+            with np.errstate(invalid="ignore"):  # Criteria nobody scored: -inf - -inf
+                margins = ranked[-1] - ranked[-2]
+            for k in np.flatnonzero(np.isfinite(margins) & (margins > tolerance)):
+                j = int(leaders[k])
+                key = labels.get(self.responses[j], self.responses[j])
+                unique.setdefault(key, []).append(
+                    f"Best on {self.criteria[k]} ({means[j, k]:.1f} vs {ranked[-2, k]:.1f})"
+                )
+
+        return consensus, disagreements, unique
+
+    def contradictions(
+        self,
+        relied_on: set[str],
+        floor: float,
+        labels: Optional[dict[str, str]] = None,
+        thresholds: Optional[dict] = None
+    ) -> list[str]:
+        """
+        Review outcomes that undercut an answer built on the `relied_on` responses.
+
+        Reviewers agree (`thresholds.high_agreement`) on a best response that
+        is not relied on, or a relied-on response has a mean score, overall
+        or on accuracy, below `floor`.
+        """
+        thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        labels = labels or {}
+        found: list[str] = []
+        if self.empty:
+            return found
+
+        def name(j: int) -> str:
+            response = self.responses[j]
+            label = labels.get(response)
+            return f"{response} ({label})" if label and label != response else response
+
+        votes, voters = self.first_place_votes()
+        if voters:
+            best = int(votes.argmax())
+            if votes[best] / voters >= thresholds["high_agreement"] and self.responses[best] not in relied_on:
+                found.append(f"{name(best)} ranked best by {votes[best]}/{voters} reviewers but was not used")
+
+        means = self.mean_scores()
+        accuracy = self.criteria.index("accuracy") if "accuracy" in self.criteria else None
+        for j, response in enumerate(self.responses):
+            if response not in relied_on or not np.isfinite(means[j]).any():
+                continue
+            average = float(np.nanmean(means[j]))
+            if average < floor:
+                found.append(f"{name(j)} was used but scored {average:.1f} on average")
+            elif accuracy is not None and means[j, accuracy] < floor:
+                found.append(f"{name(j)} was used but scored {means[j, accuracy]:.1f} on accuracy")
+        return found
+
+    def stats(self) -> dict:
+        """JSON-serializable summary: per-response mean/variance and rank agreement."""
+        def value(x) -> Optional[float]:
+            return round(float(x), 3) if np.isfinite(x) else None
+
+        mean_totals = self.mean_totals()
+        variance = self.total_variance()
+        means = self.mean_scores()
+        tau = self.rank_agreement()
+        return {
+            "mean_total": {r: value(mean_totals[j]) for j, r in enumerate(self.responses)},
+            "total_variance": {r: value(variance[j]) for j, r in enumerate(self.responses)},
+            "mean_by_criterion": {
+                r: {c: value(means[j, k]) for k, c in enumerate(self.criteria)}
+                for j, r in enumerate(self.responses)
+            },
+            "rank_agreement": round(tau, 3) if tau is not None else None,
+        }
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Council Run Store
+
+Append-only SQLite log of council runs. Each row holds a run's question and
+its full result (result_to_dict), stored as compressed JSON: zstd when
+available (Python 3.14's compression.zstd, or `zstandard` from the
+optional `zstd` extra), otherwise zlib, which needs nothing extra. The
+codec is recorded per row, so stores written on one machine read anywhere
+zstd is installed.
+
+Stored runs are what `council_ask.py --replay <run-id>` re-runs Stages 2-3
+(or only the formatting) from, without paying for Stage 1 again.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import sqlite3
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_STORE_PATH = (
+    Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "llm-council" / "runs.sqlite3"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    question TEXT NOT NULL,
+    chairman TEXT,
+    replay_of TEXT,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL
+)
+"""
+
+
+def _zstd():
+    """The zstd module in use (stdlib on 3.14+, else `zstandard`), or None."""
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def compress(data: bytes) -> tuple[str, bytes]:
+    """Compress with zstd when available, else zlib; returns (codec, payload)."""
+    zstd = _zstd()
+    if zstd is not None:
+        return "zstd", zstd.compress(data, 9)
+    return "zlib", zlib.compress(data, 9)
+
+
+def decompress(codec: str, payload: bytes) -> bytes:
+    """Inverse of compress for the row's codec."""
+    if codec == "zlib":
+        return zlib.decompress(payload)
+    if codec == "zstd":
+        zstd = _zstd()
+        if zstd is None:
+            raise ValueError("Run was stored with zstd; install the `zstd` extra (`uv sync --extra zstd`) to read it")
+        return zstd.decompress(payload)
+    raise ValueError(f"Unknown run store codec: {codec}")
+
+
+def new_run_id() -> str:
+    """Sortable, collision-resistant run id: UTC timestamp plus random suffix."""
+    return time.strftime("%Y%m%d-%H%M%S", time.gmtime()) + "-" + secrets.token_hex(3)
+
+
+class RunStore:
+    """Append-only store of council runs in a SQLite file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_STORE_PATH
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def save(
+        self,
+        record: dict,
+        replay_of: Optional[str] = None,
+        run_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Append one run and return its id (None if it could not be written).
+
+        `record` holds "question", "system_prompt" and "result" (a
+        result_to_dict); `replay_of` links a replay to the run it came from.
+        """
+        run_id = run_id or new_run_id()
+        codec, body = compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT INTO runs (run_id, created_at, question, chairman, replay_of, codec, body)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            run_id, time.time(), record.get("question", ""),
+                            record.get("result", {}).get("chairman_model"), replay_of, codec, body,
+                        )
+                    )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            return None  # The run already has its answer; it just won't be replayable
+        return run_id
+
+    def load(self, run_id: str) -> dict:
+        """
+        The stored record for `run_id` (a unique prefix is enough).
+
+        Raises ValueError when no run, or more than one, matches.
+        """
+        if not self.path.exists():
+            raise ValueError(f"No council runs stored in {self.path}")
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT run_id, codec, body FROM runs WHERE substr(run_id, 1, ?) = ? LIMIT 2",
+                (len(run_id), run_id)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        if not rows:
+            raise ValueError(f"Unknown council run: {run_id}")
+        if len(rows) > 1:
+            raise ValueError(f"Ambiguous council run id {run_id!r}; give more characters")
+
+        stored_id, codec, body = rows[0]
+        record = json.loads(decompress(codec, body))
+        record["run_id"] = stored_id
+        return record
+
+    def recent(self, limit: int = 20) -> list[dict]:
+        """Newest runs first, without their bodies."""
+        if not self.path.exists():
+            return []
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT run_id, created_at, question, chairman, replay_of FROM runs"
+                " ORDER BY created_at DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+        keys = ("run_id", "created_at", "question", "chairman", "replay_of")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List stored council runs")
+    parser.add_argument("--limit", type=int, default=20, help="How many recent runs to show")
+    parser.add_argument("--path", type=str, help=f"Store file (default: {DEFAULT_STORE_PATH})")
+    args = parser.parse_args()
+
+    store = RunStore(Path(args.path).expanduser() if args.path else None)
+    runs = store.recent(args.limit)
+    if not runs:
+        print(f"No council runs stored in {store.path}")
+        sys.exit(0)
+    for run in runs:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["created_at"]))
+        question = run["question"].replace("\n", " ")
+        if len(question) > 60:
+            question = question[:57] + "..."
+        replay = f" (replay of {run['replay_of']})" if run["replay_of"] else ""
+        print(f"{run['run_id']}  {when}  {question}{replay}")
+
+
+if __name__ == "__main__":
+    main()
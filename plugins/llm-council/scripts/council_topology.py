@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Council Review Topologies
+
+Decides which anonymized responses each model reviews in Stage 2. Full review
+costs n calls of n-1 responses each, so prompt volume grows with n²; the
+subsampled topologies give every reviewer k responses instead:
+
+- full:     every model reviews every other response
+- ring:     responses in their (shuffled) presentation order; each model
+            reviews the k responses after its own, so every response gets
+            exactly k reviews
+- random_k: k responses per model drawn at random, always preferring the
+            responses with the fewest reviewers so far (balanced coverage)
+"""
+
+import random
+from typing import Optional
+
+TOPOLOGIES = ("full", "ring", "random_k")
+
+
+def assign_reviews(
+    reviewers: list[str],
+    authors: dict[str, str],
+    topology: str = "full",
+    k: int = 2,
+    rng: Optional[random.Random] = None
+) -> dict[str, list[str]]:
+    """
+    Map each reviewer model to the anonymous ids it reviews.
+
+    `authors` is {anonymous_id: model_name} in presentation order. Nobody
+    reviews their own response; reviewers without a response of their own
+    (failed in Stage 1) still review. Ids keep presentation order.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown peer review topology: {topology} (expected one of {', '.join(TOPOLOGIES)})")
+    if k < 1:
+        raise ValueError(f"Peer review k must be at least 1, got {k}")
+
+    ids = list(authors)
+    position = {anon_id: i for i, anon_id in enumerate(ids)}
+    own = {model: i for i, (anon_id, model) in enumerate(authors.items())}
+
+    def others(reviewer: str) -> list[str]:
+        return [anon_id for anon_id in ids if authors[anon_id] != reviewer]
+
+    if topology == "full" or k >= len(ids) - 1:
+        return {reviewer: others(reviewer) for reviewer in reviewers}
+
+    assignments: dict[str, list[str]] = {}
+    if topology == "ring":
+        for index, reviewer in enumerate(reviewers):
+            start = own.get(reviewer, index - 1)
+            ring = [ids[(start + step) % len(ids)] for step in range(1, len(ids) + 1)]
+            chosen = [anon_id for anon_id in ring if authors[anon_id] != reviewer][:k]
+            assignments[reviewer] = sorted(chosen, key=position.__getitem__)
+        return assignments
+
+    rng = rng or random.Random()
+    coverage = {anon_id: 0 for anon_id in ids}
+    for reviewer in rng.sample(reviewers, len(reviewers)):
+        candidates = others(reviewer)
+        rng.shuffle(candidates)
+        candidates.sort(key=coverage.__getitem__)  # Stable: random among equally covered
+        chosen = candidates[:k]
+        for anon_id in chosen:
+            coverage[anon_id] += 1
+        assignments[reviewer] = sorted(chosen, key=position.__getitem__)
+    return {reviewer: assignments[reviewer] for reviewer in reviewers}
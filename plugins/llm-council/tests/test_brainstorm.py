@@ -0,0 +1,72 @@
+"""
+Pipelined brainstorm rounds against a scripted engine (no providers).
+
+    uv run python -m unittest discover -s tests
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from council_brainstorm import BrainstormEngine
+from council_engine import ModelResponse
+
+
+class ScriptedEngine:
+    """Stands in for CouncilEngine: per (model, stage) delays and failures."""
+
+    def __init__(self, names: list[str], delays: dict, failures: set):
+        self.models = [{"name": name} for name in names]
+        self.delays = delays  # (model, stage) -> seconds
+        self.failures = failures  # {(model, stage)}
+        self.calls: list[tuple[str, str]] = []
+
+    async def call_model(self, model, prompt, system_prompt=None, stage="call", schema=None):
+        key = (model["name"], stage)
+        self.calls.append(key)
+        await asyncio.sleep(self.delays.get(key, 0.01))
+        if key in self.failures:
+            return ModelResponse(model_name=model["name"], response="", latency_ms=0, error="provider down")
+        return ModelResponse(
+            model_name=model["name"],
+            response=f"1. **{model['name']} {stage}**: An idea\n2. **Another**: A second idea",
+            latency_ms=0
+        )
+
+
+class PipelinedRoundsTest(unittest.TestCase):
+    def run_rounds(self, engine: ScriptedEngine, rounds: int, min_peers: int):
+        brainstorm = BrainstormEngine(engine=engine)
+        style = BrainstormEngine.STYLES["balanced"]
+        return asyncio.run(asyncio.wait_for(
+            brainstorm._run_pipelined_rounds("Topic", engine.models, rounds, style, min_peers), timeout=5
+        ))
+
+    def test_failing_peer_and_skipping_peer_do_not_deadlock(self):
+        # Y is slow in round 1 and skips round 2; X fails round 2; Z must still go on
+        engine = ScriptedEngine(
+            ["X", "Y", "Z"],
+            delays={("Y", "round_1"): 0.3, ("X", "round_2"): 0.1},
+            failures={("X", "round_2")},
+        )
+        first, cross = self.run_rounds(engine, rounds=3, min_peers=1)
+
+        self.assertNotIn(("Y", "round_2"), engine.calls)
+        self.assertEqual(set(first), {"X", "Y", "Z"})
+        self.assertEqual(set(cross[0]), {"Z"})
+        self.assertIn("Z", cross[1])
+
+    def test_lockstep_when_all_answer(self):
+        engine = ScriptedEngine(["X", "Y", "Z"], delays={}, failures=set())
+        first, cross = self.run_rounds(engine, rounds=2, min_peers=2)
+
+        self.assertEqual(len(engine.calls), 6)
+        self.assertEqual(list(first), ["X", "Y", "Z"])
+        self.assertEqual(list(cross[0]), ["X", "Y", "Z"])
+
+
+if __name__ == "__main__":
+    unittest.main()
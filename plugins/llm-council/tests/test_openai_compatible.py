@@ -0,0 +1,92 @@
+"""
+Keyless openai_compatible models and per-endpoint max_concurrency, against
+the mock provider (benchmarks/mock_provider.py).
+
+    uv run python -m unittest discover -s tests
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import council_engine
+from council_engine import CouncilEngine
+from mock_provider import MockProviderServer, endpoint
+
+LATENCY_MS = 150
+
+
+class OpenAICompatibleTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockProviderServer(
+            {"default": {"latency": {"distribution": "fixed", "ms": LATENCY_MS}}}
+        ).start()
+        self.addCleanup(self.server.stop)
+        self.tmp = tempfile.TemporaryDirectory(prefix="council-test-")
+        self.addCleanup(self.tmp.cleanup)
+
+        clis = dict(council_engine.PROVIDER_CLIS)
+        council_engine.PROVIDER_CLIS.clear()  # HTTP only, whatever is installed here
+        self.addCleanup(council_engine.PROVIDER_CLIS.update, clis)
+
+    def write_config(self, max_concurrency):
+        config_dir = Path(self.tmp.name)
+        url = endpoint(self.server.url, "openai_compatible", "local-model")
+        models = [
+            {
+                "name": f"local-{i}",
+                "provider": "openai_compatible",
+                "model": "local-model",
+                "endpoint": url,
+                "api_key_env": None,
+                "max_concurrency": max_concurrency,
+                "enabled": True,
+            }
+            for i in range(3)
+        ]
+        council = {
+            "cache": {"enabled": False},
+            "store": {"enabled": False},
+            "health": {"persist": False},
+        }
+        settings = {"http": {"http2": False}}
+        (config_dir / "models.json").write_text(json.dumps({"models": models, "settings": settings}))
+        (config_dir / "council.json").write_text(json.dumps(council))
+        return config_dir
+
+    async def run_stage_1(self, config_dir):
+        engine = CouncilEngine(config_dir=config_dir, use_cache=False)
+        try:
+            start = time.perf_counter()
+            responses = await engine.run_stage_1("What is a cache?")
+            return responses, (time.perf_counter() - start) * 1000
+        finally:
+            await engine.aclose()
+
+    def test_keyless_models_share_the_endpoint_limit(self):
+        responses, wall_ms = asyncio.run(self.run_stage_1(self.write_config(max_concurrency=1)))
+        stats = self.server.snapshot()
+
+        self.assertEqual([r.error for r in responses], [None, None, None])
+        self.assertEqual(stats["authorized"], {})
+        self.assertEqual(stats["max_in_flight"]["openai_compatible"], 1)
+        self.assertGreaterEqual(wall_ms, 3 * LATENCY_MS)
+        self.assertGreater(sum(r.metrics.queue_wait_ms for r in responses), 0)
+
+    def test_without_limit_calls_overlap(self):
+        responses, _ = asyncio.run(self.run_stage_1(self.write_config(max_concurrency=None)))
+
+        self.assertEqual([r.error for r in responses], [None, None, None])
+        self.assertEqual(self.server.snapshot()["max_in_flight"]["openai_compatible"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Stage 1 quorum: a cut-off straggler stays out of peer review, against the
+mock provider (benchmarks/mock_provider.py).
+
+    uv run python -m unittest discover -s tests
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import council_engine
+from council_engine import CouncilEngine
+from mock_provider import MockProviderServer, endpoint
+
+SLOW_MS = 2000
+
+
+class QuorumCutoffTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockProviderServer({
+            "default": {"latency": {"distribution": "fixed", "ms": 50}},
+            "deepseek": {"latency": {"distribution": "fixed", "ms": SLOW_MS}},
+        }).start()
+        self.addCleanup(self.server.stop)
+        self.tmp = tempfile.TemporaryDirectory(prefix="council-test-")
+        self.addCleanup(self.tmp.cleanup)
+
+        clis = dict(council_engine.PROVIDER_CLIS)
+        council_engine.PROVIDER_CLIS.clear()  # HTTP only, whatever is installed here
+        self.addCleanup(council_engine.PROVIDER_CLIS.update, clis)
+        env = mock.patch.dict(os.environ, {"COUNCIL_TEST_KEY": "test"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def write_config(self):
+        config_dir = Path(self.tmp.name)
+        local = endpoint(self.server.url, "openai_compatible", "local-model")
+        models = [
+            {
+                "name": f"local-{i}",
+                "provider": "openai_compatible",
+                "model": "local-model",
+                "endpoint": local,
+                "api_key_env": None,
+                "enabled": True,
+            }
+            for i in range(3)
+        ]
+        models.append({
+            "name": "slow",
+            "provider": "deepseek",
+            "model": "deepseek-chat",
+            "endpoint": endpoint(self.server.url, "deepseek"),
+            "api_key_env": "COUNCIL_TEST_KEY",
+            "enabled": True,
+        })
+        council = {
+            "quorum": {"min_responses": 3, "straggler_grace_seconds": 0},
+            "cache": {"enabled": False},
+            "store": {"enabled": False},
+            "health": {"persist": False},
+        }
+        settings = {"http": {"http2": False}}
+        (config_dir / "models.json").write_text(json.dumps({"models": models, "settings": settings}))
+        (config_dir / "council.json").write_text(json.dumps(council))
+        return config_dir
+
+    async def execute(self, config_dir):
+        engine = CouncilEngine(config_dir=config_dir, use_cache=False)
+        try:
+            return await engine.execute("What is a cache?", chairman="local-0")
+        finally:
+            await engine.aclose()
+
+    def test_cut_off_model_does_not_review(self):
+        result = asyncio.run(self.execute(self.write_config()))
+
+        self.assertEqual(result.cutoff_models, ["slow"])
+        self.assertNotIn("slow", result.review_assignments)
+        self.assertNotIn(("slow", "stage_2"), {(m.model_name, m.stage) for m in result.call_metrics})
+        self.assertLess(result.total_latency_ms, SLOW_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+When a speculative Stage 3 draft is kept or corrected (no providers).
+
+    uv run python -m unittest discover -s tests
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from council_engine import CouncilEngine, ModelResponse, _split_draft_basis
+from council_scoring import ScoreMatrix
+
+RESPONSES = ["Response A", "Response B", "Response C"]
+MAPPING = {"Response A": "gpt", "Response B": "gemini", "Response C": "claude"}
+
+
+def matrix(totals: list[list[float]]) -> ScoreMatrix:
+    """Three reviewers, one criterion ("accuracy") per response; ranks follow the scores."""
+    scores = np.array(totals, dtype=float)[:, :, None]
+    return ScoreMatrix(["r1", "r2", "r3"], RESPONSES, ["accuracy"], scores)
+
+
+class DraftBasisTest(unittest.TestCase):
+    def test_relied_on_line_is_stripped(self):
+        draft, basis = _split_draft_basis("The answer.\n\n**Relied on:** gpt, claude", list(MAPPING.values()))
+        self.assertEqual(draft, "The answer.")
+        self.assertEqual(basis, {"gpt", "claude"})
+
+    def test_missing_line_keeps_draft(self):
+        self.assertEqual(_split_draft_basis("The answer.", ["gpt"]), ("The answer.", None))
+
+
+class ContradictionsTest(unittest.TestCase):
+    def test_disagreement_on_unused_responses_keeps_draft(self):
+        # Reviewers split on B vs C, but the draft used A, which they all rate well
+        scores = matrix([[8, 9, 2], [8, 2, 9], [9, 5, 5]])
+        self.assertEqual(scores.contradictions({"Response A"}, floor=5, labels=MAPPING), [])
+
+    def test_agreed_best_left_out(self):
+        scores = matrix([[6, 9, 5], [6, 9, 5], [7, 8, 5]])
+        found = scores.contradictions({"Response A"}, floor=5, labels=MAPPING)
+        self.assertEqual(len(found), 1)
+        self.assertIn("Response B (gemini)", found[0])
+
+    def test_weak_response_used(self):
+        scores = matrix([[3, 9, 5], [4, 8, 6], [2, 9, 6]])
+        found = scores.contradictions({"Response A", "Response B"}, floor=5, labels=MAPPING)
+        self.assertEqual(len(found), 1)
+        self.assertIn("Response A (gpt)", found[0])
+
+
+class DraftTimingTest(unittest.TestCase):
+    def test_draft_is_emitted_before_reviews_finish(self):
+        engine = CouncilEngine(use_cache=False)
+        emitted: list[str] = []
+        seen_by_reviews: list[list[str]] = []
+
+        async def draft(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return "The answer.\nRelied on: gpt"
+
+        async def reviews():
+            await asyncio.sleep(0.2)
+            seen_by_reviews.append(list(emitted))
+            return [], {}, {}
+
+        async def run():
+            try:
+                return await engine.run_speculative_stage_3(
+                    "Question?", [ModelResponse(model_name="gpt", response="An answer", latency_ms=0)],
+                    reviews(), {"name": "gpt"}, on_chunk=emitted.append
+                )
+            finally:
+                await engine.aclose()
+
+        engine.run_stage_3 = draft
+        synthesis, mode, _, _ = asyncio.run(run())
+
+        self.assertEqual(seen_by_reviews, [["The answer."]])
+        self.assertEqual((synthesis, mode), ("The answer.", "speculative"))
+
+
+if __name__ == "__main__":
+    unittest.main()